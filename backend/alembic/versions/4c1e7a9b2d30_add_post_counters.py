@@ -0,0 +1,53 @@
+"""add_post_counters
+
+Revision ID: 4c1e7a9b2d30
+Revises: db918c2c6f88
+Create Date: 2026-10-18 09:12:41.503218
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4c1e7a9b2d30"
+down_revision: str | Sequence[str] | None = "db918c2c6f88"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "posts", sa.Column("like_count", sa.Integer(), server_default="0", nullable=False)
+    )
+    op.add_column(
+        "posts", sa.Column("comment_count", sa.Integer(), server_default="0", nullable=False)
+    )
+    op.create_table(
+        "post_counter_deltas",
+        sa.Column("post_id", sa.String(), nullable=False),
+        sa.Column("shard", sa.Integer(), nullable=False),
+        sa.Column("like_delta", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("comment_delta", sa.Integer(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["post_id"], ["posts.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("post_id", "shard"),
+    )
+    # Backfill from the source tables
+    op.execute(
+        """
+        UPDATE posts SET
+            like_count = (SELECT count(*) FROM post_likes WHERE post_likes.post_id = posts.id),
+            comment_count = (SELECT count(*) FROM comments WHERE comments.post_id = posts.id)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("post_counter_deltas")
+    op.drop_column("posts", "comment_count")
+    op.drop_column("posts", "like_count")
@@ -0,0 +1,40 @@
+"""keyset_pagination_indexes
+
+Revision ID: 8f3b2e61c5a4
+Revises: 4c1e7a9b2d30
+Create Date: 2026-10-18 10:02:17.884120
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8f3b2e61c5a4"
+down_revision: str | Sequence[str] | None = "4c1e7a9b2d30"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_posts_created_at_id", "posts", ["created_at", "id"], unique=False)
+    op.create_index(
+        "ix_posts_author_id_created_at_id", "posts", ["author_id", "created_at", "id"], unique=False
+    )
+    op.create_index("ix_post_tags_tag_id_post_id", "post_tags", ["tag_id", "post_id"], unique=False)
+    # Superseded by the composite indexes above (same leading column)
+    op.drop_index("ix_posts_created_at", table_name="posts")
+    op.drop_index("ix_posts_author_id", table_name="posts")
+    op.drop_index("ix_post_tags_tag_id", table_name="post_tags")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_post_tags_tag_id", "post_tags", ["tag_id"], unique=False)
+    op.create_index("ix_posts_author_id", "posts", ["author_id"], unique=False)
+    op.create_index("ix_posts_created_at", "posts", ["created_at"], unique=False)
+    op.drop_index("ix_post_tags_tag_id_post_id", table_name="post_tags")
+    op.drop_index("ix_posts_author_id_created_at_id", table_name="posts")
+    op.drop_index("ix_posts_created_at_id", table_name="posts")
@@ -0,0 +1,44 @@
+"""add_collection_versions
+
+Revision ID: a41f5c9e7d26
+Revises: e2a6c8d1f4b7
+Create Date: 2026-10-18 14:21:07.385512
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a41f5c9e7d26"
+down_revision: str | Sequence[str] | None = "e2a6c8d1f4b7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    collection_versions = op.create_table(
+        "collection_versions",
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("version", sa.BigInteger(), server_default="1", nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.bulk_insert(
+        collection_versions,
+        [{"name": "posts"}, {"name": "projects"}, {"name": "tags"}],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("collection_versions")
@@ -0,0 +1,31 @@
+"""add_user_token_version
+
+Revision ID: a8e4d2c6f1b3
+Revises: f3a9c7e1b5d2
+Create Date: 2026-10-18 18:12:47.581930
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a8e4d2c6f1b3"
+down_revision: str | Sequence[str] | None = "f3a9c7e1b5d2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "users", sa.Column("token_version", sa.Integer(), server_default="0", nullable=False)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("users", "token_version")
@@ -0,0 +1,38 @@
+"""add_refresh_token_families
+
+Revision ID: b2f6e9a4c7d1
+Revises: a8e4d2c6f1b3
+Create Date: 2026-10-18 19:03:12.440381
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b2f6e9a4c7d1"
+down_revision: str | Sequence[str] | None = "a8e4d2c6f1b3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("refresh_tokens", sa.Column("family_id", sa.String(), nullable=True))
+    op.add_column(
+        "refresh_tokens", sa.Column("rotated_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    # Existing tokens each start their own family
+    op.execute("UPDATE refresh_tokens SET family_id = id")
+    op.alter_column("refresh_tokens", "family_id", nullable=False)
+    op.create_index("ix_refresh_tokens_family_id", "refresh_tokens", ["family_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_refresh_tokens_family_id", table_name="refresh_tokens")
+    op.drop_column("refresh_tokens", "rotated_at")
+    op.drop_column("refresh_tokens", "family_id")
@@ -0,0 +1,135 @@
+"""move_image_data_to_image_store
+
+Revision ID: b7d94f0e3a12
+Revises: 8f3b2e61c5a4
+Create Date: 2026-10-18 11:40:03.127554
+
+Decodes every base64 ``image_data`` value once, writes the bytes to the
+content-addressed image store (IMAGE_STORE_DIR) and keeps only the SHA-256
+reference in the row. A value that is not valid base64 aborts the upgrade
+(fix or clear it first); bytes in a format the store does not recognise are
+kept as application/octet-stream, so no image is lost with the column.
+"""
+
+import base64
+import binascii
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.core.config import get_settings
+from app.services.image_store import LocalImageStore, sniff_content_type
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d94f0e3a12"
+down_revision: str | Sequence[str] | None = "8f3b2e61c5a4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _store() -> LocalImageStore:
+    return LocalImageStore(get_settings().IMAGE_STORE_DIR)
+
+
+def _move_out(table: str, store: LocalImageStore) -> None:
+    conn = op.get_bind()
+    ids = (
+        conn.execute(sa.text(f"SELECT id FROM {table} WHERE image_data IS NOT NULL"))
+        .scalars()
+        .all()
+    )
+    for row_id in ids:
+        data = conn.execute(
+            sa.text(f"SELECT image_data FROM {table} WHERE id = :id"), {"id": row_id}
+        ).scalar_one()
+        if data.startswith("data:"):
+            data = data.partition(",")[2]
+        try:
+            raw = base64.b64decode(data, validate=True)
+        except (binascii.Error, ValueError):
+            raise RuntimeError(
+                f"{table}.{row_id}: image_data is not valid base64; fix or clear it "
+                "before upgrading, the image_data column is dropped by this migration"
+            ) from None
+        content_type = sniff_content_type(raw[:16]) or "application/octet-stream"
+        image_hash = store.put_sync(raw)
+        conn.execute(
+            sa.text(
+                "INSERT INTO images (hash, content_type, byte_size) "
+                "VALUES (:hash, :content_type, :byte_size) ON CONFLICT (hash) DO NOTHING"
+            ),
+            {"hash": image_hash, "content_type": content_type, "byte_size": len(raw)},
+        )
+        conn.execute(
+            sa.text(f"UPDATE {table} SET image_ref = :hash WHERE id = :id"),
+            {"hash": image_hash, "id": row_id},
+        )
+
+
+def _move_back(table: str, store: LocalImageStore) -> None:
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.text(f"SELECT id, image_ref FROM {table} WHERE image_ref IS NOT NULL")
+    ).all()
+    for row_id, image_hash in rows:
+        path = store.local_path(image_hash)
+        if path is None:
+            continue
+        conn.execute(
+            sa.text(f"UPDATE {table} SET image_data = :data WHERE id = :id"),
+            {"data": base64.b64encode(path.read_bytes()).decode(), "id": row_id},
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "images",
+        sa.Column("hash", sa.String(length=64), nullable=False),
+        sa.Column("content_type", sa.String(), nullable=False),
+        sa.Column("byte_size", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("hash"),
+    )
+    op.add_column("posts", sa.Column("image_ref", sa.String(length=64), nullable=True))
+    op.add_column("projects", sa.Column("image_ref", sa.String(length=64), nullable=True))
+    op.create_foreign_key(
+        "posts_image_ref_fkey", "posts", "images", ["image_ref"], ["hash"], ondelete="SET NULL"
+    )
+    op.create_foreign_key(
+        "projects_image_ref_fkey",
+        "projects",
+        "images",
+        ["image_ref"],
+        ["hash"],
+        ondelete="SET NULL",
+    )
+
+    store = _store()
+    _move_out("posts", store)
+    _move_out("projects", store)
+
+    op.drop_column("projects", "image_data")
+    op.drop_column("posts", "image_data")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column("posts", sa.Column("image_data", sa.Text(), nullable=True))
+    op.add_column("projects", sa.Column("image_data", sa.Text(), nullable=True))
+
+    store = _store()
+    _move_back("posts", store)
+    _move_back("projects", store)
+
+    op.drop_constraint("projects_image_ref_fkey", "projects", type_="foreignkey")
+    op.drop_constraint("posts_image_ref_fkey", "posts", type_="foreignkey")
+    op.drop_column("projects", "image_ref")
+    op.drop_column("posts", "image_ref")
+    op.drop_table("images")
@@ -0,0 +1,39 @@
+"""add_job_runs
+
+Revision ID: c4d7a1e9f2b6
+Revises: b2f6e9a4c7d1
+Create Date: 2026-10-18 20:12:45.918274
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d7a1e9f2b6"
+down_revision: str | Sequence[str] | None = "b2f6e9a4c7d1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "job_runs",
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column(
+            "last_run_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("job_runs")
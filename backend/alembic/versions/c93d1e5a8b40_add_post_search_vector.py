@@ -0,0 +1,65 @@
+"""add_post_search_vector
+
+Revision ID: c93d1e5a8b40
+Revises: a41f5c9e7d26
+Create Date: 2026-10-18 14:58:32.117046
+
+posts.search_vector is kept current by a BEFORE INSERT OR UPDATE OF
+title, body trigger; existing rows are backfilled here.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+from app.db.models import SEARCH_CONFIG
+
+# revision identifiers, used by Alembic.
+revision: str = "c93d1e5a8b40"
+down_revision: str | Sequence[str] | None = "a41f5c9e7d26"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("posts", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True))
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION posts_search_vector_refresh() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.title, '')), 'A') ||
+                setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.body, '')), 'B');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER posts_search_vector_refresh
+            BEFORE INSERT OR UPDATE OF title, body ON posts
+            FOR EACH ROW EXECUTE FUNCTION posts_search_vector_refresh()
+        """
+    )
+    op.execute(
+        f"""
+        UPDATE posts SET search_vector =
+            setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(body, '')), 'B')
+        """
+    )
+    op.create_index(
+        "ix_posts_search_vector", "posts", ["search_vector"], unique=False, postgresql_using="gin"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_posts_search_vector", table_name="posts", postgresql_using="gin")
+    op.execute("DROP TRIGGER posts_search_vector_refresh ON posts")
+    op.execute("DROP FUNCTION posts_search_vector_refresh()")
+    op.drop_column("posts", "search_vector")
@@ -0,0 +1,40 @@
+"""add_tag_post_count
+
+Revision ID: d5b8e2f7a913
+Revises: c93d1e5a8b40
+Create Date: 2026-10-18 15:42:10.904318
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d5b8e2f7a913"
+down_revision: str | Sequence[str] | None = "c93d1e5a8b40"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("tags", sa.Column("post_count", sa.Integer(), server_default="0", nullable=False))
+    op.execute(
+        """
+        UPDATE tags SET post_count = c.n
+        FROM (SELECT tag_id, count(*) AS n FROM post_tags GROUP BY tag_id) AS c
+        WHERE tags.id = c.tag_id
+        """
+    )
+    op.create_index(
+        "ix_tags_post_count_name", "tags", [sa.text("post_count DESC"), "name"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_tags_post_count_name", table_name="tags")
+    op.drop_column("tags", "post_count")
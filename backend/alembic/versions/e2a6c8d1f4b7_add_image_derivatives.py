@@ -0,0 +1,45 @@
+"""add_image_derivatives
+
+Revision ID: e2a6c8d1f4b7
+Revises: b7d94f0e3a12
+Create Date: 2026-10-18 13:05:49.611370
+
+Existing images get their derivatives from scripts/generate_derivatives.py.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a6c8d1f4b7"
+down_revision: str | Sequence[str] | None = "b7d94f0e3a12"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("images", sa.Column("width", sa.Integer(), nullable=True))
+    op.add_column("images", sa.Column("height", sa.Integer(), nullable=True))
+    op.add_column("images", sa.Column("placeholder", sa.String(), nullable=True))
+    op.create_table(
+        "image_variants",
+        sa.Column("source_hash", sa.String(length=64), nullable=False),
+        sa.Column("width", sa.Integer(), nullable=False),
+        sa.Column("format", sa.String(), nullable=False),
+        sa.Column("hash", sa.String(length=64), nullable=False),
+        sa.Column("byte_size", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["source_hash"], ["images.hash"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("source_hash", "width", "format"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("image_variants")
+    op.drop_column("images", "placeholder")
+    op.drop_column("images", "height")
+    op.drop_column("images", "width")
@@ -0,0 +1,32 @@
+"""add_comment_thread_index
+
+Revision ID: f3a9c7e1b5d2
+Revises: d5b8e2f7a913
+Create Date: 2026-10-18 17:05:31.227104
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a9c7e1b5d2"
+down_revision: str | Sequence[str] | None = "d5b8e2f7a913"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_comments_thread", "comments", ["post_id", "parent_id", "created_at", "id"], unique=False
+    )
+    # Leading column of ix_comments_thread — now redundant
+    op.drop_index("ix_comments_post_id", table_name="comments")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_comments_post_id", "comments", ["post_id"], unique=False)
+    op.drop_index("ix_comments_thread", table_name="comments")
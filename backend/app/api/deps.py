@@ -1,30 +1,69 @@
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.core.security import decode_access_token
-from app.db.engine import get_session_factory
-from app.db.models import User
+from app.db.unit_of_work import unit_of_work
+from app.repositories.post_repository import PostRepository
 from app.repositories.user_repository import UserRepository
+from app.services.principal_cache import Principal, get_principal_cache
+from app.services.viewer_context import ViewerContext
 
 _bearer = HTTPBearer(auto_error=True)
 _optional_bearer = HTTPBearer(auto_error=False)
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Yield a fresh AsyncSession per request, auto-closed on completion."""
-    async with get_session_factory()() as session:
+# Methods whose handlers never write: their unit of work skips the commit
+_READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Yield the request's unit of work: one session, one commit.
+
+    Repositories only flush; the request's writes are committed together
+    once the handler returns, or all rolled back if it raises.
+    """
+    async with unit_of_work(read_only=request.method in _READ_ONLY_METHODS) as session:
         yield session
 
 
+async def _resolve_principal(payload: dict[str, Any], session: AsyncSession) -> Principal | None:
+    """Map a decoded access token to its active Principal, or None.
+
+    Served from the principal cache when possible, so an authenticated
+    request normally costs no query. A token newer than the cached entry
+    (its ``ver`` claim is ahead) means the entry is stale and is reloaded.
+    """
+    user_id = payload["sub"]
+    token_version = int(payload.get("ver", 0))
+    check_version = get_settings().ACCESS_TOKEN_VERSION_CHECK
+    cache = get_principal_cache()
+
+    principal = cache.get(user_id)
+    if principal is None or (check_version and token_version > principal.tokenVersion):
+        user = await UserRepository(session).get_by_id(user_id)
+        if user is None:
+            return None
+        principal = Principal.from_user(user)
+        cache.set(user_id, principal)
+
+    if not principal.isActive:
+        return None
+    if check_version and token_version < principal.tokenVersion:
+        return None  # issued before a "log out everywhere"
+    return principal
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(_bearer),
     session: AsyncSession = Depends(get_db),
-) -> User:
-    """Require a valid JWT Bearer token and return the authenticated User.
+) -> Principal:
+    """Require a valid JWT Bearer token and return the authenticated Principal.
 
     Raises HTTP 401 on missing, invalid, or expired token.
     """
@@ -36,20 +75,18 @@ async def get_current_user(
             detail={"code": "INVALID_TOKEN", "message": "Invalid or expired access token."},
         )
 
-    user_repo = UserRepository(session)
-    user = await user_repo.get_by_id(payload["sub"])
-
-    if not user or not user.isActive:
+    principal = await _resolve_principal(payload, session)
+    if principal is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={"code": "INVALID_TOKEN", "message": "User not found or inactive."},
         )
-    return user
+    return principal
 
 
 async def get_current_admin(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     """Require that the authenticated user is an admin.
 
     Raises HTTP 403 if the user is authenticated but not admin.
@@ -63,8 +100,8 @@ async def get_current_admin(
 async def get_optional_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(_optional_bearer),
     session: AsyncSession = Depends(get_db),
-) -> User | None:
-    """Return the authenticated User if a valid token is present, otherwise None.
+) -> Principal | None:
+    """Return the authenticated Principal if a valid token is present, otherwise None.
 
     Used for public endpoints that show extra information when the user is logged in.
     """
@@ -75,6 +112,19 @@ async def get_optional_user(
     except JWTError:
         return None
 
-    user_repo = UserRepository(session)
-    user = await user_repo.get_by_id(payload["sub"])
-    return user if user and user.isActive else None
+    return await _resolve_principal(payload, session)
+
+
+async def get_viewer(
+    current_user: Principal | None = Depends(get_optional_user),
+    session: AsyncSession = Depends(get_db),
+) -> ViewerContext:
+    """Return the request-scoped ViewerContext for the (optional) current user.
+
+    FastAPI caches dependencies per request, so every consumer in the same
+    request shares one context and its batched lookups.
+    """
+    return ViewerContext(
+        PostRepository(session),
+        current_user.id if current_user else None,
+    )
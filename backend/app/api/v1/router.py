@@ -3,8 +3,11 @@ from fastapi import APIRouter
 from app.api.v1.routes.auth import router as auth_router
 from app.api.v1.routes.comments import router as comments_router
 from app.api.v1.routes.image_ai import router as image_ai_router
+from app.api.v1.routes.images import router as images_router
+from app.api.v1.routes.me import router as me_router
 from app.api.v1.routes.posts import router as posts_router
 from app.api.v1.routes.projects import router as projects_router
+from app.api.v1.routes.search import router as search_router
 from app.api.v1.routes.tags import router as tags_router
 
 api_v1_router = APIRouter()
@@ -15,3 +18,6 @@ api_v1_router.include_router(tags_router)
 api_v1_router.include_router(comments_router)
 api_v1_router.include_router(projects_router)
 api_v1_router.include_router(image_ai_router)
+api_v1_router.include_router(images_router)
+api_v1_router.include_router(me_router)
+api_v1_router.include_router(search_router)
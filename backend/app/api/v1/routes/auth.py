@@ -2,7 +2,6 @@ from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
-from app.db.models import User
 from app.middleware.rate_limit import limiter
 from app.repositories.token_repository import TokenRepository
 from app.repositories.user_repository import UserRepository
@@ -15,6 +14,7 @@ from app.schemas.auth import (
     UserResponse,
 )
 from app.services.auth_service import AuthService
+from app.services.principal_cache import Principal
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -51,7 +51,7 @@ async def login(
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
 async def logout(
     body: LogoutRequest,
-    _: User = Depends(get_current_user),
+    _: Principal = Depends(get_current_user),
     service: AuthService = Depends(_get_service),
 ) -> None:
     """Revoke the provided refresh token."""
@@ -60,7 +60,7 @@ async def logout(
 
 @router.get("/me", response_model=UserResponse)
 async def get_me(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: AuthService = Depends(_get_service),
 ) -> UserResponse:
     """Return the currently authenticated user's profile."""
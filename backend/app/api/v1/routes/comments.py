@@ -1,12 +1,12 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
-from app.db.models import User
-from app.repositories.comment_repository import CommentRepository
+from app.repositories.comment_repository import MAX_THREAD_DEPTH, CommentRepository
 from app.repositories.post_repository import PostRepository
-from app.schemas.comment import CommentCreate, CommentResponse
+from app.schemas.comment import CommentCreate, CommentPageResponse, CommentResponse
 from app.services.comment_service import CommentService
+from app.services.principal_cache import Principal
 
 router = APIRouter(tags=["comments"])
 
@@ -18,13 +18,28 @@ def _get_service(session: AsyncSession = Depends(get_db)) -> CommentService:
     )
 
 
-@router.get("/posts/{post_id}/comments", response_model=list[CommentResponse])
+@router.get("/posts/{post_id}/comments", response_model=CommentPageResponse)
 async def list_comments(
     post_id: str,
+    parent_id: str | None = Query(
+        None,
+        alias="parentId",
+        description="List the replies to this comment instead of top-level comments",
+    ),
+    cursor: str | None = Query(None, description="nextCursor of the previous page"),
+    limit: int = Query(20, ge=1, le=100),
+    depth: int = Query(
+        2,
+        ge=1,
+        le=MAX_THREAD_DEPTH,
+        description="Levels to return; each level previews the first replies of the one above",
+    ),
     service: CommentService = Depends(_get_service),
-) -> list[CommentResponse]:
-    """List all top-level comments for a post."""
-    return await service.get_comments(post_id)
+) -> CommentPageResponse:
+    """List a page of a post's comments (or of one comment's replies)."""
+    return await service.get_comments(
+        post_id, parent_id=parent_id, cursor=cursor, limit=limit, depth=depth
+    )
 
 
 @router.post(
@@ -35,7 +50,7 @@ async def list_comments(
 async def create_comment(
     post_id: str,
     body: CommentCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: CommentService = Depends(_get_service),
 ) -> CommentResponse:
     """Add a comment to a post. Requires authentication."""
@@ -45,7 +60,7 @@ async def create_comment(
 @router.delete("/comments/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_comment(
     comment_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: CommentService = Depends(_get_service),
 ) -> None:
     """Delete a comment. Only the author can delete their comment."""
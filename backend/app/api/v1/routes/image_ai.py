@@ -4,8 +4,8 @@ from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
 from app.api.deps import get_current_admin
-from app.db.models import User
 from app.services.image_ai_service import generate_image, generate_prompt
+from app.services.principal_cache import Principal
 
 router = APIRouter(prefix="/image-ai", tags=["image-ai"])
 
@@ -32,7 +32,7 @@ class GenerateImageResponse(BaseModel):
 @router.post("/generate-prompt", response_model=GeneratePromptResponse)
 async def generate_prompt_endpoint(
     body: GeneratePromptRequest,
-    _: User = Depends(get_current_admin),
+    _: Principal = Depends(get_current_admin),
 ) -> GeneratePromptResponse:
     """Generate an optimised Imagen prompt from post/project fields. Admin only."""
     prompt = await generate_prompt(
@@ -47,7 +47,7 @@ async def generate_prompt_endpoint(
 @router.post("/generate-image", response_model=GenerateImageResponse)
 async def generate_image_endpoint(
     body: GenerateImageRequest,
-    _: User = Depends(get_current_admin),
+    _: Principal = Depends(get_current_admin),
 ) -> GenerateImageResponse:
     """Generate a 16:9 image via Imagen and return base64-encoded PNG. Admin only."""
     image_data = await generate_image(body.prompt)
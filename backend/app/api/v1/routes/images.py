@@ -0,0 +1,39 @@
+import asyncio
+from pathlib import Path
+
+from fastapi import APIRouter, Request, Response, status
+from fastapi.responses import FileResponse
+
+from app.core.exceptions import ImageNotFoundError
+from app.core.http_cache import etag_matches
+from app.services.image_store import get_image_store, sniff_content_type
+
+router = APIRouter(prefix="/images", tags=["images"])
+
+# Content-addressed URLs never change meaning, so clients may cache forever
+_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _read_head(path: Path) -> bytes:
+    with open(path, "rb") as fh:
+        return fh.read(16)
+
+
+@router.get("/{image_hash}", response_class=FileResponse)
+async def get_image(image_hash: str, request: Request) -> Response:
+    """Serve a stored image by its SHA-256 hash. Supports ETag and Range requests."""
+    path = get_image_store().local_path(image_hash)
+    if path is None:
+        raise ImageNotFoundError()
+
+    etag = f'"{image_hash}"'
+    headers = {"Cache-Control": _CACHE_CONTROL, "ETag": etag}
+    if etag_matches(request.headers.get("If-None-Match", ""), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    content_type = sniff_content_type(await asyncio.to_thread(_read_head, path))
+    return FileResponse(
+        path,
+        media_type=content_type or "application/octet-stream",
+        headers=headers,
+    )
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.api.deps import get_current_user, get_viewer
+from app.schemas.post import LikedPostsResponse
+from app.services.principal_cache import Principal
+from app.services.viewer_context import ViewerContext
+
+router = APIRouter(prefix="/me", tags=["me"])
+
+# One page of posts at most (see the posts listing's ``size`` limit)
+_MAX_POST_IDS = 100
+
+
+@router.get("/likes", response_model=LikedPostsResponse)
+async def list_my_likes(
+    post_ids: list[str] = Query(
+        ...,
+        alias="postIds",
+        max_length=_MAX_POST_IDS,
+        description="Post IDs, one postIds parameter each",
+    ),
+    _: Principal = Depends(get_current_user),
+    viewer: ViewerContext = Depends(get_viewer),
+) -> LikedPostsResponse:
+    """Return which of the given posts the current user has liked."""
+    liked = await viewer.load_post_likes(post_ids)
+    return LikedPostsResponse(likedPostIds=[pid for pid in post_ids if pid in liked])
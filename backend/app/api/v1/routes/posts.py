@@ -1,56 +1,131 @@
-from fastapi import APIRouter, Depends, Query, status
+from typing import Any, Literal
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db, get_optional_user
-from app.db.models import User
+from app.api.deps import get_current_user, get_db, get_viewer
+from app.core.exceptions import PostNotFoundError
+from app.core.http_cache import check_not_modified, has_validators, set_validators
+from app.repositories.image_repository import ImageRepository
 from app.repositories.post_repository import PostRepository
 from app.schemas.common import PaginatedResponse
-from app.schemas.post import PostCreate, PostResponse, PostUpdate
+from app.schemas.post import (
+    LikeStatusResponse,
+    PostCreate,
+    PostResponse,
+    PostSummaryResponse,
+    PostUpdate,
+    parse_tag_names,
+)
+from app.services.image_service import ImageService
 from app.services.post_service import PostService
+from app.services.principal_cache import Principal
+from app.services.viewer_context import ViewerContext
 
 router = APIRouter(prefix="/posts", tags=["posts"])
 
 
 def _get_service(session: AsyncSession = Depends(get_db)) -> PostService:
-    return PostService(post_repo=PostRepository(session))
+    return PostService(
+        post_repo=PostRepository(session),
+        image_service=ImageService(ImageRepository(session)),
+    )
 
 
-@router.get("", response_model=PaginatedResponse[PostResponse])
+@router.get(
+    "",
+    response_model=PaginatedResponse[PostResponse] | PaginatedResponse[PostSummaryResponse],
+)
 async def list_posts(
-    q: str | None = Query(None, description="Filter by tag name"),
+    request: Request,
+    response: Response,
+    q: str | None = Query(None, description="Filter by a single tag name (same as `tags`)"),
+    tags: str | None = Query(
+        None, max_length=500, description="Comma-separated tag names to filter by"
+    ),
+    match: Literal["all", "any"] = Query(
+        "all", description="Require `all` listed tags or `any` of them"
+    ),
     uid: str | None = Query(None, description="Filter by author ID"),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
-    current_user: User | None = Depends(get_optional_user),
+    cursor: str | None = Query(
+        None, description="Opaque `nextCursor` from a previous page; overrides `page`"
+    ),
+    with_total: bool = Query(
+        True, alias="withTotal", description="Set to false to skip counting `total`"
+    ),
+    view: Literal["full", "summary"] = Query(
+        "full", description="`summary` omits the body for card lists"
+    ),
+    viewer: ViewerContext = Depends(get_viewer),
     service: PostService = Depends(_get_service),
-) -> PaginatedResponse[PostResponse]:
-    """List all posts with optional tag or author filtering."""
-    return await service.get_posts(
-        search=q,
-        uid=uid,
-        page=page,
-        size=size,
-        current_user_id=current_user.id if current_user else None,
-    )
+) -> PaginatedResponse[PostResponse] | PaginatedResponse[PostSummaryResponse]:
+    """List all posts with optional tag (all/any) or author filtering.
+
+    Supports conditional GET: a matching `If-None-Match` is answered with 304.
+    The page is only probed for its version when the client sent a validator.
+    """
+    params: dict[str, Any] = {
+        "tags": parse_tag_names(q, tags),
+        "match_all": match == "all",
+        "uid": uid,
+        "page": page,
+        "size": size,
+        "viewer": viewer,
+        "cursor": cursor,
+        "with_total": with_total,
+        "summary": view == "summary",
+    }
+    private = viewer.is_authenticated
+    if has_validators(request):
+        not_modified = check_not_modified(
+            request,
+            response,
+            etag=await service.get_posts_etag(**params),
+            private=private,
+            vary="Authorization",
+        )
+        if not_modified is not None:
+            return not_modified  # type: ignore[return-value]
+    result, etag = await service.get_posts(**params)
+    set_validators(response, etag=etag, private=private, vary="Authorization")
+    return result
 
 
 @router.get("/{post_id}", response_model=PostResponse)
 async def get_post(
     post_id: str,
-    current_user: User | None = Depends(get_optional_user),
+    request: Request,
+    response: Response,
+    viewer: ViewerContext = Depends(get_viewer),
     service: PostService = Depends(_get_service),
 ) -> PostResponse:
-    """Retrieve a single post by ID."""
-    return await service.get_post(
-        post_id,
-        current_user_id=current_user.id if current_user else None,
-    )
+    """Retrieve a single post by ID. Supports conditional GET."""
+    private = viewer.is_authenticated
+    version = None
+    if has_validators(request):
+        version = await service.get_post_version(post_id)
+        if version is None:
+            raise PostNotFoundError()
+        not_modified = check_not_modified(
+            request,
+            response,
+            etag=await service.get_post_etag(post_id, version, viewer=viewer),
+            private=private,
+            vary="Authorization",
+        )
+        if not_modified is not None:
+            return not_modified  # type: ignore[return-value]
+    post, etag = await service.get_post(post_id, viewer=viewer, version=version)
+    set_validators(response, etag=etag, private=private, vary="Authorization")
+    return post
 
 
 @router.post("", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
 async def create_post(
     body: PostCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: PostService = Depends(_get_service),
 ) -> PostResponse:
     """Create a new blog post. Requires authentication."""
@@ -61,7 +136,7 @@ async def create_post(
 async def update_post(
     post_id: str,
     body: PostUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: PostService = Depends(_get_service),
 ) -> PostResponse:
     """Update an existing post. Only the post owner can update."""
@@ -71,28 +146,28 @@ async def update_post(
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_post(
     post_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: PostService = Depends(_get_service),
 ) -> None:
     """Delete a post. Only the post owner can delete."""
     await service.delete_post(post_id, current_user=current_user)
 
 
-@router.post("/{post_id}/like", status_code=status.HTTP_204_NO_CONTENT)
+@router.post("/{post_id}/like", response_model=LikeStatusResponse)
 async def like_post(
     post_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: PostService = Depends(_get_service),
-) -> None:
-    """Like a post (idempotent)."""
-    await service.like_post(post_id, user_id=current_user.id)
+) -> LikeStatusResponse:
+    """Like a post (idempotent). Returns the updated like count."""
+    return await service.like_post(post_id, user_id=current_user.id)
 
 
-@router.delete("/{post_id}/like", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/{post_id}/like", response_model=LikeStatusResponse)
 async def unlike_post(
     post_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: PostService = Depends(_get_service),
-) -> None:
-    """Remove a like from a post."""
-    await service.unlike_post(post_id, user_id=current_user.id)
+) -> LikeStatusResponse:
+    """Remove a like from a post. Returns the updated like count."""
+    return await service.unlike_post(post_id, user_id=current_user.id)
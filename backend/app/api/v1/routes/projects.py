@@ -1,47 +1,72 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_admin, get_db
 from app.core.exceptions import ProjectNotFoundError, ProjectSlugTakenError
-from app.db.models import User
+from app.core.http_cache import check_not_modified
+from app.repositories.image_repository import ImageRepository
 from app.repositories.project_repository import ProjectRepository
 from app.schemas.common import PaginatedResponse
 from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
+from app.services.image_service import ImageService
+from app.services.principal_cache import Principal
 from app.services.project_service import ProjectService
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
 def _get_service(session: AsyncSession = Depends(get_db)) -> ProjectService:
-    return ProjectService(project_repo=ProjectRepository(session))
+    return ProjectService(
+        project_repo=ProjectRepository(session),
+        image_service=ImageService(ImageRepository(session)),
+    )
 
 
 @router.get("", response_model=PaginatedResponse[ProjectResponse])
 async def list_projects(
+    request: Request,
+    response: Response,
     featured: bool = Query(False, description="Return only featured projects"),
     page: int = Query(1, ge=1),
     size: int = Query(50, ge=1, le=100),
+    with_total: bool = Query(
+        True, alias="withTotal", description="Set to false to skip counting `total`"
+    ),
     service: ProjectService = Depends(_get_service),
 ) -> PaginatedResponse[ProjectResponse]:
-    """List all projects. Public endpoint."""
-    return await service.get_projects(featured_only=featured, page=page, size=size)
+    """List all projects. Public endpoint. Supports conditional GET."""
+    etag, last_modified = await service.get_projects_validators(
+        featured_only=featured, page=page, size=size, with_total=with_total
+    )
+    not_modified = check_not_modified(request, response, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        return not_modified  # type: ignore[return-value]
+    return await service.get_projects(
+        featured_only=featured, page=page, size=size, with_total=with_total
+    )
 
 
 @router.get("/{slug}", response_model=ProjectResponse)
 async def get_project(
     slug: str,
+    request: Request,
+    response: Response,
     service: ProjectService = Depends(_get_service),
 ) -> ProjectResponse:
-    """Retrieve a single project by slug. Public endpoint."""
+    """Retrieve a single project by slug. Public endpoint. Supports conditional GET."""
+    etag, last_modified = await service.get_project_validators(slug)
+    not_modified = check_not_modified(request, response, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        return not_modified  # type: ignore[return-value]
     return await service.get_project(slug)
 
 
 @router.post("", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 async def create_project(
     body: ProjectCreate,
-    _: User = Depends(get_current_admin),
+    _: Principal = Depends(get_current_admin),
     service: ProjectService = Depends(_get_service),
 ) -> ProjectResponse:
     """Create a new project. Admin only."""
@@ -52,7 +77,7 @@ async def create_project(
 async def update_project(
     project_id: str,
     body: ProjectUpdate,
-    _: User = Depends(get_current_admin),
+    _: Principal = Depends(get_current_admin),
     service: ProjectService = Depends(_get_service),
 ) -> ProjectResponse:
     """Update a project. Admin only."""
@@ -62,7 +87,7 @@ async def update_project(
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_project(
     project_id: str,
-    _: User = Depends(get_current_admin),
+    _: Principal = Depends(get_current_admin),
     service: ProjectService = Depends(_get_service),
 ) -> Response:
     """Delete a project. Admin only."""
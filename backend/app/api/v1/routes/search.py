@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_db, get_viewer
+from app.repositories.search_repository import SearchRepository
+from app.schemas.post import parse_tag_names
+from app.schemas.search import SearchResponse
+from app.services.search_service import SearchService
+from app.services.viewer_context import ViewerContext
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+def _get_service(session: AsyncSession = Depends(get_db)) -> SearchService:
+    return SearchService(search_repo=SearchRepository(session))
+
+
+@router.get("", response_model=SearchResponse)
+async def search_posts(
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=200,
+        description='Search terms; supports "quoted phrases", -exclusions and OR',
+    ),
+    tags: str | None = Query(
+        None, max_length=500, description="Comma-separated tags every result must carry"
+    ),
+    page: int = Query(1, ge=1),
+    size: int = Query(20, ge=1, le=50),
+    viewer: ViewerContext = Depends(get_viewer),
+    service: SearchService = Depends(_get_service),
+) -> SearchResponse:
+    """Full-text search over post titles and bodies, ranked by relevance.
+
+    Returns highlighted titles and snippets, plus tag facet counts over all matches.
+    """
+    return await service.search(
+        q=q, tags=parse_tag_names(tags), page=page, size=size, viewer=viewer
+    )
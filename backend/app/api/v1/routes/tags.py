@@ -1,11 +1,14 @@
-from fastapi import Depends
-from fastapi import APIRouter
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query, Request, Response
 from pydantic import BaseModel
-from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db
-from app.db.models import PostTag, Tag
+from app.core.http_cache import check_not_modified, make_etag
+from app.core.pagination import decode_tag_cursor, encode_tag_cursor
+from app.repositories.collection_versions import get_collection_version
+from app.repositories.tag_repository import TagRepository
 
 router = APIRouter(prefix="/tags", tags=["tags"])
 
@@ -17,20 +20,48 @@ class TagWithCount(BaseModel):
 
 class TagListResponse(BaseModel):
     tags: list[TagWithCount]
+    nextCursor: str | None = None  # pass back as ``cursor`` to fetch the next page
 
 
 @router.get("", response_model=TagListResponse)
 async def list_tags(
+    request: Request,
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    sort: Literal["count", "name"] = Query(
+        "count", description="`count`: most used first; `name`: alphabetical"
+    ),
+    min_count: int = Query(
+        1,
+        ge=0,
+        alias="minCount",
+        description="Hide tags used by fewer posts (0 keeps orphans)",
+    ),
+    cursor: str | None = Query(None, description="Opaque `nextCursor` from a previous page"),
     session: AsyncSession = Depends(get_db),
 ) -> TagListResponse:
-    """Return all tags with their respective post counts, ordered by name."""
-    result = await session.execute(
-        select(Tag.name, func.count(PostTag.postId).label("post_count"))
-        .outerjoin(PostTag, Tag.id == PostTag.tagId)
-        .group_by(Tag.id, Tag.name)
-        .order_by(Tag.name.asc())
+    """Return tags with their post counts from the maintained ``tags.post_count``.
+
+    Supports conditional GET via the ``tags`` collection marker.
+    """
+    version, last_modified = await get_collection_version(session, "tags")
+    not_modified = check_not_modified(
+        request,
+        response,
+        etag=make_etag("tags", version, limit, sort, min_count, cursor),
+        last_modified=last_modified,
+    )
+    if not_modified is not None:
+        return not_modified  # type: ignore[return-value]
+
+    tags, has_more = await TagRepository(session).list_stats(
+        sort=sort,
+        min_count=min_count,
+        limit=limit,
+        after=decode_tag_cursor(cursor) if cursor else None,
     )
-    rows = result.all()
+    next_cursor = encode_tag_cursor(tags[-1].postCount, tags[-1].name) if has_more else None
     return TagListResponse(
-        tags=[TagWithCount(name=row.name, postCount=row.post_count) for row in rows]
+        tags=[TagWithCount(name=tag.name, postCount=tag.postCount) for tag in tags],
+        nextCursor=next_cursor,
     )
@@ -2,6 +2,8 @@ from functools import lru_cache
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from app.schemas.common import CountStrategy
+
 
 class Settings(BaseSettings):
     # Application
@@ -10,16 +12,90 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALLOWED_ORIGINS: list[str] = ["http://localhost:5173"]
 
+    # Public base URL of this API, used to build absolute links (e.g. image URLs)
+    PUBLIC_API_URL: str = "http://localhost:8000/api/v1"
+
     # Database
     DATABASE_URL: str
+    # Connection pool, per worker process: a deployment holds up to
+    # workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections. Size it from the
+    # "dbPool" gauges on /metrics (checkout waits and timeouts).
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    # Replace connections older than this (-1 never); keeps them under
+    # server- or proxy-side idle cutoffs without pinging
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    # Ping every connection on checkout (one extra round trip each time).
+    # Off relies on DB_POOL_RECYCLE_SECONDS, and on a detected disconnect
+    # invalidating the pool
+    DB_POOL_PRE_PING: bool = True
+    # Prepared statements cached per connection; 0 behind PgBouncer in
+    # transaction pooling mode
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # Run the sessions of GET/HEAD/OPTIONS requests in READ ONLY transactions
+    DB_READ_ONLY_TRANSACTIONS: bool = True
+
+    # Post counters
+    POST_COUNTER_MODE: str = "direct"  # "direct" | "sharded"
+    POST_COUNTER_SHARDS: int = 8
+
+    # Likes — "buffered" coalesces like/unlike intents in memory and writes
+    # them in one transaction per flush window (see app.services.like_buffer)
+    LIKE_WRITE_MODE: str = "direct"  # "direct" | "buffered"
+    LIKE_FLUSH_INTERVAL_SECONDS: float = 0.5
+    LIKE_FLUSH_MAX_PENDING: int = 500
+
+    # Pagination totals — see app.schemas.common.CountStrategy. A "cached"
+    # miss runs a full count(*) over the filtered set; misses happen per
+    # worker, per filter combination and at least once per TTL window
+    POSTS_COUNT_STRATEGY: CountStrategy = CountStrategy.CACHED
+    PROJECTS_COUNT_STRATEGY: CountStrategy = CountStrategy.CACHED
+    COUNT_CACHE_TTL_SECONDS: int = 30
+
+    # Post read-through cache (per worker)
+    POST_CACHE_SIZE: int = 1000
+    POST_CACHE_TTL_SECONDS: int = 300
+
+    # Background jobs (app.services.scheduler) — each job runs on one worker
+    # per interval: runs are serialised by a Postgres advisory lock and each
+    # period is claimed in the job_runs table
+    SCHEDULER_ENABLED: bool = True
+    TOKEN_PURGE_INTERVAL_SECONDS: int = 3600
+    TOKEN_PURGE_BATCH_SIZE: int = 1000
+    COUNTER_FOLD_INTERVAL_SECONDS: int = 60  # only scheduled in "sharded" mode
+
+    # Image store
+    IMAGE_STORE_DIR: str = "data/images"
+    IMAGE_MAX_BYTES: int = 10 * 1024 * 1024
+    IMAGE_WORKERS: int = 2  # processes rendering thumbnails / variants
+    # Blobs are written before the request commits; a rollback leaves files no
+    # row refers to, which a scheduled job deletes once they are this old
+    IMAGE_GC_INTERVAL_SECONDS: int = 6 * 3600
+    IMAGE_GC_GRACE_SECONDS: int = 3600
 
     # JWT
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    # A rotated refresh token presented again revokes its whole family,
+    # unless it was rotated this recently (concurrent refreshes from one client)
+    REFRESH_REUSE_GRACE_SECONDS: int = 10
     JWT_ALGORITHM: str = "HS256"
+    # Reject access tokens whose "ver" claim predates users.token_version
+    # (bumped by "log out everywhere")
+    ACCESS_TOKEN_VERSION_CHECK: bool = True
+
+    # Authenticated principal cache (per worker) — how long a deactivation or
+    # role change made elsewhere can take to reach this worker
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
 
-    # Password hashing
+    # Password hashing — pick BCRYPT_ROUNDS for the host with
+    # scripts/calibrate_bcrypt.py; hashes run in a dedicated thread pool and
+    # requests beyond workers + queue limit get a 503
     BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_LIMIT: int = 32
 
     # Google Gemini (AI Studio)
     GEMINI_API_KEY: str = ""
@@ -8,10 +8,17 @@ class AppException(HTTPException):
     Provides a structured ``{ code, message }`` detail instead of a plain string.
     """
 
-    def __init__(self, status_code: int, code: str, message: str) -> None:
+    def __init__(
+        self,
+        status_code: int,
+        code: str,
+        message: str,
+        headers: dict[str, str] | None = None,
+    ) -> None:
         super().__init__(
             status_code=status_code,
             detail={"code": code, "message": message},
+            headers=headers,
         )
 
 
@@ -27,6 +34,26 @@ class PasswordMismatchError(AppException):
         )
 
 
+class InvalidCursorError(AppException):
+    def __init__(self) -> None:
+        super().__init__(
+            status.HTTP_400_BAD_REQUEST,
+            "INVALID_CURSOR",
+            "The pagination cursor is malformed.",
+        )
+
+
+class InvalidImageError(AppException):
+    def __init__(
+        self, message: str = "The image must be a PNG, JPEG, GIF, WebP or AVIF file."
+    ) -> None:
+        super().__init__(
+            status.HTTP_400_BAD_REQUEST,
+            "INVALID_IMAGE",
+            message,
+        )
+
+
 # ─── 401 Unauthorized ─────────────────────────────────────────────────────────
 
 
@@ -99,6 +126,15 @@ class CommentNotFoundError(AppException):
         )
 
 
+class ImageNotFoundError(AppException):
+    def __init__(self) -> None:
+        super().__init__(
+            status.HTTP_404_NOT_FOUND,
+            "IMAGE_NOT_FOUND",
+            "The requested image was not found.",
+        )
+
+
 # ─── 409 Conflict ─────────────────────────────────────────────────────────────
 
 
@@ -135,6 +171,19 @@ class ProjectSlugTakenError(AppException):
         )
 
 
+# ─── 503 Service Unavailable ──────────────────────────────────────────────────
+
+
+class ServiceBusyError(AppException):
+    def __init__(self, retry_after: int = 1) -> None:
+        super().__init__(
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            "SERVICE_BUSY",
+            "The server is busy. Please try again shortly.",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
 # ─── Exception Handlers ───────────────────────────────────────────────────────
 
 
@@ -143,7 +192,7 @@ def register_exception_handlers(app: FastAPI) -> None:
     async def app_exception_handler(
         request: Request, exc: AppException
     ) -> JSONResponse:
-        return JSONResponse(status_code=exc.status_code, content=exc.detail)
+        return JSONResponse(status_code=exc.status_code, content=exc.detail, headers=exc.headers)
 
     @app.exception_handler(Exception)
     async def generic_exception_handler(
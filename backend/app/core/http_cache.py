@@ -0,0 +1,113 @@
+"""Conditional GET helpers: ETag / Last-Modified validators and 304 answers.
+
+Validators are derived from cheap version probes (``updated_at`` columns,
+counters, collection markers) — never from the serialized body — so a
+revalidation can be answered before the real query runs.
+"""
+
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: object) -> str:
+    """Build a weak ETag from the values that determine a representation.
+
+    Weak because the GZip middleware may re-encode the body; the validator
+    vouches for the content, not the bytes.
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _opaque(tag: str) -> str:
+    return tag.strip().removeprefix("W/")
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match list names *etag* (or is ``*``).
+
+    Whole tags are compared, weakly per RFC 9110 §13.1.2: ``W/"x"`` and
+    ``"x"`` match each other, ``"x"`` and ``"xy"`` do not.
+    """
+    candidates = {_opaque(tag) for tag in if_none_match.split(",")}
+    return "*" in candidates or _opaque(etag) in candidates
+
+
+def _is_fresh(request: Request, etag: str, last_modified: datetime | None) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence over If-Modified-Since
+        return etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        # HTTP dates have one-second resolution
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def has_validators(request: Request) -> bool:
+    """Whether the request is conditional, i.e. a version probe could pay off."""
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def _validator_headers(
+    *,
+    etag: str,
+    last_modified: datetime | None,
+    private: bool,
+    vary: str | None,
+) -> dict[str, str]:
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"{'private' if private else 'public'}, no-cache",
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(UTC), usegmt=True)
+    if vary:
+        headers["Vary"] = vary
+    return headers
+
+
+def set_validators(
+    response: Response,
+    *,
+    etag: str,
+    last_modified: datetime | None = None,
+    private: bool = False,
+    vary: str | None = None,
+) -> None:
+    """Attach validators built from a representation that was just produced."""
+    response.headers.update(
+        _validator_headers(etag=etag, last_modified=last_modified, private=private, vary=vary)
+    )
+
+
+def check_not_modified(
+    request: Request,
+    response: Response,
+    *,
+    etag: str,
+    last_modified: datetime | None = None,
+    private: bool = False,
+    vary: str | None = None,
+) -> Response | None:
+    """Attach validators to *response*; return a 304 if the client copy is current.
+
+    Representations that depend on the caller (e.g. ``likedByMe``) pass
+    ``vary="Authorization"`` and are marked *private* for signed-in viewers.
+    """
+    headers = _validator_headers(etag=etag, last_modified=last_modified, private=private, vary=vary)
+    if _is_fresh(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
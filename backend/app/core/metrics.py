@@ -0,0 +1,14 @@
+from collections.abc import Callable
+from typing import Any
+
+# name → zero-argument callable returning a JSON-serialisable snapshot
+_sources: dict[str, Callable[[], dict[str, Any]]] = {}
+
+
+def register_metrics(name: str, source: Callable[[], dict[str, Any]]) -> None:
+    """Expose *source()* under *name* in the ``/metrics`` snapshot."""
+    _sources[name] = source
+
+
+def collect_metrics() -> dict[str, Any]:
+    return {name: source() for name, source in _sources.items()}
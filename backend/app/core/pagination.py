@@ -0,0 +1,57 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+from app.core.exceptions import InvalidCursorError
+
+# ─── Keyset cursors ───────────────────────────────────────────────────────────
+#
+# A cursor is an opaque, URL-safe token over the sort key of the last item on
+# the previous page — ``(created_at, id)`` for every chronological listing.
+# Fetching the next page is then a ``WHERE (created_at, id) < (:c, :id)``
+# index range scan instead of an OFFSET that reads and discards earlier rows.
+
+
+def _encode(values: list[Any]) -> str:
+    raw = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode(token: str) -> list[Any]:
+    padded = token + "=" * (-len(token) % 4)
+    values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    if not isinstance(values, list):
+        raise TypeError("cursor payload must be a list")
+    return values
+
+
+def encode_cursor(created_at: datetime, item_id: str) -> str:
+    """Return an opaque cursor pointing just past *(created_at, item_id)*."""
+    return _encode([created_at.isoformat(), item_id])
+
+
+def decode_cursor(token: str) -> tuple[datetime, str]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Raises ``InvalidCursorError`` on anything that was not produced by us.
+    """
+    try:
+        created_at, item_id = _decode(token)
+        return datetime.fromisoformat(created_at), str(item_id)
+    except (binascii.Error, ValueError, TypeError, UnicodeDecodeError):
+        raise InvalidCursorError() from None
+
+
+def encode_tag_cursor(post_count: int, name: str) -> str:
+    """Cursor for tag listings, sorted by ``(post_count desc, name)`` or by name."""
+    return _encode([post_count, name])
+
+
+def decode_tag_cursor(token: str) -> tuple[int, str]:
+    try:
+        post_count, name = _decode(token)
+        return int(post_count), str(name)
+    except (binascii.Error, ValueError, TypeError, UnicodeDecodeError):
+        raise InvalidCursorError() from None
@@ -11,11 +11,13 @@ from app.core.config import get_settings
 _settings = get_settings()
 
 # ─── Password ─────────────────────────────────────────────────────────────────
+# CPU-bound (~250 ms at 12 rounds): call these through
+# app.services.password_hasher, never directly on the event loop.
 
 
-def hash_password(plain: str) -> str:
-    """Return a bcrypt hash of *plain*."""
-    salt = bcrypt.gensalt(rounds=_settings.BCRYPT_ROUNDS)
+def hash_password(plain: str, rounds: int | None = None) -> str:
+    """Return a bcrypt hash of *plain* (BCRYPT_ROUNDS unless *rounds* is given)."""
+    salt = bcrypt.gensalt(rounds=rounds if rounds is not None else _settings.BCRYPT_ROUNDS)
     return bcrypt.hashpw(plain.encode(), salt).decode()
 
 
@@ -24,6 +26,19 @@ def verify_password(plain: str, hashed: str) -> bool:
     return bcrypt.checkpw(plain.encode(), hashed.encode())
 
 
+def bcrypt_rounds(hashed: str) -> int | None:
+    """Return the cost factor encoded in a ``$2b$12$...`` hash (None if unparsable)."""
+    parts = hashed.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def needs_rehash(hashed: str) -> bool:
+    """True when *hashed* was made with a cost other than BCRYPT_ROUNDS."""
+    return bcrypt_rounds(hashed) != _settings.BCRYPT_ROUNDS
+
+
 # ─── Access Token (JWT) ───────────────────────────────────────────────────────
 
 
@@ -31,8 +46,13 @@ def create_access_token(
     user_id: str,
     email: str,
     display_name: str,
+    token_version: int = 0,
 ) -> str:
-    """Return a signed JWT access token valid for ACCESS_TOKEN_EXPIRE_MINUTES."""
+    """Return a signed JWT access token valid for ACCESS_TOKEN_EXPIRE_MINUTES.
+
+    *token_version* is the user's ``token_version`` at issue time (claim
+    ``ver``); bumping the column invalidates every token issued before.
+    """
     expires_at = datetime.now(UTC) + timedelta(
         minutes=_settings.ACCESS_TOKEN_EXPIRE_MINUTES
     )
@@ -41,6 +61,7 @@ def create_access_token(
         "email": email,
         "display_name": display_name,
         "type": "access",
+        "ver": token_version,
         "exp": expires_at,
         "iat": datetime.now(UTC),
     }
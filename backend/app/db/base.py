@@ -1,5 +1,12 @@
-from sqlalchemy.orm import DeclarativeBase
+from typing import Any
+
+from sqlalchemy.orm import DeclarativeBase, declared_attr
 
 
 class Base(DeclarativeBase):
-    pass
+    # Fetch server-generated columns (created_at, counters, ...) with
+    # INSERT/UPDATE ... RETURNING during the flush instead of re-selecting
+    # them after commit
+    @declared_attr.directive
+    def __mapper_args__(cls) -> dict[str, Any]:
+        return {"eager_defaults": True}
@@ -1,5 +1,7 @@
+from typing import Any
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -8,12 +10,15 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from app.core.config import get_settings
+from app.core.metrics import register_metrics
+from app.db.pool import InstrumentedPool
 
 _engine: AsyncEngine | None = None
 _async_session_factory: async_sessionmaker[AsyncSession] | None = None
+_read_only_session_factory: async_sessionmaker[AsyncSession] | None = None
 
 
-def _build_async_url(raw_url: str) -> tuple[str, dict]:
+def _build_async_url(raw_url: str) -> tuple[str, dict[str, Any]]:
     """Convert a raw DATABASE_URL to asyncpg format.
 
     - Normalises postgres:// and postgresql:// to postgresql+asyncpg://
@@ -33,7 +38,7 @@ def _build_async_url(raw_url: str) -> tuple[str, dict]:
 
     # asyncpg does not understand sslmode — extract and convert it
     sslmode = query_params.pop("sslmode", [None])[0]
-    connect_args: dict = {}
+    connect_args: dict[str, Any] = {}
     if sslmode == "disable":
         connect_args["ssl"] = False
     elif sslmode in ("require", "verify-ca", "verify-full"):
@@ -51,17 +56,31 @@ def get_engine() -> AsyncEngine:
     if _engine is None:
         settings = get_settings()
         db_url, connect_args = _build_async_url(settings.DATABASE_URL)
+        url = make_url(db_url)
+        if "prepared_statement_cache_size" not in url.query:
+            url = url.update_query_dict(
+                {"prepared_statement_cache_size": str(settings.DB_STATEMENT_CACHE_SIZE)}
+            )
+        connect_args.setdefault("statement_cache_size", settings.DB_STATEMENT_CACHE_SIZE)
         _engine = create_async_engine(
-            db_url,
+            url,
             echo=settings.DEBUG,
-            pool_size=10,
-            max_overflow=20,
-            pool_pre_ping=True,
+            poolclass=InstrumentedPool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
             connect_args=connect_args,
         )
     return _engine
 
 
+def _pool_stats() -> dict[str, Any]:
+    pool = _engine.pool if _engine is not None else None
+    return pool.stats() if isinstance(pool, InstrumentedPool) else {}
+
+
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     global _async_session_factory
     if _async_session_factory is None:
@@ -73,9 +92,32 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
     return _async_session_factory
 
 
+def get_read_only_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Sessions whose transactions start as ``BEGIN READ ONLY``.
+
+    Same pool as ``get_session_factory``; the read-only flag is set per
+    checkout and reset when the connection goes back to the pool. Postgres
+    then rejects any write, and can skip transaction-ID assignment.
+    DEFERRABLE is not requested: it only matters at SERIALIZABLE isolation,
+    which the app does not use.
+    """
+    global _read_only_session_factory
+    if _read_only_session_factory is None:
+        _read_only_session_factory = async_sessionmaker(
+            bind=get_engine().execution_options(postgresql_readonly=True),
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+    return _read_only_session_factory
+
+
 async def close_engine() -> None:
-    global _engine, _async_session_factory
+    global _engine, _async_session_factory, _read_only_session_factory
     if _engine is not None:
         await _engine.dispose()
         _engine = None
         _async_session_factory = None
+        _read_only_session_factory = None
+
+
+register_metrics("dbPool", _pool_stats)
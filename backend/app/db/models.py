@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from cuid2 import cuid_wrapper
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     DateTime,
     ForeignKey,
@@ -12,15 +13,23 @@ from sqlalchemy import (
     Integer,
     JSON,
     String,
+    Table,
     Text,
+    event,
     func,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from app.db.base import Base
 
 _cuid_gen = cuid_wrapper()
 
+# Text search configuration for posts.search_vector — the blog is written in
+# Portuguese. Queries must use the same configuration as the stored vectors.
+SEARCH_CONFIG = "portuguese"
+
 
 def new_cuid() -> str:
     return _cuid_gen()
@@ -39,6 +48,10 @@ class User(Base):
     isAdmin: Mapped[bool] = mapped_column(
         "is_admin", Boolean, nullable=False, default=False
     )
+    # Bumped to invalidate every access token issued before (claim "ver")
+    tokenVersion: Mapped[int] = mapped_column(
+        "token_version", Integer, nullable=False, server_default="0"
+    )
     createdAt: Mapped[datetime] = mapped_column(
         "created_at",
         DateTime(timezone=True),
@@ -69,14 +82,69 @@ class User(Base):
     __table_args__ = (Index("ix_users_email", "email"),)
 
 
+class Image(Base):
+    """Metadata for a content-addressed blob held by the image store."""
+
+    __tablename__ = "images"
+
+    hash: Mapped[str] = mapped_column(String(64), primary_key=True)  # SHA-256 hex
+    contentType: Mapped[str] = mapped_column("content_type", String, nullable=False)
+    byteSize: Mapped[int] = mapped_column("byte_size", Integer, nullable=False)
+    width: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    height: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    placeholder: Mapped[str | None] = mapped_column(String, nullable=True)
+    createdAt: Mapped[datetime] = mapped_column(
+        "created_at",
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    variants: Mapped[list[ImageVariant]] = relationship(
+        cascade="all, delete-orphan",
+        lazy="selectin",
+        order_by="ImageVariant.width",
+    )
+
+
+class ImageVariant(Base):
+    """A resized / re-encoded derivative of an Image, stored as its own blob."""
+
+    __tablename__ = "image_variants"
+
+    sourceHash: Mapped[str] = mapped_column(
+        "source_hash",
+        String(64),
+        ForeignKey("images.hash", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    width: Mapped[int] = mapped_column(Integer, primary_key=True)
+    format: Mapped[str] = mapped_column(String, primary_key=True)
+    hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    byteSize: Mapped[int] = mapped_column("byte_size", Integer, nullable=False)
+
+
 class Post(Base):
     __tablename__ = "posts"
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=new_cuid)
     title: Mapped[str] = mapped_column(String, nullable=False)
     image: Mapped[str] = mapped_column(String, nullable=False)
-    image_data: Mapped[Optional[str]] = mapped_column("image_data", Text, nullable=True)
+    imageRef: Mapped[str | None] = mapped_column(
+        "image_ref",
+        String(64),
+        ForeignKey("images.hash", ondelete="SET NULL"),
+        nullable=True,
+    )
     body: Mapped[str] = mapped_column(Text, nullable=False)
+    # Denormalized counters — maintained by the like/comment write paths and
+    # recomputed by scripts/reconcile_counters.py
+    likeCount: Mapped[int] = mapped_column(
+        "like_count", Integer, nullable=False, default=0, server_default="0"
+    )
+    commentCount: Mapped[int] = mapped_column(
+        "comment_count", Integer, nullable=False, default=0, server_default="0"
+    )
     createdAt: Mapped[datetime] = mapped_column(
         "created_at",
         DateTime(timezone=True),
@@ -97,7 +165,17 @@ class Post(Base):
         nullable=False,
     )
 
+    # Title (weight A) + body (weight B) lexemes, maintained by the
+    # posts_search_vector_refresh trigger. Deferred: only search reads it.
+    searchVector: Mapped[str | None] = mapped_column(
+        "search_vector", TSVECTOR, nullable=True, deferred=True
+    )
+
+    # Not a DB column — populated via with_expression() by summary queries
+    excerpt: Mapped[str | None] = query_expression()
+
     author: Mapped["User"] = relationship(back_populates="posts")
+    imageAsset: Mapped[Image | None] = relationship(lazy="joined")
     tags: Mapped[list["PostTag"]] = relationship(
         back_populates="post",
         cascade="all, delete-orphan",
@@ -109,10 +187,40 @@ class Post(Base):
         back_populates="post", cascade="all, delete-orphan"
     )
 
+    # Keyset pagination indexes: every listing orders by (created_at, id)
     __table_args__ = (
-        Index("ix_posts_author_id", "author_id"),
-        Index("ix_posts_created_at", "created_at"),
-    )
+        Index("ix_posts_author_id_created_at_id", "author_id", "created_at", "id"),
+        Index("ix_posts_created_at_id", "created_at", "id"),
+        Index("ix_posts_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+
+# A trigger rather than a generated column: it fires only when title or body
+# change, so counter updates on hot posts never re-tokenize the body.
+_SEARCH_VECTOR_DDL = (
+    f"""
+    CREATE OR REPLACE FUNCTION posts_search_vector_refresh() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.body, '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER posts_search_vector_refresh
+        BEFORE INSERT OR UPDATE OF title, body ON posts
+        FOR EACH ROW EXECUTE FUNCTION posts_search_vector_refresh()
+    """,
+)
+
+
+@event.listens_for(Post.__table__, "after_create")
+def _create_search_vector_trigger(target: Table, connection: Connection, **kw: Any) -> None:
+    if connection.dialect.name == "postgresql":
+        for statement in _SEARCH_VECTOR_DDL:
+            connection.exec_driver_sql(statement)
 
 
 class Tag(Base):
@@ -120,10 +228,19 @@ class Tag(Base):
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=new_cuid)
     name: Mapped[str] = mapped_column(String, unique=True, nullable=False)
+    # Denormalized number of linked posts — maintained by the post write path
+    # and recomputed by scripts/reconcile_counters.py
+    postCount: Mapped[int] = mapped_column(
+        "post_count", Integer, nullable=False, default=0, server_default="0"
+    )
 
     posts: Mapped[list["PostTag"]] = relationship(back_populates="tag")
 
-    __table_args__ = (Index("ix_tags_name", "name"),)
+    __table_args__ = (
+        Index("ix_tags_name", "name"),
+        # Serves the tag cloud: ORDER BY post_count DESC, name
+        Index("ix_tags_post_count_name", postCount.desc(), "name"),
+    )
 
 
 class PostTag(Base):
@@ -145,7 +262,7 @@ class PostTag(Base):
     post: Mapped["Post"] = relationship(back_populates="tags")
     tag: Mapped["Tag"] = relationship(back_populates="posts", lazy="joined")
 
-    __table_args__ = (Index("ix_post_tags_tag_id", "tag_id"),)
+    __table_args__ = (Index("ix_post_tags_tag_id_post_id", "tag_id", "post_id"),)
 
 
 class Comment(Base):
@@ -201,7 +318,8 @@ class Comment(Base):
     )
 
     __table_args__ = (
-        Index("ix_comments_post_id", "post_id"),
+        # Serves both the post's comment count and keyset pages of a thread level
+        Index("ix_comments_thread", "post_id", "parent_id", "created_at", "id"),
         Index("ix_comments_author_id", "author_id"),
         Index("ix_comments_parent_id", "parent_id"),
     )
@@ -235,6 +353,69 @@ class PostLike(Base):
     __table_args__ = (Index("ix_post_likes_post_id", "post_id"),)
 
 
+class PostCounterDelta(Base):
+    """Pending counter increments for a post, spread over several shard rows.
+
+    Used when ``POST_COUNTER_MODE="sharded"`` so that concurrent likes on a
+    popular post do not all queue on the same ``posts`` row lock. Deltas are
+    folded back into ``posts.like_count`` / ``posts.comment_count`` periodically.
+    """
+
+    __tablename__ = "post_counter_deltas"
+
+    postId: Mapped[str] = mapped_column(
+        "post_id",
+        String,
+        ForeignKey("posts.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    shard: Mapped[int] = mapped_column(Integer, primary_key=True)
+    likeDelta: Mapped[int] = mapped_column(
+        "like_delta", Integer, nullable=False, default=0, server_default="0"
+    )
+    commentDelta: Mapped[int] = mapped_column(
+        "comment_delta", Integer, nullable=False, default=0, server_default="0"
+    )
+
+
+class CollectionVersion(Base):
+    """Change marker for a public collection (``posts``, ``projects``, ``tags``).
+
+    Bumped in the same transaction as every write that changes what the
+    collection's list endpoint returns, so ETag / Last-Modified for the list
+    can be derived without running the list query.
+    """
+
+    __tablename__ = "collection_versions"
+
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=1, server_default="1")
+    updatedAt: Mapped[datetime] = mapped_column(
+        "updated_at",
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+
+class JobRun(Base):
+    """When a scheduled job (``app.services.scheduler``) last ran on any worker.
+
+    A worker claims a period by moving ``last_run_at`` forward; a worker that
+    finds the period already claimed skips the run.
+    """
+
+    __tablename__ = "job_runs"
+
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    lastRunAt: Mapped[datetime] = mapped_column(
+        "last_run_at",
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+
 class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
 
@@ -260,6 +441,12 @@ class RefreshToken(Base):
     revokedAt: Mapped[Optional[datetime]] = mapped_column(
         "revoked_at", DateTime(timezone=True), nullable=True
     )
+    # Every token rotated out of one login shares the login token's ID here;
+    # rotatedAt marks tokens exchanged for a successor (as opposed to logout)
+    familyId: Mapped[str] = mapped_column("family_id", String, nullable=False)
+    rotatedAt: Mapped[datetime | None] = mapped_column(
+        "rotated_at", DateTime(timezone=True), nullable=True
+    )
     userAgent: Mapped[Optional[str]] = mapped_column(
         "user_agent", String, nullable=True
     )
@@ -273,6 +460,7 @@ class RefreshToken(Base):
         Index("ix_refresh_tokens_token_hash", "token_hash"),
         Index("ix_refresh_tokens_user_id", "user_id"),
         Index("ix_refresh_tokens_expires_at", "expires_at"),
+        Index("ix_refresh_tokens_family_id", "family_id"),
     )
 
 
@@ -288,7 +476,12 @@ class Project(Base):
     url: Mapped[str] = mapped_column(String, nullable=False)
     githubUrl: Mapped[Optional[str]] = mapped_column("github_url", String, nullable=True)
     image: Mapped[str] = mapped_column(String, nullable=False)
-    image_data: Mapped[Optional[str]] = mapped_column("image_data", Text, nullable=True)
+    imageRef: Mapped[str | None] = mapped_column(
+        "image_ref",
+        String(64),
+        ForeignKey("images.hash", ondelete="SET NULL"),
+        nullable=True,
+    )
     tags: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
     techStack: Mapped[list] = mapped_column("tech_stack", JSON, nullable=False, default=list)
     stats: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
@@ -309,6 +502,8 @@ class Project(Base):
         onupdate=func.now(),
     )
 
+    imageAsset: Mapped[Image | None] = relationship(lazy="joined")
+
     __table_args__ = (
         Index("ix_projects_slug", "slug"),
         Index("ix_projects_featured", "featured"),
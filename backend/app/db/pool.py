@@ -0,0 +1,48 @@
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """The engine's default async queue pool, plus checkout timing.
+
+    A checkout is timed from the request for a connection until it is
+    handed over. That covers waiting for a free slot, opening a new
+    connection and the pre-ping when enabled. Checkouts that give up after
+    DB_POOL_TIMEOUT_SECONDS are counted as timeouts.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = (time.perf_counter() - started) * 1000
+            self.checkouts += 1
+            self.wait_ms_total += waited
+            self.wait_ms_max = max(self.wait_ms_max, waited)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "size": self.size(),
+            "checkedOut": self.checkedout(),
+            "idle": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "waitMsTotal": round(self.wait_ms_total, 1),
+            "waitMsAvg": round(self.wait_ms_total / self.checkouts, 2) if self.checkouts else 0.0,
+            "waitMsMax": round(self.wait_ms_max, 1),
+        }
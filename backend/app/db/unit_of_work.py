@@ -0,0 +1,71 @@
+"""One transaction per unit of work: repositories flush, the owner commits.
+
+Repository methods never commit; whoever opened the session does, once, when
+its work succeeded — ``get_db`` at the end of a request, background jobs and
+scripts through ``unit_of_work()``. A multi-step write therefore lands
+atomically with a single commit, and a failure halfway rolls all of it back.
+Callers that want to survive a failed step ask for a savepoint with
+``session.begin_nested()``.
+
+Side effects that must not be observed before the data is (dropping cache
+entries) are deferred with ``after_commit`` and discarded on rollback.
+"""
+
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.engine import get_read_only_session_factory, get_session_factory
+
+_HOOKS = "after_commit_hooks"
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """Run *callback* once the session's outermost transaction commits."""
+    session.info.setdefault(_HOOKS, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_hooks(session: Session) -> None:
+    if session.in_nested_transaction():
+        return  # a released savepoint; the real commit is still to come
+    for callback in session.info.pop(_HOOKS, ()):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_after_commit_hooks(session: Session) -> None:
+    # A rolled-back savepoint keeps the hooks: running one too many only
+    # costs a cache miss, whereas skipping one would serve stale data
+    if not session.in_nested_transaction():
+        session.info.pop(_HOOKS, None)
+
+
+@asynccontextmanager
+async def unit_of_work(*, read_only: bool = False) -> AsyncIterator[AsyncSession]:
+    """Yield a session whose work is committed once, when the block exits cleanly.
+
+    Any exception rolls the whole unit back. A *read_only* unit never
+    commits: its transaction is just ended when the session closes, which
+    spares the commit round trip, and it runs as ``READ ONLY`` when
+    DB_READ_ONLY_TRANSACTIONS is on.
+
+    No connection is taken from the pool until the first statement runs, so
+    a unit that is answered from a cache (or with a 304) never holds one.
+    """
+    if read_only and get_settings().DB_READ_ONLY_TRANSACTIONS:
+        factory = get_read_only_session_factory()
+    else:
+        factory = get_session_factory()
+    async with factory() as session:
+        try:
+            yield session
+            if not read_only:
+                await session.commit()
+        except BaseException:
+            await session.rollback()
+            raise
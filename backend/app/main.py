@@ -1,20 +1,27 @@
 from contextlib import asynccontextmanager
 from datetime import datetime
+from typing import Any
 
-from fastapi import FastAPI
-from fastapi.middleware.gzip import GZipMiddleware
+from fastapi import Depends, FastAPI
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
+from app.api.deps import get_current_admin
 from app.api.v1.router import api_v1_router
 from app.core.config import get_settings
 from app.core.exceptions import register_exception_handlers
 from app.core.logging import configure_logging, get_logger
+from app.core.metrics import collect_metrics
 from app.db.engine import close_engine, get_engine
 from app.middleware.cors import setup_cors
+from app.middleware.gzip import SelectiveGZipMiddleware
 from app.middleware.rate_limit import limiter
 from app.middleware.request_id import RequestIDMiddleware
 from app.middleware.security_headers import SecurityHeadersMiddleware
+from app.services.image_derivatives import shutdown_derivative_pool
+from app.services.like_buffer import start_like_buffer, stop_like_buffer
+from app.services.password_hasher import shutdown_password_hasher
+from app.services.scheduler import start_scheduler, stop_scheduler
 
 logger = get_logger(__name__)
 
@@ -25,7 +32,13 @@ async def lifespan(app: FastAPI):  # type: ignore[type-arg]
     configure_logging()
     get_engine()
     logger.info("Database engine initialized")
+    start_like_buffer()
+    start_scheduler()
     yield
+    await stop_scheduler()
+    await stop_like_buffer()  # needs the engine for its final flush
+    shutdown_derivative_pool()
+    shutdown_password_hasher()
     await close_engine()
     logger.info("Database engine disposed")
 
@@ -49,7 +62,11 @@ def create_app() -> FastAPI:
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore[arg-type]
 
     # ── Middleware (last registered = innermost) ─────────────────────────────
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    app.add_middleware(
+        SelectiveGZipMiddleware,
+        minimum_size=1000,
+        exclude_prefixes=("/api/v1/images/",),
+    )
     setup_cors(app, settings)
     app.add_middleware(SecurityHeadersMiddleware)
     app.add_middleware(RequestIDMiddleware)
@@ -65,6 +82,11 @@ def create_app() -> FastAPI:
     async def health() -> dict:
         return {"status": "ok", "timestamp": datetime.utcnow().isoformat()}
 
+    # ── Metrics (per-worker snapshot, admins only) ───────────────────────────
+    @app.get("/metrics", include_in_schema=False, dependencies=[Depends(get_current_admin)])
+    async def metrics() -> dict[str, Any]:
+        return collect_metrics()
+
     return app
 
 
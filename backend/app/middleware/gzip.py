@@ -0,0 +1,25 @@
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZip compression that skips paths serving already-compressed payloads.
+
+    Recompressing images wastes CPU and would break ``Range`` responses, whose
+    offsets refer to the uncompressed bytes.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        exclude_prefixes: tuple[str, ...] = (),
+    ) -> None:
+        super().__init__(app, minimum_size=minimum_size)
+        self._exclude_prefixes = exclude_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self._exclude_prefixes):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
@@ -0,0 +1,43 @@
+from datetime import datetime
+
+from sqlalchemy import ColumnElement, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import CollectionVersion
+
+
+async def bump_versions(session: AsyncSession, *names: str) -> None:
+    """Advance the change marker of each collection in *names*.
+
+    Runs in the caller's transaction (never commits). Names are bumped in a
+    fixed order so concurrent writers touching several markers cannot deadlock.
+    """
+    for name in sorted(set(names)):
+        stmt = pg_insert(CollectionVersion).values(name=name)
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["name"],
+                set_={
+                    "version": CollectionVersion.version + 1,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+
+def collection_version_column(name: str) -> ColumnElement[int]:
+    """The version of *name* as a scalar subquery, to ride along another query."""
+    version = select(CollectionVersion.version).where(CollectionVersion.name == name)
+    return func.coalesce(version.scalar_subquery(), 0)
+
+
+async def get_collection_version(session: AsyncSession, name: str) -> tuple[int, datetime | None]:
+    """Return ``(version, updated_at)`` for *name*; ``(0, None)`` if never written."""
+    result = await session.execute(
+        select(CollectionVersion.version, CollectionVersion.updatedAt).where(
+            CollectionVersion.name == name
+        )
+    )
+    row = result.first()
+    return (row.version, row.updatedAt) if row else (0, None)
@@ -1,15 +1,38 @@
-from sqlalchemy import delete, func, select
+from datetime import datetime
+from functools import partial
+
+from sqlalchemy import (
+    BigInteger,
+    Select,
+    cast,
+    delete,
+    func,
+    literal,
+    literal_column,
+    select,
+    true,
+    tuple_,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import aliased, joinedload
 
 from app.db.models import Comment
+from app.db.unit_of_work import after_commit
+from app.repositories.post_counter_repository import PostCounterRepository
+from app.services.post_cache import invalidate_post
+
+# Nesting levels per request, and replies previewed under each comment: a
+# page of N comments never renders more than N * sum(REPLY_PREVIEW ** k) rows
+MAX_THREAD_DEPTH = 5
+REPLY_PREVIEW = 3
 
 
 class CommentRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
+        self._counters = PostCounterRepository(session)
 
-    async def _fetch_with_reply_counts(self, query) -> list[Comment]:
+    async def _fetch_with_reply_counts(self, query: Select[tuple[Comment]]) -> list[Comment]:
         """Execute a comment query and annotate each result with its reply count."""
         result = await self._session.execute(
             query.options(joinedload(Comment.author))
@@ -29,19 +52,87 @@ class CommentRepository:
 
         return comments
 
-    async def find_by_post(
+    async def find_page(
         self,
         post_id: str,
         *,
         parent_id: str | None = None,
-    ) -> list[Comment]:
-        """Return top-level comments (parent_id=None) or replies to a comment."""
-        query = (
-            select(Comment)
+        after: tuple[datetime, str] | None = None,
+        limit: int,
+        depth: int = 1,
+        preview: int = REPLY_PREVIEW,
+    ) -> tuple[list[Comment], bool]:
+        """One page of the comments under *parent_id* (top-level when None).
+
+        Each page comment comes with its first *preview* replies, recursively
+        down to *depth* levels, all in one query: a recursive CTE whose
+        recursive step takes the first replies of each node through a
+        ``LATERAL ... LIMIT``, so every step is a bounded range scan on
+        ``ix_comments_thread``. Every row carries its full reply count (a
+        correlated count) so callers can tell where the tree was cut off.
+
+        Returns the rows ordered by ``(created_at, id)`` and whether another
+        page follows *after* the last one.
+        """
+        page_query = (
+            select(
+                Comment.id.label("id"),
+                func.row_number().over(order_by=(Comment.createdAt, Comment.id)).label("pos"),
+            )
             .where(Comment.postId == post_id, Comment.parentId == parent_id)
-            .order_by(Comment.createdAt.asc())
+            .order_by(Comment.createdAt, Comment.id)
+            .limit(limit + 1)  # one extra row only to learn whether more follow
+        )
+        if after is not None:
+            created_at, comment_id = after
+            page_query = page_query.where(
+                tuple_(Comment.createdAt, Comment.id)
+                > tuple_(
+                    literal(created_at, Comment.createdAt.type),
+                    literal(comment_id, Comment.id.type),
+                )
+            )
+        page = page_query.subquery("page")
+
+        tree = select(page.c.id, literal_column("1").label("level"), page.c.pos).cte(
+            "thread", recursive=True
+        )
+        child = aliased(Comment)
+        replies = (
+            select(child.id)
+            .where(child.postId == post_id, child.parentId == tree.c.id)
+            .order_by(child.createdAt, child.id)
+            .limit(preview)
+            .lateral("replies")
         )
-        return await self._fetch_with_reply_counts(query)
+        tree = tree.union_all(
+            select(replies.c.id, tree.c.level + 1, cast(literal_column("0"), BigInteger))
+            .select_from(tree)
+            .join(replies, true())
+            .where(tree.c.level < depth, tree.c.pos <= limit)
+        )
+
+        reply = aliased(Comment)
+        reply_count = (
+            select(func.count())
+            .where(reply.parentId == Comment.id)
+            .correlate(Comment)
+            .scalar_subquery()
+        )
+        result = await self._session.execute(
+            select(Comment, reply_count.label("reply_count"), tree.c.pos)
+            .join(tree, tree.c.id == Comment.id)
+            .options(joinedload(Comment.author))
+            .order_by(Comment.createdAt, Comment.id)
+        )
+        comments, has_more = [], False
+        for comment, count, pos in result.all():
+            if pos > limit:
+                has_more = True
+                continue
+            comment.reply_count = count
+            comments.append(comment)
+        return comments, has_more
 
     async def get_by_id(self, comment_id: str) -> Comment | None:
         query = select(Comment).where(Comment.id == comment_id)
@@ -63,12 +154,28 @@ class CommentRepository:
             parentId=parent_id,
         )
         self._session.add(comment)
-        await self._session.commit()
-        # Reload with author and reply count
-        return await self.get_by_id(comment.id)  # type: ignore[return-value]
+        await self._session.flush()  # INSERT ... RETURNING created_at
+        await self._counters.apply(post_id, comments=1)
+        after_commit(self._session, partial(invalidate_post, post_id))
+        return comment  # a new comment has no replies: reply_count stays 0
 
-    async def delete(self, comment_id: str) -> None:
-        await self._session.execute(
-            delete(Comment).where(Comment.id == comment_id)
+    async def owner_of(self, comment_id: str) -> str | None:
+        """Return the author's user ID, or None if the comment does not exist."""
+        result = await self._session.execute(
+            select(Comment.authorId).where(Comment.id == comment_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def delete(self, comment_id: str, *, author_id: str) -> bool:
+        """Delete the comment if *author_id* wrote it; return whether it was deleted."""
+        result = await self._session.execute(
+            delete(Comment)
+            .where(Comment.id == comment_id, Comment.authorId == author_id)
+            .returning(Comment.postId)
         )
-        await self._session.commit()
+        post_id = result.scalar_one_or_none()
+        if post_id is None:
+            return False
+        await self._counters.apply(post_id, comments=-1)
+        after_commit(self._session, partial(invalidate_post, post_id))
+        return True
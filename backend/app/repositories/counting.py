@@ -0,0 +1,70 @@
+from collections.abc import Hashable
+from typing import Any
+
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import LRUCache
+from app.core.config import get_settings
+from app.schemas.common import CountStrategy
+
+# Exact totals keyed by (namespace, *filters). Per worker; the TTL bounds how
+# long another worker's writes can go unnoticed.
+_count_cache: LRUCache[int] = LRUCache(maxsize=1024, ttl=get_settings().COUNT_CACHE_TTL_SECONDS)
+
+
+def invalidate_counts(namespace: str) -> None:
+    """Forget every cached total for *namespace* (call after inserts/deletes)."""
+    _count_cache.delete_where(lambda key: key[0] == namespace)  # type: ignore[index]
+
+
+async def _exact(session: AsyncSession, query: Select[Any]) -> int:
+    result = await session.execute(
+        select(func.count()).select_from(query.order_by(None).subquery())
+    )
+    return result.scalar_one()
+
+
+async def _estimate(session: AsyncSession, table: str) -> int | None:
+    """Planner row estimate from ``pg_class`` — None if the table was never analysed."""
+    result = await session.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:t AS regclass)"),
+        {"t": table},
+    )
+    estimate = result.scalar_one_or_none()
+    return estimate if estimate is not None and estimate >= 0 else None
+
+
+async def count_rows(
+    session: AsyncSession,
+    query: Select[Any],
+    *,
+    strategy: CountStrategy,
+    key: tuple[Hashable, ...],
+    table: str,
+    filtered: bool,
+) -> int | None:
+    """Resolve the total for *query* according to *strategy*.
+
+    *key* is ``(namespace, *filter_values)`` and identifies the filtered set in
+    the cache. Returns None for ``NONE`` and for ``WINDOW``, where the caller
+    adds ``count(*) OVER ()`` to its page query instead.
+    """
+    if strategy in (CountStrategy.NONE, CountStrategy.WINDOW):
+        return None
+
+    if strategy == CountStrategy.ESTIMATE and not filtered:
+        estimate = await _estimate(session, table)
+        if estimate is not None:
+            return estimate
+        strategy = CountStrategy.CACHED
+
+    if strategy != CountStrategy.EXACT:
+        cached = _count_cache.get(key)
+        if cached is not None:
+            return cached
+
+    total = await _exact(session, query)
+    if strategy != CountStrategy.EXACT:
+        _count_cache.set(key, total)
+    return total
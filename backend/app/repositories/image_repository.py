@@ -0,0 +1,79 @@
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import select, union, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.db.models import Image, ImageVariant
+
+# set_committed_value is unannotated upstream
+_set_committed: Callable[[object, str, Any], None] = set_committed_value
+
+
+async def attach_image_asset(session: AsyncSession, entity: object) -> None:
+    """Populate ``entity.imageAsset`` from its ``imageRef`` after a RETURNING write.
+
+    Rows returned by ``INSERT/UPDATE ... RETURNING`` carry no joined
+    relationships; this avoids an implicit lazy load (and skips the query
+    entirely when there is no stored image or it is already in the session).
+    """
+    image_ref = entity.imageRef  # type: ignore[attr-defined]
+    asset = await session.get(Image, image_ref) if image_ref else None
+    _set_committed(entity, "imageAsset", asset)
+
+
+class ImageRepository:
+    """Image metadata. Nothing here commits — rows are committed together with
+    the post or project that references them."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def known_hashes(self, hashes: list[str]) -> set[str]:
+        """The subset of *hashes* recorded as an image or as a variant of one."""
+        if not hashes:
+            return set()
+        result = await self._session.execute(
+            union(
+                select(Image.hash).where(Image.hash.in_(hashes)),
+                select(ImageVariant.hash).where(ImageVariant.hash.in_(hashes)),
+            )
+        )
+        return set(result.scalars().all())
+
+    async def register(self, *, image_hash: str, content_type: str, byte_size: int) -> bool:
+        """Record a stored blob. Returns False if it was already known."""
+        result = await self._session.execute(
+            pg_insert(Image)
+            .values(hash=image_hash, content_type=content_type, byte_size=byte_size)
+            .on_conflict_do_nothing(index_elements=["hash"])
+            .returning(Image.hash)
+        )
+        return result.first() is not None
+
+    async def save_derivatives(
+        self,
+        image_hash: str,
+        *,
+        width: int,
+        height: int,
+        placeholder: str,
+        variants: list[dict[str, Any]],
+    ) -> None:
+        """Store dimensions, placeholder and variant rows for *image_hash*.
+
+        *variants* are ``{"width", "format", "hash", "byte_size"}`` dicts.
+        """
+        await self._session.execute(
+            update(Image)
+            .where(Image.hash == image_hash)
+            .values(width=width, height=height, placeholder=placeholder)
+        )
+        if variants:
+            await self._session.execute(
+                pg_insert(ImageVariant)
+                .values([{"source_hash": image_hash, **v} for v in variants])
+                .on_conflict_do_nothing(index_elements=["source_hash", "width", "format"])
+            )
@@ -0,0 +1,25 @@
+from datetime import timedelta
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import JobRun
+
+
+async def claim_job_run(session: AsyncSession, name: str, *, min_gap: float) -> bool:
+    """Record a run of job *name* unless one started less than *min_gap* seconds ago.
+
+    Returns whether this caller claimed the run. A single upsert, so two
+    workers can never both claim the same period. Runs in the caller's
+    transaction (never commits).
+    """
+    stmt = pg_insert(JobRun).values(name=name)
+    result = await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={"last_run_at": func.now()},
+            where=JobRun.lastRunAt <= func.now() - timedelta(seconds=min_gap),
+        ).returning(JobRun.name)
+    )
+    return result.first() is not None
@@ -0,0 +1,131 @@
+import random
+
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.db.models import Comment, Post, PostCounterDelta, PostLike
+
+
+class PostCounterRepository:
+    """Maintains the denormalized ``like_count`` / ``comment_count`` on posts.
+
+    In ``direct`` mode every change is applied to the post row itself. In
+    ``sharded`` mode changes are upserted into one of ``POST_COUNTER_SHARDS``
+    rows of ``post_counter_deltas`` and folded into ``posts`` later, so bursts
+    on a single post spread their row locks instead of serialising on one.
+
+    Methods never commit — they run inside the caller's transaction.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        settings = get_settings()
+        self._sharded = settings.POST_COUNTER_MODE == "sharded"
+        self._shards = max(1, settings.POST_COUNTER_SHARDS)
+
+    @property
+    def sharded(self) -> bool:
+        return self._sharded
+
+    async def apply(self, post_id: str, *, likes: int = 0, comments: int = 0) -> None:
+        """Add *likes* / *comments* (may be negative) to the post's counters."""
+        if not likes and not comments:
+            return
+
+        if not self._sharded:
+            await self._session.execute(
+                update(Post)
+                .where(Post.id == post_id)
+                .values(
+                    likeCount=Post.likeCount + likes,
+                    commentCount=Post.commentCount + comments,
+                    # Counter changes are not content edits
+                    updatedAt=Post.updatedAt,
+                )
+            )
+            return
+
+        stmt = pg_insert(PostCounterDelta).values(
+            post_id=post_id,
+            shard=random.randrange(self._shards),
+            like_delta=likes,
+            comment_delta=comments,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["post_id", "shard"],
+            set_={
+                "like_delta": PostCounterDelta.likeDelta + stmt.excluded.like_delta,
+                "comment_delta": PostCounterDelta.commentDelta + stmt.excluded.comment_delta,
+            },
+        )
+        await self._session.execute(stmt)
+
+    async def pending(self, post_ids: list[str]) -> dict[str, tuple[int, int]]:
+        """Return not-yet-folded ``(likes, comments)`` deltas per post."""
+        if not self._sharded or not post_ids:
+            return {}
+        result = await self._session.execute(
+            select(
+                PostCounterDelta.postId,
+                func.sum(PostCounterDelta.likeDelta).label("likes"),
+                func.sum(PostCounterDelta.commentDelta).label("comments"),
+            )
+            .where(PostCounterDelta.postId.in_(post_ids))
+            .group_by(PostCounterDelta.postId)
+        )
+        return {row.postId: (int(row.likes), int(row.comments)) for row in result}
+
+    async def fold(self) -> int:
+        """Move all shard deltas into ``posts`` atomically. Returns posts touched."""
+        drained = (
+            delete(PostCounterDelta)
+            .returning(
+                PostCounterDelta.postId,
+                PostCounterDelta.likeDelta,
+                PostCounterDelta.commentDelta,
+            )
+            .cte("drained")
+        )
+        summed = (
+            select(
+                drained.c.post_id,
+                func.sum(drained.c.like_delta).label("likes"),
+                func.sum(drained.c.comment_delta).label("comments"),
+            )
+            .group_by(drained.c.post_id)
+            .subquery("summed")
+        )
+        result = await self._session.execute(
+            update(Post)
+            .where(Post.id == summed.c.post_id)
+            .values(
+                likeCount=Post.likeCount + summed.c.likes,
+                commentCount=Post.commentCount + summed.c.comments,
+                updatedAt=Post.updatedAt,
+            )
+            .add_cte(drained)
+        )
+        return result.rowcount
+
+    async def reconcile(self) -> int:
+        """Recompute every post's counters from ``post_likes`` / ``comments``.
+
+        Pending shard deltas are discarded since the recount already includes
+        them. Returns the number of posts whose counters were corrected.
+        """
+        await self._session.execute(delete(PostCounterDelta))
+
+        likes = (
+            select(func.count()).where(PostLike.postId == Post.id).correlate(Post).scalar_subquery()
+        )
+        comments = (
+            select(func.count()).where(Comment.postId == Post.id).correlate(Post).scalar_subquery()
+        )
+        result = await self._session.execute(
+            update(Post)
+            .where(or_(Post.likeCount != likes, Post.commentCount != comments))
+            .values(likeCount=likes, commentCount=comments, updatedAt=Post.updatedAt)
+        )
+        return result.rowcount
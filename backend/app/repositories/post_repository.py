@@ -1,148 +1,484 @@
-from sqlalchemy import delete, func, select, update
+from collections import Counter
+from collections.abc import Callable
+from datetime import datetime
+from functools import partial
+from typing import Any, NamedTuple, TypeVar
+
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    String,
+    and_,
+    column,
+    delete,
+    exists,
+    false,
+    func,
+    literal,
+    select,
+    tuple_,
+    update,
+    values,
+)
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm import joinedload, lazyload, load_only, selectinload, with_expression
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql import Executable
+
+from app.db.models import Post, PostLike, PostTag, Tag, User
+from app.db.unit_of_work import after_commit
+from app.repositories.collection_versions import (
+    bump_versions,
+    collection_version_column,
+    get_collection_version,
+)
+from app.repositories.counting import count_rows, invalidate_counts
+from app.repositories.image_repository import attach_image_asset
+from app.repositories.post_counter_repository import PostCounterRepository
+from app.repositories.tag_repository import TagRepository
+from app.schemas.common import CountStrategy
+from app.services.post_cache import PostVersion, invalidate_post
+
+EXCERPT_LENGTH = 280
+
+
+def post_version(post: Post) -> PostVersion:
+    return (post.updatedAt, post.likeCount, post.commentCount, post.author.displayName)
+
 
-from app.db.models import Post, PostLike, PostTag, Tag
+# set_committed_value is unannotated upstream
+_set_committed: Callable[[object, str, Any], None] = set_committed_value
+
+# Any select over Post: entity rows, version tuples, ...
+SelectT = TypeVar("SelectT", bound=Select[Any])
+
+
+def _before(after: tuple[datetime, str]) -> ColumnElement[bool]:
+    """Keyset condition: rows strictly older than the ``(created_at, id)`` cursor."""
+    created_at, post_id = after
+    return tuple_(Post.createdAt, Post.id) < tuple_(
+        literal(created_at, Post.createdAt.type), literal(post_id, Post.id.type)
+    )
+
+
+class PostPage(NamedTuple):
+    posts: list[Post]
+    total: int | None
+    has_more: bool
+    # posts collection marker, read by the page query itself
+    collection_version: int
 
 
 class PostRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
+        self._counters = PostCounterRepository(session)
+        self._tags = TagRepository(session)
+
+    def _base_query(self) -> Select[tuple[Post]]:
+        """Base select with all relations needed for PostResponse.
 
-    def _base_query(self):
-        """Base select with all relations needed for PostResponse."""
+        Like and comment totals come from the denormalized counter columns,
+        so the like and comment rows themselves are never loaded.
+        """
         return select(Post).options(
             joinedload(Post.author),
             selectinload(Post.tags).joinedload(PostTag.tag),
-            selectinload(Post.likes),
-            selectinload(Post.comments),
         )
 
+    def summary_query(self) -> Select[tuple[Post]]:
+        """Card-view select: no body — just what PostSummaryResponse needs."""
+        return select(Post).options(
+            load_only(
+                Post.id,
+                Post.title,
+                Post.image,
+                Post.imageRef,
+                Post.likeCount,
+                Post.commentCount,
+                Post.createdAt,
+                Post.updatedAt,
+                Post.authorId,
+            ),
+            with_expression(Post.excerpt, func.substr(Post.body, 1, EXCERPT_LENGTH)),
+            joinedload(Post.author).load_only(User.displayName),
+            selectinload(Post.tags).joinedload(PostTag.tag),
+        )
+
+    async def apply_filters(
+        self,
+        query: SelectT,
+        *,
+        tags: list[str] | None = None,
+        match_all: bool = True,
+        author_id: str | None = None,
+    ) -> SelectT:
+        """Restrict a select over ``Post`` to one author and/or a set of tags.
+
+        Tag names are resolved to IDs first (cached), so each condition is an
+        ``EXISTS`` probe on the ``(tag_id, post_id)`` index instead of a join
+        on ``tags.name``. *match_all* requires every tag, otherwise any one.
+        """
+        if author_id:
+            query = query.where(Post.authorId == author_id)
+
+        if tags:
+            tag_ids = await self._tags.ids_for_names(tags)
+            if not tag_ids or (match_all and len(tag_ids) < len(set(tags))):
+                # An unknown tag can never be matched
+                return query.where(false())
+            if match_all:
+                query = query.where(
+                    and_(
+                        *(
+                            exists().where(PostTag.postId == Post.id, PostTag.tagId == tag_id)
+                            for tag_id in tag_ids.values()
+                        )
+                    )
+                )
+            else:
+                query = query.where(
+                    exists().where(
+                        PostTag.postId == Post.id,
+                        PostTag.tagId.in_(list(tag_ids.values())),
+                    )
+                )
+        return query
+
+    async def apply_pending_counts(self, posts: list[Post]) -> None:
+        """Add not-yet-folded shard deltas to the loaded counters (sharded mode)."""
+        pending = await self._counters.pending([p.id for p in posts])
+        for post in posts:
+            if post.id in pending:
+                likes, comments = pending[post.id]
+                _set_committed(post, "likeCount", post.likeCount + likes)
+                _set_committed(post, "commentCount", post.commentCount + comments)
+
     async def find_many(
         self,
         *,
-        tag_filter: str | None = None,
+        tags: list[str] | None = None,
+        match_all: bool = True,
         author_id: str | None = None,
         skip: int = 0,
         take: int = 20,
-    ) -> tuple[list[Post], int]:
-        query = self._base_query()
+        after: tuple[datetime, str] | None = None,
+        count: CountStrategy = CountStrategy.EXACT,
+        summary: bool = False,
+    ) -> PostPage:
+        """Return a page of posts ordered newest first.
 
-        if author_id:
-            query = query.where(Post.authorId == author_id)
+        With *after* (a decoded keyset cursor) the page starts right after that
+        ``(created_at, id)`` key and *skip* is ignored. *total* is resolved per
+        *count* and may be None. *summary* loads the card-view projection only.
+        The posts collection version comes back with the rows, so a validator
+        can be built without another query.
+        """
+        query = await self.apply_filters(
+            self.summary_query() if summary else self._base_query(),
+            tags=tags,
+            match_all=match_all,
+            author_id=author_id,
+        )
 
-        if tag_filter:
-            tag_subq = (
-                select(PostTag.postId)
-                .join(Tag, PostTag.tagId == Tag.id)
-                .where(
-                    PostTag.postId == Post.id,
-                    func.lower(Tag.name) == tag_filter.strip().lower(),
+        if count == CountStrategy.WINDOW and after is not None:
+            # Past a cursor the window would only see the remaining rows
+            count = CountStrategy.CACHED
+
+        count_key = ("posts", author_id, tuple(sorted(set(tags or ()))), match_all)
+        filtered_query = query
+        total = await count_rows(
+            self._session,
+            filtered_query,
+            strategy=count,
+            key=count_key,
+            table="posts",
+            filtered=bool(author_id or tags),
+        )
+        if count == CountStrategy.WINDOW:
+            query = query.add_columns(func.count().over().label("total"))
+
+        query = query.where(_before(after)) if after is not None else query.offset(skip)
+
+        # One extra row tells us whether another page exists
+        query = (
+            query.add_columns(collection_version_column("posts").label("collection_version"))
+            .order_by(Post.createdAt.desc(), Post.id.desc())
+            .limit(take + 1)
+        )
+        rows = (await self._session.execute(query)).unique().all()
+        posts = [row[0] for row in rows]
+        if rows:
+            version = rows[0].collection_version
+        else:
+            version, _ = await self.collection_version()
+        if count == CountStrategy.WINDOW:
+            if rows:
+                total = rows[0].total
+            elif skip == 0:
+                total = 0
+            else:
+                # Past the end: the window has no row to report on
+                total = await count_rows(
+                    self._session,
+                    filtered_query,
+                    strategy=CountStrategy.CACHED,
+                    key=count_key,
+                    table="posts",
+                    filtered=True,
                 )
-            )
-            query = query.where(tag_subq.exists())
+        has_more = len(posts) > take
+        posts = posts[:take]
+        await self.apply_pending_counts(posts)
+
+        return PostPage(posts, total, has_more, version)
 
-        count_query = select(func.count()).select_from(
-            query.order_by(None).options().subquery()
+    async def page_versions(
+        self,
+        *,
+        tags: list[str] | None = None,
+        match_all: bool = True,
+        author_id: str | None = None,
+        skip: int = 0,
+        take: int = 20,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[tuple[str, PostVersion]]:
+        """Version keys of the rows ``find_many`` would return (plus the look-ahead row).
+
+        Reads only key columns and the author's name — no body, no tags — so
+        list revalidation costs a fraction of the page query.
+        """
+        query = await self.apply_filters(
+            select(
+                Post.id, Post.updatedAt, Post.likeCount, Post.commentCount, User.displayName
+            ).join(User, User.id == Post.authorId),
+            tags=tags,
+            match_all=match_all,
+            author_id=author_id,
         )
-        total_result = await self._session.execute(count_query)
-        total = total_result.scalar_one()
+        query = query.where(_before(after)) if after is not None else query.offset(skip)
+        query = query.order_by(Post.createdAt.desc(), Post.id.desc()).limit(take + 1)
+
+        rows = (await self._session.execute(query)).all()
+        pending = await self._counters.pending([row.id for row in rows])
+        versions = []
+        for row in rows:
+            likes, comments = pending.get(row.id, (0, 0))
+            versions.append(
+                (
+                    row.id,
+                    (
+                        row.updatedAt,
+                        row.likeCount + likes,
+                        row.commentCount + comments,
+                        row.displayName,
+                    ),
+                )
+            )
+        return versions
 
-        query = query.order_by(Post.createdAt.desc()).offset(skip).limit(take)
-        result = await self._session.execute(query)
-        posts = list(result.unique().scalars().all())
+    async def get_version(self, post_id: str) -> PostVersion | None:
+        """Cheap primary-key probe for the post's current version."""
+        result = await self._session.execute(
+            select(Post.updatedAt, Post.likeCount, Post.commentCount, User.displayName)
+            .join(User, User.id == Post.authorId)
+            .where(Post.id == post_id)
+        )
+        row = result.first()
+        if row is None:
+            return None
+        likes, comments = (await self._counters.pending([post_id])).get(post_id, (0, 0))
+        return (
+            row.updatedAt,
+            row.likeCount + likes,
+            row.commentCount + comments,
+            row.displayName,
+        )
 
-        return posts, total
+    async def collection_version(self) -> tuple[int, datetime | None]:
+        return await get_collection_version(self._session, "posts")
 
     async def get_by_id(self, post_id: str) -> Post | None:
         result = await self._session.execute(
             self._base_query().where(Post.id == post_id)
         )
-        return result.unique().scalar_one_or_none()
+        post = result.unique().scalar_one_or_none()
+        if post is not None:
+            await self.apply_pending_counts([post])
+        return post
 
-    async def _upsert_tag(self, tag_name: str) -> Tag:
-        """Get or create a tag by name."""
-        result = await self._session.execute(
-            select(Tag).where(Tag.name == tag_name)
-        )
-        tag = result.scalar_one_or_none()
-        if tag is None:
-            tag = Tag(name=tag_name)
-            self._session.add(tag)
-            await self._session.flush()
-        return tag
+    async def exists(self, post_id: str) -> bool:
+        """Primary-key probe; loads nothing."""
+        result = await self._session.execute(select(Post.id).where(Post.id == post_id))
+        return result.first() is not None
+
+    async def owner_of(self, post_id: str) -> str | None:
+        """Return the author's user ID, or None if the post does not exist."""
+        result = await self._session.execute(select(Post.authorId).where(Post.id == post_id))
+        return result.scalar_one_or_none()
+
+    async def _sync_tags(
+        self, post_id: str, names: list[str], *, current: set[str] | None = None
+    ) -> bool:
+        """Make the post's tag links match *names*; return whether any link changed.
+
+        Set-based: missing tags are created in one statement, then only the
+        added links are inserted and only the removed ones deleted. *current*
+        (the post's linked tag IDs) skips the lookup when already known.
+        """
+        wanted = set((await self._tags.ensure(names)).values())
+        if current is None:
+            result = await self._session.execute(
+                select(PostTag.tagId).where(PostTag.postId == post_id)
+            )
+            current = set(result.scalars().all())
+
+        added, removed = wanted - current, current - wanted
+        await self._tags.adjust_counts(added=added, removed=removed)
+        if removed:
+            await self._session.execute(
+                delete(PostTag).where(PostTag.postId == post_id, PostTag.tagId.in_(removed))
+            )
+        if added:
+            await self._session.execute(
+                pg_insert(PostTag)
+                .values([{"post_id": post_id, "tag_id": tag_id} for tag_id in added])
+                .on_conflict_do_nothing()
+            )
+        return bool(added or removed)
 
     async def create(
         self,
         *,
         title: str,
         image: str,
-        image_data: str | None = None,
+        image_ref: str | None = None,
         body: str,
         tags: list[str],
         author_id: str,
     ) -> Post:
-        post = Post(title=title, image=image, image_data=image_data, body=body, authorId=author_id)
+        post = Post(title=title, image=image, imageRef=image_ref, body=body, authorId=author_id)
         self._session.add(post)
-        await self._session.flush()  # get post.id before creating PostTags
+        await self._session.flush()  # INSERT ... RETURNING id and server defaults
+        await self._sync_tags(post.id, tags, current=set())
 
-        for tag_name in tags:
-            tag = await self._upsert_tag(tag_name)
-            self._session.add(PostTag(postId=post.id, tagId=tag.id))
-
-        await self._session.commit()
-        return await self.get_by_id(post.id)  # type: ignore[return-value]
+        await bump_versions(self._session, "posts", "tags")
+        after_commit(self._session, partial(invalidate_counts, "posts"))
+        await attach_image_asset(self._session, post)
+        return post
 
     async def update(
         self,
         post_id: str,
         *,
+        author_id: str,
         title: str | None = None,
         image: str | None = None,
-        image_data: str | None = None,
+        image_ref: str | None = None,
         body: str | None = None,
         tags: list[str] | None = None,
-    ) -> Post:
-        update_vals: dict = {}
+    ) -> tuple[Post, list[str]] | None:
+        """Apply the non-None fields if *author_id* owns the post.
+
+        Ownership is part of the write itself (``WHERE author_id = :me``);
+        returns None — with nothing written — when the post is missing or
+        owned by someone else. Setting *image* replaces the image source
+        entirely, so ``image_ref`` is written alongside it (None clears a
+        previously stored image).
+
+        The post comes back from ``UPDATE ... RETURNING`` together with its
+        tag names, so nothing is re-read afterwards.
+        """
+        update_vals: dict[str, Any] = {}
         if title is not None:
             update_vals["title"] = title
         if image is not None:
             update_vals["image"] = image
-        if image_data is not None:
-            update_vals["image_data"] = image_data
+            update_vals["imageRef"] = image_ref
+        elif image_ref is not None:
+            update_vals["imageRef"] = image_ref
         if body is not None:
             update_vals["body"] = body
 
+        owned = (Post.id == post_id) & (Post.authorId == author_id)
+        tag_names = (
+            select(func.array_agg(Tag.name))
+            .join(PostTag, PostTag.tagId == Tag.id)
+            .where(PostTag.postId == Post.id)
+            .correlate(Post)
+            .scalar_subquery()
+        )
+        guard: Executable
         if update_vals:
-            await self._session.execute(
-                update(Post).where(Post.id == post_id).values(**update_vals)
+            guard = update(Post).where(owned).values(**update_vals).returning(Post, tag_names)
+        else:
+            # nothing to set yet: just lock the row, as the UPDATE would
+            guard = (
+                select(Post, tag_names)
+                .where(owned)
+                .options(lazyload(Post.imageAsset))
+                .with_for_update(of=Post)
             )
+        row = (await self._session.execute(guard.execution_options(populate_existing=True))).first()
+        if row is None:
+            return None
+        post, current_tags = row
 
-        if tags is not None:
-            await self._session.execute(
-                delete(PostTag).where(PostTag.postId == post_id)
+        tags_changed = tags is not None and await self._sync_tags(post_id, tags)
+        if tags_changed and not update_vals:
+            # Tag edits are content edits too: move updated_at for validators
+            result = await self._session.execute(
+                update(Post)
+                .where(Post.id == post_id)
+                .values(updatedAt=func.now())
+                .returning(Post.updatedAt)
             )
-            for tag_name in tags:
-                tag = await self._upsert_tag(tag_name)
-                self._session.add(PostTag(postId=post_id, tagId=tag.id))
+            _set_committed(post, "updatedAt", result.scalar_one())
+        if update_vals or tags_changed:
+            await bump_versions(
+                self._session, "posts", *(("tags",) if tags_changed else ())
+            )
+        after_commit(self._session, partial(invalidate_post, post_id))
+        if tags_changed:
+            after_commit(self._session, partial(invalidate_counts, "posts"))
 
-        await self._session.commit()
-        return await self.get_by_id(post_id)  # type: ignore[return-value]
+        await self.apply_pending_counts([post])
+        await attach_image_asset(self._session, post)
+        return post, sorted(tags if tags is not None else current_tags or [])
 
-    async def delete(self, post_id: str) -> None:
-        await self._session.execute(delete(Post).where(Post.id == post_id))
-        await self._session.commit()
+    async def delete(self, post_id: str, *, author_id: str) -> bool:
+        """Delete the post if *author_id* owns it; return whether it was deleted."""
+        owned = (Post.id == post_id) & (Post.authorId == author_id)
+        # Unlink explicitly (rather than via ON DELETE CASCADE) to learn which
+        # tag counters to decrement; the ownership guard keeps a foreign
+        # post's links intact
+        result = await self._session.execute(
+            delete(PostTag)
+            .where(PostTag.postId == post_id, exists().where(owned))
+            .returning(PostTag.tagId)
+        )
+        removed = set(result.scalars().all())
+        result = await self._session.execute(delete(Post).where(owned).returning(Post.id))
+        if result.first() is None:
+            return False
+        await self._tags.adjust_counts(removed=removed)
+        await bump_versions(self._session, "posts", "tags")
+        after_commit(self._session, partial(invalidate_post, post_id))
+        after_commit(self._session, partial(invalidate_counts, "posts"))
+        return True
 
-    async def get_like_status(self, post_id: str, user_id: str) -> bool:
-        """Return True if *user_id* has liked *post_id*."""
+    async def liked_post_ids(self, user_id: str, post_ids: list[str]) -> set[str]:
+        """Return the subset of *post_ids* that *user_id* has liked (one query)."""
+        if not post_ids:
+            return set()
         result = await self._session.execute(
-            select(PostLike).where(
-                PostLike.postId == post_id,
+            select(PostLike.postId).where(
                 PostLike.userId == user_id,
+                PostLike.postId.in_(post_ids),
             )
         )
-        return result.scalar_one_or_none() is not None
+        return set(result.scalars().all())
 
     async def add_like(self, post_id: str, user_id: str) -> None:
         """Idempotent like — silently ignores duplicates."""
@@ -150,15 +486,88 @@ class PostRepository:
             pg_insert(PostLike)
             .values(post_id=post_id, user_id=user_id)
             .on_conflict_do_nothing(index_elements=["post_id", "user_id"])
+            .returning(PostLike.postId)
         )
-        await self._session.execute(stmt)
-        await self._session.commit()
+        result = await self._session.execute(stmt)
+        if result.first() is not None:
+            await self._counters.apply(post_id, likes=1)
+        after_commit(self._session, partial(invalidate_post, post_id))
 
     async def remove_like(self, post_id: str, user_id: str) -> None:
-        await self._session.execute(
-            delete(PostLike).where(
+        result = await self._session.execute(
+            delete(PostLike)
+            .where(
                 PostLike.postId == post_id,
                 PostLike.userId == user_id,
             )
+            .returning(PostLike.postId)
+        )
+        if result.first() is not None:
+            await self._counters.apply(post_id, likes=-1)
+        after_commit(self._session, partial(invalidate_post, post_id))
+
+    async def like_state(self, post_id: str, user_id: str) -> tuple[int, bool] | None:
+        """Return ``(like_count, liked_by_user)`` for the post, or None if it does not exist.
+
+        A single primary-key probe — the post itself is never loaded.
+        """
+        liked = exists().where(PostLike.postId == Post.id, PostLike.userId == user_id)
+        result = await self._session.execute(
+            select(Post.likeCount, liked.label("liked")).where(Post.id == post_id)
         )
-        await self._session.commit()
+        row = result.first()
+        if row is None:
+            return None
+        likes, _ = (await self._counters.pending([post_id])).get(post_id, (0, 0))
+        return row.likeCount + likes, row.liked
+
+    async def apply_like_batch(
+        self,
+        *,
+        likes: list[tuple[str, str]],
+        unlikes: list[tuple[str, str]],
+    ) -> set[str]:
+        """Apply coalesced ``(post_id, user_id)`` like/unlike intents.
+
+        Likes go in as a single ``INSERT ... SELECT ... ON CONFLICT DO NOTHING``
+        (joined to posts/users so intents for rows deleted meanwhile are
+        dropped instead of failing the batch); unlikes as one
+        ``DELETE ... USING (VALUES ...)``. Counters move by the rows actually
+        changed. Returns the IDs of posts whose likes changed.
+        """
+        deltas: Counter[str] = Counter()
+        if likes:
+            wanted = values(
+                column("post_id", String), column("user_id", String), name="wanted"
+            ).data(likes)
+            result = await self._session.execute(
+                pg_insert(PostLike)
+                .from_select(
+                    ["post_id", "user_id"],
+                    select(wanted.c.post_id, wanted.c.user_id)
+                    .join(Post, Post.id == wanted.c.post_id)
+                    .join(User, User.id == wanted.c.user_id),
+                )
+                .on_conflict_do_nothing(index_elements=["post_id", "user_id"])
+                .returning(PostLike.postId)
+            )
+            deltas.update(result.scalars().all())
+        if unlikes:
+            unwanted = values(
+                column("post_id", String), column("user_id", String), name="unwanted"
+            ).data(unlikes)
+            result = await self._session.execute(
+                delete(PostLike)
+                .where(
+                    PostLike.postId == unwanted.c.post_id,
+                    PostLike.userId == unwanted.c.user_id,
+                )
+                .returning(PostLike.postId)
+            )
+            deltas.subtract(result.scalars().all())
+
+        for post_id in sorted(deltas):  # stable lock order across flushes
+            await self._counters.apply(post_id, likes=deltas[post_id])
+        for post_id in deltas:
+            after_commit(self._session, partial(invalidate_post, post_id))
+        return {post_id for post_id, delta in deltas.items() if delta}
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
-from sqlalchemy import delete, func, select, update
+from datetime import datetime
+from functools import partial
+
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import Project
+from app.db.unit_of_work import after_commit
+from app.repositories.collection_versions import bump_versions, get_collection_version
+from app.repositories.counting import count_rows, invalidate_counts
+from app.repositories.image_repository import attach_image_asset
+from app.schemas.common import CountStrategy
 
 
 class ProjectRepository:
@@ -16,16 +24,23 @@ class ProjectRepository:
         featured_only: bool = False,
         skip: int = 0,
         take: int = 50,
-    ) -> tuple[list[Project], int]:
+        count: CountStrategy = CountStrategy.EXACT,
+    ) -> tuple[list[Project], int | None]:
         base_query = select(Project)
         if featured_only:
             base_query = base_query.where(Project.featured.is_(True))
 
-        count_query = select(func.count()).select_from(
-            base_query.order_by(None).subquery()
+        if count == CountStrategy.WINDOW:
+            # The window variant is only wired into the posts feed
+            count = CountStrategy.CACHED
+        total = await count_rows(
+            self._session,
+            base_query,
+            strategy=count,
+            key=("projects", featured_only),
+            table="projects",
+            filtered=featured_only,
         )
-        total_result = await self._session.execute(count_query)
-        total: int = total_result.scalar_one()
 
         data_query = (
             base_query
@@ -48,6 +63,17 @@ class ProjectRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_version(self, slug: str) -> tuple[str, datetime] | None:
+        """Cheap probe for ``(id, updated_at)`` of the project at *slug*."""
+        result = await self._session.execute(
+            select(Project.id, Project.updatedAt).where(Project.slug == slug)
+        )
+        row = result.first()
+        return (row.id, row.updatedAt) if row else None
+
+    async def collection_version(self) -> tuple[int, datetime | None]:
+        return await get_collection_version(self._session, "projects")
+
     async def slug_exists(self, slug: str, exclude_id: str | None = None) -> bool:
         query = select(Project.id).where(Project.slug == slug)
         if exclude_id:
@@ -58,22 +84,34 @@ class ProjectRepository:
     async def create(self, *, data: dict) -> Project:
         project = Project(**data)
         self._session.add(project)
-        await self._session.commit()
-        await self._session.refresh(project)
+        await self._session.flush()  # INSERT ... RETURNING id and server defaults
+        await bump_versions(self._session, "projects")
+        after_commit(self._session, partial(invalidate_counts, "projects"))
+        await attach_image_asset(self._session, project)
         return project
 
     async def update(self, project_id: str, *, data: dict) -> Project:
-        if data:
-            await self._session.execute(
-                update(Project).where(Project.id == project_id).values(**data)
-            )
-            await self._session.commit()
-        project = await self.get_by_id(project_id)
-        assert project is not None
+        if not data:
+            project = await self.get_by_id(project_id)
+            assert project is not None
+            return project
+        result = await self._session.execute(
+            update(Project)
+            .where(Project.id == project_id)
+            .values(**data)
+            .returning(Project)
+            .execution_options(populate_existing=True)
+        )
+        project = result.scalar_one()
+        await bump_versions(self._session, "projects")
+        if "featured" in data:
+            after_commit(self._session, partial(invalidate_counts, "projects"))
+        await attach_image_asset(self._session, project)
         return project
 
     async def delete(self, project_id: str) -> None:
         await self._session.execute(
             delete(Project).where(Project.id == project_id)
         )
-        await self._session.commit()
+        await bump_versions(self._session, "projects")
+        after_commit(self._session, partial(invalidate_counts, "projects"))
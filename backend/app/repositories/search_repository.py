@@ -0,0 +1,135 @@
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import ColumnElement, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import SEARCH_CONFIG, Post, PostTag, Tag
+from app.repositories.post_repository import PostRepository
+
+# Private-use code points mark highlighted terms in ts_headline output; the
+# service HTML-escapes the fragment and only then turns them into <mark> tags.
+HIGHLIGHT_START = "\ue000"
+HIGHLIGHT_STOP = "\ue001"
+
+_CONFIG: ColumnElement[Any] = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+
+_TITLE_HEADLINE = f"HighlightAll=true, StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}"
+_BODY_HEADLINE = (
+    'MaxFragments=2, MaxWords=30, MinWords=12, FragmentDelimiter=" … ", '
+    f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}"
+)
+
+
+@dataclass
+class SearchRow:
+    post: Post
+    rank: float
+    title: str  # ts_headline of the title (every match marked)
+    snippet: str  # best-matching body fragments
+
+
+class SearchRepository:
+    """Full-text search over ``posts.search_vector`` (GIN-indexed).
+
+    Every query filters with ``search_vector @@ tsquery`` so the index drives
+    the scan; ranking and highlighting only run on matching rows, and
+    ``ts_headline`` only on the rows of the requested page.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self._posts = PostRepository(session)
+
+    @staticmethod
+    def _tsquery(text: str) -> ColumnElement[Any]:
+        # websearch syntax: "quoted phrases", -exclusions and OR
+        return func.websearch_to_tsquery(_CONFIG, text)
+
+    async def search(
+        self,
+        text: str,
+        *,
+        tags: list[str] | None = None,
+        skip: int = 0,
+        take: int = 20,
+    ) -> tuple[list[SearchRow], int]:
+        """Return one page of matches, best first, and the total match count."""
+        tsquery = self._tsquery(text)
+        rank = func.ts_rank_cd(Post.searchVector, tsquery)
+        matches = await self._posts.apply_filters(
+            select(
+                Post.id.label("id"),
+                rank.label("rank"),
+                func.count().over().label("total"),
+            ).where(Post.searchVector.op("@@")(tsquery)),
+            tags=tags,
+        )
+        ranked = (
+            matches.order_by(rank.desc(), Post.createdAt.desc(), Post.id.desc())
+            .offset(skip)
+            .limit(take)
+            .subquery("ranked")
+        )
+
+        query = (
+            self._posts.summary_query()
+            .add_columns(
+                ranked.c.rank,
+                ranked.c.total,
+                func.ts_headline(_CONFIG, Post.title, tsquery, _TITLE_HEADLINE).label(
+                    "title_headline"
+                ),
+                func.ts_headline(_CONFIG, Post.body, tsquery, _BODY_HEADLINE).label(
+                    "body_headline"
+                ),
+            )
+            .join(ranked, ranked.c.id == Post.id)
+            .order_by(ranked.c.rank.desc(), Post.createdAt.desc(), Post.id.desc())
+        )
+        rows = (await self._session.execute(query)).all()
+        posts = [row[0] for row in rows]
+        await self._posts.apply_pending_counts(posts)
+
+        if rows:
+            total = rows[0].total
+        elif skip == 0:
+            total = 0
+        else:
+            # Past the last page the window has no row to report on
+            total = await self._count(tsquery, tags=tags)
+
+        hits = [
+            SearchRow(
+                post=row[0],
+                rank=float(row.rank),
+                title=row.title_headline,
+                snippet=row.body_headline,
+            )
+            for row in rows
+        ]
+        return hits, total
+
+    async def _count(self, tsquery: ColumnElement[Any], *, tags: list[str] | None) -> int:
+        query = await self._posts.apply_filters(
+            select(func.count()).select_from(Post).where(Post.searchVector.op("@@")(tsquery)),
+            tags=tags,
+        )
+        return (await self._session.execute(query)).scalar_one()
+
+    async def tag_facets(
+        self, text: str, *, tags: list[str] | None = None, limit: int = 20
+    ) -> list[tuple[str, int]]:
+        """Tags of all matching posts with how many matches carry each, most common first."""
+        tsquery = self._tsquery(text)
+        post_count = func.count(PostTag.postId)
+        query = await self._posts.apply_filters(
+            select(Tag.name, post_count.label("post_count"))
+            .join(PostTag, PostTag.tagId == Tag.id)
+            .join(Post, Post.id == PostTag.postId)
+            .where(Post.searchVector.op("@@")(tsquery)),
+            tags=tags,
+        )
+        query = query.group_by(Tag.name).order_by(post_count.desc(), Tag.name).limit(limit)
+        result = await self._session.execute(query)
+        return [(row.name, row.post_count) for row in result]
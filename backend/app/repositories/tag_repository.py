@@ -0,0 +1,126 @@
+from collections.abc import Collection
+from typing import Literal
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import LRUCache
+from app.core.metrics import register_metrics
+from app.db.models import PostTag, Tag, new_cuid
+
+# Tag name → ID. Tags are never renamed or deleted, so an entry can only go
+# stale by expiring; unknown names are not cached because they may be
+# created at any moment.
+_tag_ids: LRUCache[str] = LRUCache(maxsize=4096, ttl=3600)
+
+register_metrics("tagIdCache", lambda: {**_tag_ids.stats.as_dict(), "size": len(_tag_ids)})
+
+
+class TagRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def ids_for_names(self, names: list[str]) -> dict[str, str]:
+        """Map each existing tag name in *names* to its ID; unknown names are omitted.
+
+        Names are matched exactly — the write path stores them lower-cased —
+        so the lookup is served by the unique index on ``tags.name``.
+        """
+        found: dict[str, str] = {}
+        missing: list[str] = []
+        for name in dict.fromkeys(names):
+            tag_id = _tag_ids.get(name)
+            if tag_id is None:
+                missing.append(name)
+            else:
+                found[name] = tag_id
+
+        if missing:
+            result = await self._session.execute(
+                select(Tag.name, Tag.id).where(Tag.name.in_(missing))
+            )
+            for row in result:
+                _tag_ids.set(row.name, row.id)
+                found[row.name] = row.id
+        return found
+
+    async def ensure(self, names: list[str]) -> dict[str, str]:
+        """Map every name in *names* to a tag ID, creating the missing tags.
+
+        Missing tags are inserted in one ``INSERT ... ON CONFLICT DO NOTHING
+        RETURNING``. A name that a concurrent transaction inserted first comes
+        back empty from RETURNING and is read again afterwards, so racing
+        writers never hit the unique constraint. Never commits; IDs created
+        here are not cached until they are known to be committed.
+        """
+        found = await self.ids_for_names(names)
+        missing = [name for name in dict.fromkeys(names) if name not in found]
+        if not missing:
+            return found
+
+        result = await self._session.execute(
+            pg_insert(Tag)
+            .values([{"id": new_cuid(), "name": name} for name in missing])
+            .on_conflict_do_nothing(index_elements=["name"])
+            .returning(Tag.name, Tag.id)
+        )
+        found.update({row.name: row.id for row in result})
+
+        lost_race = [name for name in missing if name not in found]
+        if lost_race:
+            found.update(await self.ids_for_names(lost_race))
+        return found
+
+    async def adjust_counts(
+        self, *, added: Collection[str] = (), removed: Collection[str] = ()
+    ) -> None:
+        """Apply link changes to ``tags.post_count`` in the caller's transaction."""
+        for tag_ids, delta in ((added, 1), (removed, -1)):
+            if tag_ids:
+                await self._session.execute(
+                    update(Tag)
+                    .where(Tag.id.in_(sorted(tag_ids)))  # stable lock order
+                    .values(postCount=Tag.postCount + delta)
+                )
+
+    async def list_stats(
+        self,
+        *,
+        sort: Literal["count", "name"] = "count",
+        min_count: int = 1,
+        limit: int = 100,
+        after: tuple[int, str] | None = None,
+    ) -> tuple[list[Tag], bool]:
+        """Return ``(tags, has_more)`` from the maintained counters.
+
+        Both orders are keyset scans of an index (``(post_count DESC, name)``
+        or ``name``), so the cost depends on *limit*, not on the tag count.
+        *after* is the ``(post_count, name)`` key of the previous page's last tag.
+        """
+        query = select(Tag).where(Tag.postCount >= min_count)
+        if sort == "count":
+            if after is not None:
+                count, name = after
+                query = query.where(
+                    or_(Tag.postCount < count, and_(Tag.postCount == count, Tag.name > name))
+                )
+            query = query.order_by(Tag.postCount.desc(), Tag.name)
+        else:
+            if after is not None:
+                query = query.where(Tag.name > after[1])
+            query = query.order_by(Tag.name)
+
+        result = await self._session.execute(query.limit(limit + 1))
+        tags = list(result.scalars().all())
+        return tags[:limit], len(tags) > limit
+
+    async def reconcile_counts(self) -> int:
+        """Recompute every ``tags.post_count`` from ``post_tags``; returns tags corrected."""
+        linked = (
+            select(func.count()).where(PostTag.tagId == Tag.id).correlate(Tag).scalar_subquery()
+        )
+        result = await self._session.execute(
+            update(Tag).where(Tag.postCount != linked).values(postCount=linked)
+        )
+        return result.rowcount
@@ -1,9 +1,12 @@
-from datetime import UTC, datetime
+from datetime import datetime
+from functools import partial
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import DateTime, String, delete, exists, func, insert, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import RefreshToken
+from app.db.models import RefreshToken, User, new_cuid
+from app.db.unit_of_work import after_commit
+from app.services.principal_cache import invalidate_principal
 
 
 class TokenRepository:
@@ -19,7 +22,10 @@ class TokenRepository:
         user_agent: str | None = None,
         ip_address: str | None = None,
     ) -> RefreshToken:
+        token_id = new_cuid()
         token = RefreshToken(
+            id=token_id,
+            familyId=token_id,  # a login starts a new family
             tokenHash=token_hash,
             userId=user_id,
             expiresAt=expires_at,
@@ -27,49 +33,132 @@ class TokenRepository:
             ipAddress=ip_address,
         )
         self._session.add(token)
-        await self._session.commit()
-        await self._session.refresh(token)
+        await self._session.flush()  # server defaults come back via RETURNING
         return token
 
-    async def get_active_by_hash(self, token_hash: str) -> RefreshToken | None:
-        """Return the token only if it is not revoked and not expired."""
-        now = datetime.now(UTC)
-        result = await self._session.execute(
-            select(RefreshToken).where(
+    async def rotate(
+        self,
+        token_hash: str,
+        *,
+        new_hash: str,
+        expires_at: datetime,
+        user_agent: str | None = None,
+        ip_address: str | None = None,
+    ) -> User | None:
+        """Exchange an active refresh token for a new one in a single statement.
+
+        ``UPDATE ... SET revoked_at, rotated_at WHERE token_hash = :h AND
+        revoked_at IS NULL ... RETURNING`` retires the presented token, the
+        successor is inserted into the same family from that RETURNING, and
+        the owning user comes back with it — one round trip.
+        The row lock makes concurrent rotations of one token serialize: only
+        the first succeeds.
+
+        Returns None — with nothing changed — if the token is unknown,
+        expired, already revoked or rotated, or its user is inactive.
+        """
+        rotated = (
+            update(RefreshToken)
+            .where(
                 RefreshToken.tokenHash == token_hash,
                 RefreshToken.revokedAt.is_(None),
-                RefreshToken.expiresAt > now,
+                RefreshToken.expiresAt > func.now(),
+                exists().where(User.id == RefreshToken.userId, User.isActive),
             )
+            .values(revokedAt=func.now(), rotatedAt=func.now())
+            .returning(RefreshToken.userId, RefreshToken.familyId)
+            .cte("rotated")
+        )
+        issued = (
+            insert(RefreshToken)
+            .from_select(
+                [
+                    "id",
+                    "token_hash",
+                    "user_id",
+                    "family_id",
+                    "expires_at",
+                    "user_agent",
+                    "ip_address",
+                ],
+                select(
+                    literal(new_cuid(), String),
+                    literal(new_hash, String),
+                    rotated.c.user_id,
+                    rotated.c.family_id,
+                    literal(expires_at, DateTime(timezone=True)),
+                    literal(user_agent, String),
+                    literal(ip_address, String),
+                ),
+            )
+            .returning(RefreshToken.userId)
+            .cte("issued")
+        )
+        result = await self._session.execute(
+            select(User)
+            .join(issued, issued.c.user_id == User.id)
+            .execution_options(populate_existing=True)
         )
         return result.scalar_one_or_none()
 
+    async def get_by_hash(self, token_hash: str) -> RefreshToken | None:
+        """Return the token in whatever state it is (for explaining a failed rotation)."""
+        result = await self._session.execute(
+            select(RefreshToken).where(RefreshToken.tokenHash == token_hash)
+        )
+        return result.scalar_one_or_none()
+
+    async def revoke_family(self, family_id: str) -> int:
+        """Revoke every still-active token descended from the same login."""
+        result = await self._session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.familyId == family_id, RefreshToken.revokedAt.is_(None))
+            .values(revokedAt=func.now())
+        )
+        return result.rowcount
+
     async def revoke(self, token_hash: str) -> None:
         await self._session.execute(
             update(RefreshToken)
             .where(RefreshToken.tokenHash == token_hash)
-            .values(revokedAt=datetime.now(UTC))
+            .values(revokedAt=func.now())
         )
-        await self._session.commit()
 
     async def revoke_all_for_user(self, user_id: str) -> None:
-        """Revoke all active tokens for a user (logout from all devices)."""
+        """Revoke all active tokens for a user (logout from all devices).
+
+        Also bumps ``users.token_version`` so access tokens already handed
+        out stop working too, instead of living until they expire.
+        """
         await self._session.execute(
             update(RefreshToken)
             .where(
                 RefreshToken.userId == user_id,
                 RefreshToken.revokedAt.is_(None),
             )
-            .values(revokedAt=datetime.now(UTC))
+            .values(revokedAt=func.now())
         )
-        await self._session.commit()
+        await self._session.execute(
+            update(User).where(User.id == user_id).values(tokenVersion=User.tokenVersion + 1)
+        )
+        after_commit(self._session, partial(invalidate_principal, user_id))
+
+    async def purge_expired(self, *, batch_size: int = 1000) -> int:
+        """Delete up to *batch_size* expired tokens; returns how many were removed.
 
-    async def cleanup_expired(self) -> int:
-        """Delete expired tokens older than 7 days — call periodically."""
-        cutoff = datetime.now(UTC).replace(
-            hour=0, minute=0, second=0, microsecond=0
+        One batch through ``ix_refresh_tokens_expires_at`` (``DELETE ... WHERE
+        id IN (SELECT ... LIMIT n FOR UPDATE SKIP LOCKED)``): rows a concurrent
+        refresh holds are skipped rather than waited for. Callers commit
+        between batches so no lock is held for long.
+        """
+        doomed = (
+            select(RefreshToken.id)
+            .where(RefreshToken.expiresAt < func.now())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
         )
         result = await self._session.execute(
-            delete(RefreshToken).where(RefreshToken.expiresAt < cutoff)
+            delete(RefreshToken).where(RefreshToken.id.in_(doomed))
         )
-        await self._session.commit()
         return result.rowcount
@@ -1,7 +1,12 @@
-from sqlalchemy import exists, select
+from functools import partial
+from typing import Any
+
+from sqlalchemy import exists, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import User
+from app.db.unit_of_work import after_commit
+from app.services.principal_cache import invalidate_principal
 
 
 class UserRepository:
@@ -33,12 +38,46 @@ class UserRepository:
             passwordHash=password_hash,
         )
         self._session.add(user)
-        await self._session.commit()
-        await self._session.refresh(user)
+        await self._session.flush()  # server defaults come back via RETURNING
         return user
 
+    async def set_password_hash(self, user_id: str, password_hash: str) -> None:
+        await self._session.execute(
+            update(User).where(User.id == user_id).values(passwordHash=password_hash)
+        )
+
     async def email_exists(self, email: str) -> bool:
         result = await self._session.execute(
             select(exists().where(User.email == email))
         )
         return result.scalar_one()
+
+    async def set_flags(
+        self,
+        user_id: str,
+        *,
+        is_active: bool | None = None,
+        is_admin: bool | None = None,
+    ) -> User | None:
+        """Activate/deactivate or grant/revoke admin; returns None for unknown users.
+
+        Drops the cached principal on commit so this worker sees the change at once;
+        other workers pick it up within PRINCIPAL_CACHE_TTL_SECONDS.
+        """
+        values: dict[str, Any] = {}
+        if is_active is not None:
+            values["isActive"] = is_active
+        if is_admin is not None:
+            values["isAdmin"] = is_admin
+        if not values:
+            return await self.get_by_id(user_id)
+        result = await self._session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(**values)
+            .returning(User)
+            .execution_options(populate_existing=True)
+        )
+        user = result.scalar_one_or_none()
+        after_commit(self._session, partial(invalidate_principal, user_id))
+        return user
@@ -24,3 +24,18 @@ class CommentResponse(BaseModel):
     parentId: str | None
     createdAt: datetime
     replyCount: int = 0
+
+
+class CommentThreadResponse(CommentResponse):
+    """A comment with its replies nested up to the requested depth.
+
+    At the depth limit ``replies`` is empty even when ``replyCount`` is not.
+    """
+
+    replies: list["CommentThreadResponse"] = []
+
+
+class CommentPageResponse(BaseModel):
+    items: list[CommentThreadResponse]
+    # opaque token for the next page — pass back as ``cursor``
+    nextCursor: str | None = None
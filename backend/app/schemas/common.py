@@ -1,4 +1,5 @@
 import math
+from enum import Enum
 from typing import Generic, TypeVar
 
 from pydantic import BaseModel
@@ -6,21 +7,57 @@ from pydantic import BaseModel
 T = TypeVar("T")
 
 
+class CountStrategy(str, Enum):
+    """How a paginated listing resolves its ``total``.
+
+    - ``exact``: separate ``count(*)`` over the filtered set on every request.
+    - ``cached``: exact count, cached per filter and invalidated on writes.
+      Each miss is a full ``count(*)``, and the cache is per worker with a
+      COUNT_CACHE_TTL_SECONDS lifetime.
+    - ``estimate``: planner estimate for unfiltered lists (falls back to cached).
+    - ``window``: ``count(*) OVER ()`` computed by the page query itself.
+    - ``none``: skip counting; ``total`` and ``pages`` are null.
+    """
+
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATE = "estimate"
+    WINDOW = "window"
+    NONE = "none"
+
+
+def page_count(total: int | None, size: int) -> int | None:
+    """Number of pages of *size* needed for *total* items (None when uncounted)."""
+    if total is None:
+        return None
+    return math.ceil(total / size) if size > 0 else 0
+
+
 class PaginatedResponse(BaseModel, Generic[T]):
     items: list[T]
-    total: int
+    total: int | None
     page: int
     size: int
-    pages: int
+    pages: int | None
+    nextCursor: str | None = None  # pass back as ``cursor`` to fetch the next page
 
     @classmethod
-    def build(cls, items: list[T], total: int, page: int, size: int) -> "PaginatedResponse[T]":
+    def build(
+        cls,
+        items: list[T],
+        total: int | None,
+        page: int,
+        size: int,
+        next_cursor: str | None = None,
+    ) -> "PaginatedResponse[T]":
+        """Build a page; *total* is None when the count strategy skipped counting."""
         return cls(
             items=items,
             total=total,
             page=page,
             size=size,
-            pages=math.ceil(total / size) if size > 0 else 0,
+            pages=page_count(total, size),
+            nextCursor=next_cursor,
         )
 
 
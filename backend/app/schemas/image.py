@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class ImageVariantResponse(BaseModel):
+    """One entry of a srcset: ``<source type="image/{format}" srcset="{url} {width}w">``."""
+
+    url: str
+    width: int
+    format: str  # "avif" | "webp"
@@ -2,6 +2,14 @@ from datetime import datetime
 
 from pydantic import BaseModel, HttpUrl, field_validator, model_validator
 
+from app.schemas.image import ImageVariantResponse
+
+
+def parse_tag_names(*raw: str | None) -> list[str]:
+    """Split comma-separated tag query values into normalized, de-duplicated names."""
+    names = (name.strip().lower() for value in raw if value for name in value.split(","))
+    return list(dict.fromkeys(name for name in names if name))
+
 
 class PostCreate(BaseModel):
     title: str
@@ -77,8 +85,10 @@ class PostResponse(BaseModel):
 
     id: str
     title: str
-    image: str
-    image_data: str | None = None
+    image: str  # stored images resolve to their /images/{hash} URL
+    imageRef: str | None = None
+    imageVariants: list[ImageVariantResponse] = []
+    imagePlaceholder: str | None = None  # tiny blurred data: URI
     body: str
     tags: list[str]
     uid: str           # = authorId
@@ -87,3 +97,39 @@ class PostResponse(BaseModel):
     likeCount: int = 0
     commentCount: int = 0
     likedByMe: bool = False
+
+
+class PostSummaryResponse(BaseModel):
+    """Card-view shape for post lists (``view=summary``).
+
+    Same field names as ``PostResponse`` but without ``body``; ``excerpt``
+    holds the first characters of the body instead.
+    """
+
+    id: str
+    title: str
+    image: str
+    imageRef: str | None = None
+    imageVariants: list[ImageVariantResponse] = []
+    imagePlaceholder: str | None = None
+    excerpt: str
+    tags: list[str]
+    uid: str
+    createdBy: str
+    createdAt: datetime
+    likeCount: int = 0
+    commentCount: int = 0
+    likedByMe: bool = False
+
+
+class LikeStatusResponse(BaseModel):
+    """Like state right after a like/unlike, including not-yet-flushed likes."""
+
+    likeCount: int
+    likedByMe: bool
+
+
+class LikedPostsResponse(BaseModel):
+    """Subset of the requested post IDs liked by the current user."""
+
+    likedPostIds: list[str]
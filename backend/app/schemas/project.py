@@ -6,6 +6,8 @@ from typing import Any
 
 from pydantic import BaseModel, field_validator, model_validator
 
+from app.schemas.image import ImageVariantResponse
+
 
 class TechStackItem(BaseModel):
     name: str
@@ -102,8 +104,10 @@ class ProjectResponse(BaseModel):
     category: str
     url: str
     githubUrl: str | None
-    image: str
-    image_data: str | None = None
+    image: str  # stored images resolve to their /images/{hash} URL
+    imageRef: str | None = None
+    imageVariants: list[ImageVariantResponse] = []
+    imagePlaceholder: str | None = None  # tiny blurred data: URI
     tags: list[str]
     techStack: list[dict[str, Any]]
     stats: list[dict[str, Any]]
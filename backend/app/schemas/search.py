@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+
+from app.schemas.common import PaginatedResponse
+from app.schemas.post import PostSummaryResponse
+
+
+class SearchHit(PostSummaryResponse):
+    """A matching post in card-view shape plus its relevance and highlights.
+
+    ``titleHighlight`` and ``snippet`` are HTML-escaped text in which the
+    matched terms are wrapped in ``<mark>`` tags.
+    """
+
+    rank: float
+    titleHighlight: str
+    snippet: str
+
+
+class TagFacet(BaseModel):
+    name: str
+    count: int  # matching posts carrying this tag
+
+
+class SearchResponse(PaginatedResponse[SearchHit]):
+    query: str = ""
+    facets: list[TagFacet] = Field(default_factory=list)
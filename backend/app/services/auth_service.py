@@ -1,20 +1,26 @@
+from datetime import UTC, datetime, timedelta
+from typing import NoReturn
+
 from starlette.requests import Request
 
+from app.core.config import get_settings
 from app.core.exceptions import (
     AccountInactiveError,
     EmailAlreadyExistsError,
     InvalidCredentialsError,
     InvalidTokenError,
+    ServiceBusyError,
     TokenRevokedError,
 )
+from app.core.logging import get_logger
 from app.core.security import (
     create_access_token,
     generate_refresh_token,
-    hash_password,
     hash_refresh_token,
+    needs_rehash,
     refresh_token_expiry,
-    verify_password,
 )
+from app.db.unit_of_work import unit_of_work
 from app.repositories.token_repository import TokenRepository
 from app.repositories.user_repository import UserRepository
 from app.schemas.auth import (
@@ -25,6 +31,9 @@ from app.schemas.auth import (
     TokenResponse,
     UserResponse,
 )
+from app.services.password_hasher import get_password_hasher
+
+logger = get_logger(__name__)
 
 
 def _user_response(user: object) -> UserResponse:
@@ -42,6 +51,7 @@ def _build_token_response(user: object, raw_refresh: str) -> TokenResponse:
         user_id=user.id,  # type: ignore[attr-defined]
         email=user.email,  # type: ignore[attr-defined]
         display_name=user.displayName,  # type: ignore[attr-defined]
+        token_version=user.tokenVersion,  # type: ignore[attr-defined]
     )
     return TokenResponse(
         accessToken=access_token,
@@ -50,6 +60,16 @@ def _build_token_response(user: object, raw_refresh: str) -> TokenResponse:
     )
 
 
+async def _revoke_family(family_id: str) -> int:
+    """Revoke a token family in its own transaction.
+
+    The request that detected the reuse fails right after, which rolls its
+    own unit of work back; the revocation must survive that.
+    """
+    async with unit_of_work() as session:
+        return await TokenRepository(session).revoke_family(family_id)
+
+
 class AuthService:
     def __init__(
         self,
@@ -63,7 +83,7 @@ class AuthService:
         if await self._users.email_exists(data.email):
             raise EmailAlreadyExistsError()
 
-        hashed = hash_password(data.password)
+        hashed = await get_password_hasher().hash(data.password)
         user = await self._users.create(
             email=data.email,
             display_name=data.displayName,
@@ -72,11 +92,14 @@ class AuthService:
         return _user_response(user)
 
     async def login(self, data: LoginRequest, request: Request) -> TokenResponse:
+        hasher = get_password_hasher()
         user = await self._users.get_by_email(data.email)
-        if not user or not verify_password(data.password, user.passwordHash):
+        if not user or not await hasher.verify(data.password, user.passwordHash):
             raise InvalidCredentialsError()
         if not user.isActive:
             raise AccountInactiveError()
+        if needs_rehash(user.passwordHash):
+            await self._rehash(user, data.password)
 
         raw_refresh = generate_refresh_token()
         await self._tokens.create(
@@ -88,33 +111,63 @@ class AuthService:
         )
         return _build_token_response(user, raw_refresh)
 
+    async def _rehash(self, user: object, password: str) -> None:
+        """Move a hash made with an old cost to BCRYPT_ROUNDS (we only see the password now).
+
+        Best effort: a busy hasher just postpones it to a later login.
+        """
+        try:
+            new_hash = await get_password_hasher().hash(password)
+        except ServiceBusyError:
+            return
+        await self._users.set_password_hash(user.id, new_hash)  # type: ignore[attr-defined]
+        logger.info("Rehashed password for user %s", user.id)  # type: ignore[attr-defined]
+
     async def logout(self, data: LogoutRequest) -> None:
         token_hash = hash_refresh_token(data.refreshToken)
         await self._tokens.revoke(token_hash)
 
     async def refresh(self, data: RefreshRequest, request: Request) -> TokenResponse:
         token_hash = hash_refresh_token(data.refreshToken)
-        stored = await self._tokens.get_active_by_hash(token_hash)
-
-        if not stored:
-            raise TokenRevokedError()
-
-        user = await self._users.get_by_id(stored.userId)
-        if not user or not user.isActive:
-            raise InvalidTokenError()
-
-        # Token rotation: revoke old, issue new
-        await self._tokens.revoke(token_hash)
         raw_refresh = generate_refresh_token()
-        await self._tokens.create(
-            token_hash=hash_refresh_token(raw_refresh),
-            user_id=user.id,
+        user = await self._tokens.rotate(
+            token_hash,
+            new_hash=hash_refresh_token(raw_refresh),
             expires_at=refresh_token_expiry(),
             user_agent=request.headers.get("User-Agent"),
             ip_address=request.client.host if request.client else None,
         )
+        if user is None:
+            await self._reject_refresh(token_hash)
         return _build_token_response(user, raw_refresh)
 
+    async def _reject_refresh(self, token_hash: str) -> NoReturn:
+        """Explain a failed rotation; presenting an already-rotated token revokes its family.
+
+        A rotated token only comes back if it leaked (or a client kept a
+        stale copy), so every session descended from that login is ended.
+        Rotations within REFRESH_REUSE_GRACE_SECONDS are let off: that is
+        two tabs racing to refresh, not theft.
+        """
+        stored = await self._tokens.get_by_hash(token_hash)
+        now = datetime.now(UTC)
+        if stored is None or stored.expiresAt <= now:
+            raise TokenRevokedError()
+        if stored.rotatedAt is not None:
+            grace = timedelta(seconds=get_settings().REFRESH_REUSE_GRACE_SECONDS)
+            if now - stored.rotatedAt > grace:
+                revoked = await _revoke_family(stored.familyId)
+                logger.warning(
+                    "Refresh token reuse for user %s; revoked %d token(s) of family %s",
+                    stored.userId,
+                    revoked,
+                    stored.familyId,
+                )
+            raise TokenRevokedError()
+        if stored.revokedAt is not None:
+            raise TokenRevokedError()
+        raise InvalidTokenError()  # active token, but its user is gone or inactive
+
     async def get_me(self, user_id: str) -> UserResponse:
         user = await self._users.get_by_id(user_id)
         if not user:
@@ -1,24 +1,46 @@
 from app.core.exceptions import CommentNotFoundError, ForbiddenError, PostNotFoundError
+from app.core.pagination import decode_cursor, encode_cursor
+from app.db.models import Comment
 from app.repositories.comment_repository import CommentRepository
 from app.repositories.post_repository import PostRepository
-from app.schemas.comment import CommentCreate, CommentResponse
+from app.schemas.comment import (
+    CommentCreate,
+    CommentPageResponse,
+    CommentResponse,
+    CommentThreadResponse,
+)
 
 
-def _to_response(comment: object) -> CommentResponse:
+def _to_response(comment: object, *, author_name: str | None = None) -> CommentResponse:
     reply_count = getattr(comment, "reply_count", 0)
+    if author_name is None:
+        author_name = comment.author.displayName  # type: ignore[attr-defined]
 
     return CommentResponse(
         id=comment.id,  # type: ignore[attr-defined]
         body=comment.body,  # type: ignore[attr-defined]
         postId=comment.postId,  # type: ignore[attr-defined]
         authorId=comment.authorId,  # type: ignore[attr-defined]
-        authorName=comment.author.displayName,  # type: ignore[attr-defined]
+        authorName=author_name,
         parentId=comment.parentId,  # type: ignore[attr-defined]
         createdAt=comment.createdAt,  # type: ignore[attr-defined]
         replyCount=reply_count,
     )
 
 
+def _build_thread(
+    comments: list[Comment], *, root_parent_id: str | None = None
+) -> list[CommentThreadResponse]:
+    """Nest flat ``(created_at, id)``-ordered rows under their parents in one pass."""
+    nodes = {c.id: CommentThreadResponse(**_to_response(c).model_dump()) for c in comments}
+    roots: list[CommentThreadResponse] = []
+    for node in nodes.values():
+        parent_id = node.parentId
+        parent = nodes.get(parent_id) if parent_id and parent_id != root_parent_id else None
+        (parent.replies if parent is not None else roots).append(node)
+    return roots
+
+
 class CommentService:
     def __init__(
         self,
@@ -28,12 +50,31 @@ class CommentService:
         self._comments = comment_repo
         self._posts = post_repo
 
-    async def get_comments(self, post_id: str) -> list[CommentResponse]:
-        post = await self._posts.get_by_id(post_id)
-        if not post:
+    async def get_comments(
+        self,
+        post_id: str,
+        *,
+        parent_id: str | None = None,
+        cursor: str | None = None,
+        limit: int,
+        depth: int = 1,
+    ) -> CommentPageResponse:
+        """A page of the comments under *parent_id* (top-level when None).
+
+        Each comment carries a preview of its first replies, nested
+        *depth* - 1 levels deep; the rest are fetched as pages of their own.
+        """
+        after = decode_cursor(cursor) if cursor else None
+        if not await self._posts.exists(post_id):
             raise PostNotFoundError()
-        comments = await self._comments.find_by_post(post_id)
-        return [_to_response(c) for c in comments]
+        comments, has_more = await self._comments.find_page(
+            post_id, parent_id=parent_id, after=after, limit=limit, depth=depth
+        )
+        items = _build_thread(comments, root_parent_id=parent_id)
+        next_cursor = (
+            encode_cursor(items[-1].createdAt, items[-1].id) if has_more and items else None
+        )
+        return CommentPageResponse(items=items, nextCursor=next_cursor)
 
     async def create_comment(
         self,
@@ -42,8 +83,7 @@ class CommentService:
         *,
         author: object,
     ) -> CommentResponse:
-        post = await self._posts.get_by_id(post_id)
-        if not post:
+        if not await self._posts.exists(post_id):
             raise PostNotFoundError()
 
         comment = await self._comments.create(
@@ -52,14 +92,20 @@ class CommentService:
             author_id=author.id,  # type: ignore[attr-defined]
             parent_id=data.parentId,
         )
-        return _to_response(comment)
+        return _to_response(
+            comment,
+            author_name=author.displayName,  # type: ignore[attr-defined]
+        )
 
     async def delete_comment(
         self, comment_id: str, *, current_user: object
     ) -> None:
-        comment = await self._comments.get_by_id(comment_id)
-        if not comment:
-            raise CommentNotFoundError()
-        if comment.authorId != current_user.id:  # type: ignore[attr-defined]
+        deleted = await self._comments.delete(
+            comment_id,
+            author_id=current_user.id,  # type: ignore[attr-defined]
+        )
+        if not deleted:
+            # the guarded DELETE matched nothing: tell missing from foreign
+            if await self._comments.owner_of(comment_id) is None:
+                raise CommentNotFoundError()
             raise ForbiddenError()
-        await self._comments.delete(comment_id)
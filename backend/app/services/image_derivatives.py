@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import io
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from PIL import Image, ImageFilter, ImageOps, features
+
+from app.core.config import get_settings
+
+# Widths offered in srcset; the original is never upscaled
+VARIANT_WIDTHS: tuple[int, ...] = (320, 640, 1280)
+PLACEHOLDER_WIDTH = 16
+
+_QUALITY = {"webp": 80, "avif": 55}
+
+
+def variant_formats() -> tuple[str, ...]:
+    """Output formats supported by the installed Pillow build, best first."""
+    return ("avif", "webp") if features.check("avif") else ("webp",)
+
+
+@dataclass
+class Variant:
+    width: int
+    format: str
+    data: bytes
+
+
+@dataclass
+class DerivativeSet:
+    width: int
+    height: int
+    placeholder: str  # data: URI, small enough to inline in list responses
+    variants: list[Variant] = field(default_factory=list)
+
+
+def _encode(image: Image.Image, fmt: str, **params: object) -> bytes:
+    buf = io.BytesIO()
+    image.save(buf, format=fmt.upper(), **params)
+    return buf.getvalue()
+
+
+def render_derivatives(raw: bytes) -> DerivativeSet:
+    """Decode *raw* and render the width variants plus a blurred placeholder.
+
+    CPU-bound and pure — runs in the derivative process pool, never on the
+    event loop. Images over Pillow's MAX_IMAGE_PIXELS raise
+    ``Image.DecompressionBombError`` instead of only warning, so a small
+    file cannot expand into gigabytes of pixels.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", Image.DecompressionBombWarning)
+        with Image.open(io.BytesIO(raw)) as opened:
+            source = ImageOps.exif_transpose(opened)
+            source = source.convert("RGBA" if source.mode in ("RGBA", "LA", "P") else "RGB")
+
+    width, height = source.size
+    result = DerivativeSet(width=width, height=height, placeholder="")
+
+    widths = [w for w in VARIANT_WIDTHS if w < width] or [width]
+    for target in widths:
+        resized = source.resize(
+            (target, max(1, round(height * target / width))), Image.Resampling.LANCZOS
+        )
+        for fmt in variant_formats():
+            result.variants.append(
+                Variant(target, fmt, _encode(resized, fmt, quality=_QUALITY[fmt]))
+            )
+
+    tiny = source.resize(
+        (PLACEHOLDER_WIDTH, max(1, round(height * PLACEHOLDER_WIDTH / width))),
+        Image.Resampling.BILINEAR,
+    ).filter(ImageFilter.GaussianBlur(1))
+    encoded = base64.b64encode(_encode(tiny, "webp", quality=30)).decode()
+    result.placeholder = f"data:image/webp;base64,{encoded}"
+    return result
+
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=get_settings().IMAGE_WORKERS)
+    return _pool
+
+
+async def generate_derivatives(raw: bytes) -> DerivativeSet:
+    """Render derivatives for *raw* in the process pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_pool(), render_derivatives, raw)
+
+
+def shutdown_derivative_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
@@ -0,0 +1,119 @@
+import base64
+import binascii
+
+from PIL import Image as PILImage
+from PIL import UnidentifiedImageError
+
+from app.core.config import get_settings
+from app.core.exceptions import InvalidImageError
+from app.db.models import Image
+from app.repositories.image_repository import ImageRepository
+from app.schemas.image import ImageVariantResponse
+from app.services.image_derivatives import generate_derivatives
+from app.services.image_store import (
+    ImageStore,
+    get_image_store,
+    is_image_hash,
+    sniff_content_type,
+)
+
+
+def image_url(image_hash: str) -> str:
+    """Absolute URL at which the image store serves *image_hash*."""
+    return f"{get_settings().PUBLIC_API_URL}/images/{image_hash}"
+
+
+def parse_image_url(url: str) -> str | None:
+    """Return the hash if *url* points at our own image endpoint, else None."""
+    prefix = f"{get_settings().PUBLIC_API_URL}/images/"
+    if url.startswith(prefix) and is_image_hash(url[len(prefix) :]):
+        return url[len(prefix) :]
+    return None
+
+
+def image_variants(asset: Image | None) -> list[ImageVariantResponse]:
+    """srcset-style list of the derivatives of *asset* (empty if none)."""
+    if asset is None:
+        return []
+    return [
+        ImageVariantResponse(url=image_url(v.hash), width=v.width, format=v.format)
+        for v in asset.variants
+    ]
+
+
+def decode_image_data(data: str) -> bytes:
+    """Decode a base64 payload (optionally a ``data:`` URI) into raw image bytes."""
+    if data.startswith("data:"):
+        _, _, data = data.partition(",")
+    max_bytes = get_settings().IMAGE_MAX_BYTES
+    if len(data) * 3 // 4 > max_bytes:
+        raise InvalidImageError(f"Images must be at most {max_bytes // (1024 * 1024)} MB.")
+    try:
+        return base64.b64decode(data, validate=True)
+    except (binascii.Error, ValueError):
+        raise InvalidImageError("image_data is not valid base64.") from None
+
+
+class ImageService:
+    def __init__(self, image_repo: ImageRepository, store: ImageStore | None = None) -> None:
+        self._images = image_repo
+        self._store = store or get_image_store()
+
+    async def ingest_base64(self, data: str) -> str:
+        """Decode, validate and store a base64 image once; return its hash."""
+        raw = decode_image_data(data)
+        content_type = sniff_content_type(raw[:16])
+        if content_type is None:
+            raise InvalidImageError()
+        image_hash = await self._store.put(raw)
+        is_new = await self._images.register(
+            image_hash=image_hash, content_type=content_type, byte_size=len(raw)
+        )
+        if is_new:
+            await self.render_derivatives(image_hash, raw)
+        return image_hash
+
+    async def render_derivatives(self, image_hash: str, raw: bytes) -> None:
+        """Render variants and placeholder in the process pool and record them."""
+        try:
+            rendered = await generate_derivatives(raw)
+        except (PILImage.DecompressionBombError, PILImage.DecompressionBombWarning):
+            raise InvalidImageError("The image has too many pixels.") from None
+        except (UnidentifiedImageError, OSError, ValueError):
+            raise InvalidImageError("The image could not be decoded.") from None
+
+        variants = []
+        for variant in rendered.variants:
+            variants.append(
+                {
+                    "width": variant.width,
+                    "format": variant.format,
+                    "hash": await self._store.put(variant.data),
+                    "byte_size": len(variant.data),
+                }
+            )
+        await self._images.save_derivatives(
+            image_hash,
+            width=rendered.width,
+            height=rendered.height,
+            placeholder=rendered.placeholder,
+            variants=variants,
+        )
+
+    async def resolve(
+        self, *, image: str | None, image_data: str | None
+    ) -> tuple[str | None, str | None]:
+        """Map an incoming ``image`` URL / ``image_data`` pair to ``(image, image_ref)``.
+
+        Uploaded data wins. A URL pointing back at our own image endpoint is
+        turned back into its reference instead of being stored as an external
+        link (the edit forms echo the URL they were given).
+        """
+        if image_data:
+            return None, await self.ingest_base64(image_data)
+        if image:
+            image_hash = parse_image_url(image)
+            if image_hash is not None:
+                return "", image_hash
+            return image, None
+        return None, None
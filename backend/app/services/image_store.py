@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import re
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Protocol
+
+from app.core.config import get_settings
+
+_HASH_RE = re.compile(r"^[0-9a-f]{64}$")
+
+# Magic-number prefixes of the formats we accept and serve
+_SIGNATURES: tuple[tuple[bytes, str], ...] = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+
+
+def sniff_content_type(head: bytes) -> str | None:
+    """Return the MIME type of an image from its first bytes, or None if unsupported."""
+    for signature, content_type in _SIGNATURES:
+        if head.startswith(signature):
+            return content_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if head[4:8] == b"ftyp" and head[8:12] in (b"avif", b"avis"):
+        return "image/avif"
+    return None
+
+
+def is_image_hash(value: str) -> bool:
+    return bool(_HASH_RE.match(value))
+
+
+class ImageStore(Protocol):
+    """Content-addressed blob storage: blobs are written once and keyed by SHA-256."""
+
+    async def put(self, data: bytes) -> str:
+        """Store *data* (no-op if already present) and return its hex digest."""
+        ...
+
+    async def get(self, image_hash: str) -> bytes | None: ...
+
+    def local_path(self, image_hash: str) -> Path | None:
+        """Filesystem path for zero-copy serving, or None for remote backends."""
+        ...
+
+
+class LocalImageStore:
+    """Stores blobs under ``<root>/<first two hex chars>/<hash>``."""
+
+    def __init__(self, root: str | Path) -> None:
+        self._root = Path(root)
+
+    def _path(self, image_hash: str) -> Path:
+        return self._root / image_hash[:2] / image_hash
+
+    def put_sync(self, data: bytes) -> str:
+        image_hash = hashlib.sha256(data).hexdigest()
+        path = self._path(image_hash)
+        try:
+            # Already stored: refresh the mtime so orphan collection, which
+            # spares recently written blobs, cannot race this new reference
+            os.utime(path)
+            return image_hash
+        except FileNotFoundError:
+            pass
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so readers never see a partial blob
+        fd, tmp = tempfile.mkstemp(dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return image_hash
+
+    async def put(self, data: bytes) -> str:
+        return await asyncio.to_thread(self.put_sync, data)
+
+    async def get(self, image_hash: str) -> bytes | None:
+        path = self.local_path(image_hash)
+        if path is None:
+            return None
+        return await asyncio.to_thread(path.read_bytes)
+
+    def local_path(self, image_hash: str) -> Path | None:
+        if not is_image_hash(image_hash):
+            return None
+        path = self._path(image_hash)
+        return path if path.is_file() else None
+
+    def stale_hashes(self, older_than: float) -> list[str]:
+        """Hashes of blobs last written before the unix time *older_than*."""
+        if not self._root.is_dir():
+            return []
+        return [
+            path.name
+            for path in self._root.glob("??/*")
+            if is_image_hash(path.name) and path.stat().st_mtime < older_than
+        ]
+
+    def delete_if_stale(self, image_hash: str, older_than: float) -> bool:
+        """Remove a blob unless it was (re)written since *older_than*."""
+        path = self._path(image_hash)
+        try:
+            if path.stat().st_mtime >= older_than:
+                return False
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+
+@lru_cache
+def get_image_store() -> LocalImageStore:
+    return LocalImageStore(get_settings().IMAGE_STORE_DIR)
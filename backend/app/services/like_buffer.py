@@ -0,0 +1,182 @@
+import asyncio
+import contextlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.metrics import register_metrics
+from app.db.unit_of_work import unit_of_work
+from app.repositories.post_repository import PostRepository
+
+logger = get_logger(__name__)
+
+LikeKey = tuple[str, str]  # (post_id, user_id)
+
+
+@dataclass(frozen=True)
+class _Intent:
+    liked: bool
+    # Effect on like_count relative to the committed row state when recorded
+    delta: int
+
+
+class LikeBuffer:
+    """Write-behind buffer for like/unlike intents.
+
+    Only the latest intent per ``(post, user)`` is kept, so a like/unlike/like
+    burst costs one row write. Intents are flushed in a single transaction
+    every *interval* seconds, or sooner once *max_pending* keys are waiting,
+    and once more on shutdown.
+
+    In-process only: an intent recorded on one worker is invisible to the
+    others until it is flushed, and is lost if the process dies uncleanly.
+    """
+
+    def __init__(self, *, interval: float, max_pending: int) -> None:
+        self._interval = interval
+        self._max_pending = max_pending
+        self._pending: dict[LikeKey, _Intent] = {}
+        self._inflight: dict[LikeKey, _Intent] = {}
+        # Net delta per post over _pending and _inflight, kept in step with both
+        self._post_deltas: Counter[str] = Counter()
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._closed = False
+        self._task: asyncio.Task[None] | None = None
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.flushed_intents = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def record(self, post_id: str, user_id: str, *, liked: bool, stored: bool) -> None:
+        """Queue the viewer's latest intent; *stored* is whether the like row exists now."""
+        key = (post_id, user_id)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # the row will look like the in-flight intent once that flush lands
+            stored = inflight.liked
+        previous = self._pending.get(key)
+        intent = _Intent(liked, int(liked) - int(stored))
+        self._pending[key] = intent
+        self._shift_delta(post_id, intent.delta - (previous.delta if previous else 0))
+        if len(self._pending) >= self._max_pending:
+            self._wakeup.set()
+
+    def pending_state(self, post_id: str, user_id: str) -> bool | None:
+        """Latest unflushed intent of *user_id* for *post_id*, or None if there is none."""
+        key = (post_id, user_id)
+        intent = self._pending.get(key) or self._inflight.get(key)
+        return intent.liked if intent is not None else None
+
+    def pending_delta(self, post_id: str) -> int:
+        """Net like_count change for *post_id* that has not been committed yet."""
+        return self._post_deltas[post_id]
+
+    def _shift_delta(self, post_id: str, change: int) -> None:
+        total = self._post_deltas[post_id] + change
+        if total:
+            self._post_deltas[post_id] = total
+        else:
+            self._post_deltas.pop(post_id, None)
+
+    async def flush(self) -> None:
+        """Write every pending intent in one transaction."""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, {}
+            self._inflight = batch
+            try:
+                async with unit_of_work() as session:
+                    await PostRepository(session).apply_like_batch(
+                        likes=[key for key, intent in batch.items() if intent.liked],
+                        unlikes=[key for key, intent in batch.items() if not intent.liked],
+                    )
+            except Exception:
+                self.failed_flushes += 1
+                logger.exception("Like flush failed; re-queueing %d intent(s)", len(batch))
+                self._requeue(batch)
+            else:
+                self.flushes += 1
+                self.flushed_intents += len(batch)
+            finally:
+                self._inflight = {}
+                for (post_id, _), intent in batch.items():
+                    self._shift_delta(post_id, -intent.delta)
+
+    def _requeue(self, batch: dict[LikeKey, _Intent]) -> None:
+        for key, intent in batch.items():
+            # back into _pending: counted again once flush drops the in-flight copy
+            self._shift_delta(key[0], intent.delta)
+            newer = self._pending.get(key)
+            if newer is None:
+                self._pending[key] = intent
+            else:
+                # *newer* was recorded relative to the failed intent's state
+                self._pending[key] = _Intent(newer.liked, newer.delta + intent.delta)
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), name="like-buffer-flush")
+
+    async def close(self) -> None:
+        """Stop the background loop after a final flush."""
+        self._closed = True
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+        await self.flush()
+
+    async def _run(self) -> None:
+        while not self._closed:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._interval)
+            self._wakeup.clear()
+            await self.flush()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "pending": len(self._pending),
+            "flushes": self.flushes,
+            "failedFlushes": self.failed_flushes,
+            "flushedIntents": self.flushed_intents,
+        }
+
+
+_buffer: LikeBuffer | None = None
+
+
+def get_like_buffer() -> LikeBuffer | None:
+    """The running buffer, or None when likes are written directly."""
+    return _buffer
+
+
+def start_like_buffer() -> None:
+    global _buffer
+    settings = get_settings()
+    if settings.LIKE_WRITE_MODE != "buffered" or _buffer is not None:
+        return
+    _buffer = LikeBuffer(
+        interval=settings.LIKE_FLUSH_INTERVAL_SECONDS,
+        max_pending=settings.LIKE_FLUSH_MAX_PENDING,
+    )
+    _buffer.start()
+
+
+async def stop_like_buffer() -> None:
+    global _buffer
+    if _buffer is None:
+        return
+    buffer, _buffer = _buffer, None
+    # Requests still in flight see direct mode from here on; their intents
+    # were recorded before this point and go out with the final flush.
+    await buffer.close()
+
+
+register_metrics(
+    "likeBuffer",
+    lambda: _buffer.stats() if _buffer is not None else {"mode": "direct"},
+)
@@ -0,0 +1,87 @@
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from app.core import security
+from app.core.config import get_settings
+from app.core.exceptions import ServiceBusyError
+from app.core.metrics import register_metrics
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """Runs bcrypt in a small dedicated thread pool with bounded admission.
+
+    bcrypt releases the GIL, so hashing in threads keeps the event loop free
+    for unrelated requests. At most *workers* hashes run at once and
+    *queue_limit* more may wait; anything beyond that is refused with a 503
+    straight away rather than queueing behind a burst of logins.
+    """
+
+    def __init__(self, *, workers: int, queue_limit: int) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._workers = workers
+        self._capacity = workers + queue_limit
+        self._lock = threading.Lock()
+        self._admitted = 0
+        self.rejected = 0
+
+    def _release(self, _: Future[Any]) -> None:
+        with self._lock:
+            self._admitted -= 1
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            if self._admitted >= self._capacity:
+                self.rejected += 1
+                raise ServiceBusyError()
+            self._admitted += 1
+        # Released when the thread finishes, not when the caller stops
+        # waiting, so a cancelled request still counts until its hash is done
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    async def hash(self, plain: str) -> str:
+        return await self._run(security.hash_password, plain)
+
+    async def verify(self, plain: str, hashed: str) -> bool:
+        return await self._run(security.verify_password, plain, hashed)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "workers": self._workers,
+            "admitted": self._admitted,
+            "capacity": self._capacity,
+            "rejected": self.rejected,
+        }
+
+
+_hasher: PasswordHasher | None = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    global _hasher
+    if _hasher is None:
+        settings = get_settings()
+        _hasher = PasswordHasher(
+            workers=settings.PASSWORD_HASH_WORKERS,
+            queue_limit=settings.PASSWORD_HASH_QUEUE_LIMIT,
+        )
+    return _hasher
+
+
+def shutdown_password_hasher() -> None:
+    global _hasher
+    if _hasher is not None:
+        _hasher.shutdown()
+        _hasher = None
+
+
+register_metrics("passwordHasher", lambda: _hasher.stats() if _hasher else {"admitted": 0})
@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.core.cache import CacheBackend, LRUCache
+from app.core.config import get_settings
+from app.core.metrics import register_metrics
+from app.schemas.post import PostResponse
+
+# Everything a post's representation depends on besides its tags (whose edits
+# move updated_at): timestamps, counters and the author's display name
+PostVersion = tuple[datetime, int, int, str]
+
+
+@dataclass(frozen=True)
+class CachedPost:
+    # ``post_version()`` of the row the response was built from; a probe that
+    # disagrees means another worker changed the post and the entry is stale
+    version: PostVersion
+    # Viewer-independent: ``likedByMe`` is always False and layered on per request
+    response: PostResponse
+
+
+_settings = get_settings()
+_backend: CacheBackend[CachedPost] = LRUCache(
+    maxsize=_settings.POST_CACHE_SIZE, ttl=_settings.POST_CACHE_TTL_SECONDS
+)
+
+
+def get_post_cache() -> CacheBackend[CachedPost]:
+    return _backend
+
+
+def set_post_cache(backend: CacheBackend[CachedPost]) -> None:
+    """Swap the cache backend (e.g. for a shared cache across workers)."""
+    global _backend
+    _backend = backend
+
+
+def invalidate_post(post_id: str) -> None:
+    """Drop the cached representation of *post_id* after a committed write."""
+    _backend.delete(post_id)
+
+
+register_metrics("postCache", lambda: {**_backend.stats.as_dict(), "size": len(_backend)})
@@ -1,84 +1,247 @@
+from typing import NoReturn
+
+from app.core.config import get_settings
 from app.core.exceptions import ForbiddenError, PostNotFoundError
-from app.repositories.post_repository import PostRepository
-from app.schemas.common import PaginatedResponse
-from app.schemas.post import PostCreate, PostResponse, PostUpdate
+from app.core.http_cache import make_etag
+from app.core.pagination import decode_cursor, encode_cursor
+from app.repositories.post_repository import PostRepository, post_version
+from app.schemas.common import CountStrategy, PaginatedResponse
+from app.schemas.post import (
+    LikeStatusResponse,
+    PostCreate,
+    PostResponse,
+    PostSummaryResponse,
+    PostUpdate,
+)
+from app.services.image_service import ImageService, image_url, image_variants
+from app.services.like_buffer import get_like_buffer
+from app.services.post_cache import CachedPost, PostVersion, get_post_cache
+from app.services.viewer_context import ViewerContext
+
+
+def _image(post: object) -> str:
+    """Stored images are served by URL; otherwise the external link is used as-is."""
+    image_ref = post.imageRef  # type: ignore[attr-defined]
+    return image_url(image_ref) if image_ref else post.image  # type: ignore[attr-defined]
+
 
+def _placeholder(post: object) -> str | None:
+    asset = post.imageAsset  # type: ignore[attr-defined]
+    return asset.placeholder if asset else None
 
-def _to_response(post: object, *, current_user_id: str | None = None) -> PostResponse:
-    tags = [pt.tag.name for pt in (post.tags or [])]  # type: ignore[attr-defined]
-    like_count: int = len(post.likes or [])  # type: ignore[attr-defined]
-    comment_count: int = len(post.comments or [])  # type: ignore[attr-defined]
+
+def _to_response(
+    post: object, *, tags: list[str] | None = None, author_name: str | None = None
+) -> PostResponse:
+    """Build a PostResponse; write paths pass *tags*/*author_name* they already hold."""
+    if tags is None:
+        tags = [pt.tag.name for pt in (post.tags or [])]  # type: ignore[attr-defined]
+    if author_name is None:
+        author_name = post.author.displayName  # type: ignore[attr-defined]
 
     return PostResponse(
         id=post.id,  # type: ignore[attr-defined]
         title=post.title,  # type: ignore[attr-defined]
-        image=post.image,  # type: ignore[attr-defined]
-        image_data=post.image_data,  # type: ignore[attr-defined]
+        image=_image(post),
+        imageRef=post.imageRef,  # type: ignore[attr-defined]
+        imageVariants=image_variants(post.imageAsset),  # type: ignore[attr-defined]
+        imagePlaceholder=_placeholder(post),
         body=post.body,  # type: ignore[attr-defined]
         tags=tags,
         uid=post.authorId,  # type: ignore[attr-defined]
+        createdBy=author_name,
+        createdAt=post.createdAt,  # type: ignore[attr-defined]
+        likeCount=post.likeCount,  # type: ignore[attr-defined]
+        commentCount=post.commentCount,  # type: ignore[attr-defined]
+        likedByMe=False,  # enriched separately through the ViewerContext
+    )
+
+
+def _to_summary(post: object) -> PostSummaryResponse:
+    return PostSummaryResponse(
+        id=post.id,  # type: ignore[attr-defined]
+        title=post.title,  # type: ignore[attr-defined]
+        image=_image(post),
+        imageRef=post.imageRef,  # type: ignore[attr-defined]
+        imageVariants=image_variants(post.imageAsset),  # type: ignore[attr-defined]
+        imagePlaceholder=_placeholder(post),
+        excerpt=post.excerpt or "",  # type: ignore[attr-defined]
+        tags=[pt.tag.name for pt in (post.tags or [])],  # type: ignore[attr-defined]
+        uid=post.authorId,  # type: ignore[attr-defined]
         createdBy=post.author.displayName,  # type: ignore[attr-defined]
         createdAt=post.createdAt,  # type: ignore[attr-defined]
-        likeCount=like_count,
-        commentCount=comment_count,
-        likedByMe=False,  # enriched separately if user is authenticated
+        likeCount=post.likeCount,  # type: ignore[attr-defined]
+        commentCount=post.commentCount,  # type: ignore[attr-defined]
     )
 
 
+def _posts_etag(
+    collection_version: int,
+    params: tuple[object, ...],
+    rows: list[tuple[str, PostVersion]],
+    has_more: bool,
+    liked: set[str],
+) -> str:
+    return make_etag("posts", collection_version, params, rows, has_more, sorted(liked))
+
+
+def _post_etag(post_id: str, version: PostVersion, liked: bool) -> str:
+    return make_etag("post", post_id, version, liked)
+
+
 class PostService:
-    def __init__(self, post_repo: PostRepository) -> None:
+    def __init__(self, post_repo: PostRepository, image_service: ImageService) -> None:
         self._posts = post_repo
+        self._images = image_service
 
     async def get_posts(
         self,
         *,
-        search: str | None,
+        tags: list[str] | None,
         uid: str | None,
+        match_all: bool = True,
         page: int,
         size: int,
-        current_user_id: str | None = None,
-    ) -> PaginatedResponse[PostResponse]:
-        posts, total = await self._posts.find_many(
-            tag_filter=search,
+        viewer: ViewerContext,
+        cursor: str | None = None,
+        with_total: bool = True,
+        summary: bool = False,
+    ) -> tuple[PaginatedResponse[PostResponse] | PaginatedResponse[PostSummaryResponse], str]:
+        """Return a page of posts and its ETag.
+
+        The ETag is built from the rows just fetched and equals what
+        ``get_posts_etag`` would probe for the same page.
+        """
+        count = get_settings().POSTS_COUNT_STRATEGY if with_total else CountStrategy.NONE
+        posts, total, has_more, version = await self._posts.find_many(
+            tags=tags,
+            match_all=match_all,
             author_id=uid,
             skip=(page - 1) * size,
             take=size,
+            after=decode_cursor(cursor) if cursor else None,
+            count=count,
+            summary=summary,
+        )
+        liked = await viewer.load_post_likes([post.id for post in posts])
+        next_cursor = encode_cursor(posts[-1].createdAt, posts[-1].id) if has_more else None
+        etag = _posts_etag(
+            version,
+            (tags, match_all, uid, page, size, cursor, with_total, summary),
+            [(post.id, post_version(post)) for post in posts],
+            has_more,
+            liked,
+        )
+        result: PaginatedResponse[PostResponse] | PaginatedResponse[PostSummaryResponse]
+        if summary:
+            summaries = [_to_summary(post) for post in posts]
+            for summary_item in summaries:
+                summary_item.likedByMe = summary_item.id in liked
+            result = PaginatedResponse.build(summaries, total, page, size, next_cursor)
+        else:
+            items = [_to_response(post) for post in posts]
+            for item in items:
+                item.likedByMe = item.id in liked
+            result = PaginatedResponse.build(items, total, page, size, next_cursor)
+        return result, etag
+
+    async def get_posts_etag(
+        self,
+        *,
+        tags: list[str] | None,
+        uid: str | None,
+        match_all: bool = True,
+        page: int,
+        size: int,
+        viewer: ViewerContext,
+        cursor: str | None = None,
+        with_total: bool = True,
+        summary: bool = False,
+    ) -> str:
+        """Probe the validator of a ``get_posts`` page without loading it.
+
+        Two light queries (collection marker, key columns of the page rows);
+        only worth running when the client sent a validator to compare.
+        """
+        version, _ = await self._posts.collection_version()
+        rows = await self._posts.page_versions(
+            tags=tags,
+            match_all=match_all,
+            author_id=uid,
+            skip=(page - 1) * size,
+            take=size,
+            after=decode_cursor(cursor) if cursor else None,
+        )
+        rows, has_more = rows[:size], len(rows) > size
+        # Memoised on the viewer, so a full response reuses this lookup
+        liked = await viewer.load_post_likes([post_id for post_id, _ in rows])
+        return _posts_etag(
+            version,
+            (tags, match_all, uid, page, size, cursor, with_total, summary),
+            rows,
+            has_more,
+            liked,
         )
-        items = []
-        for post in posts:
-            response = _to_response(post, current_user_id=current_user_id)
-            if current_user_id:
-                response.likedByMe = await self._posts.get_like_status(
-                    post.id, current_user_id  # type: ignore[attr-defined]
-                )
-            items.append(response)
 
-        return PaginatedResponse.build(items=items, total=total, page=page, size=size)
+    async def get_post_version(self, post_id: str) -> PostVersion | None:
+        return await self._posts.get_version(post_id)
+
+    async def get_post_etag(
+        self, post_id: str, version: PostVersion, *, viewer: ViewerContext
+    ) -> str:
+        return _post_etag(post_id, version, await viewer.has_liked(post_id))
 
     async def get_post(
-        self, post_id: str, *, current_user_id: str | None = None
-    ) -> PostResponse:
-        post = await self._posts.get_by_id(post_id)
-        if not post:
-            raise PostNotFoundError()
+        self,
+        post_id: str,
+        *,
+        viewer: ViewerContext,
+        version: PostVersion | None = None,
+    ) -> tuple[PostResponse, str]:
+        """Return the post and its ETag, served from the read-through cache when possible.
 
-        response = _to_response(post)
-        if current_user_id:
-            response.likedByMe = await self._posts.get_like_status(
-                post_id, current_user_id
-            )
-        return response
+        Invalidation only reaches the worker that made the write, so every hit
+        is checked against the post's current version (a primary-key probe;
+        callers that already ran ``get_post_version`` pass it as *version*).
+        A mismatch reloads the post; a missing row is a 404 even if cached.
+        """
+        cache = get_post_cache()
+        if version is None:
+            version = await self._posts.get_version(post_id)
+            if version is None:
+                cache.delete(post_id)
+                raise PostNotFoundError()
+        cached = cache.get(post_id)
+        if cached is None or cached.version != version:
+            post = await self._posts.get_by_id(post_id)
+            if not post:
+                raise PostNotFoundError()
+            cached = CachedPost(post_version(post), _to_response(post))
+            cache.set(post_id, cached)
+
+        # Viewer-specific state is never cached
+        liked = await viewer.has_liked(post_id)
+        response = cached.response.model_copy(update={"likedByMe": liked})
+        return response, _post_etag(post_id, cached.version, liked)
 
     async def create_post(self, data: PostCreate, *, author: object) -> PostResponse:
+        image, image_ref = await self._images.resolve(
+            image=str(data.image) if data.image else None,
+            image_data=data.image_data,
+        )
         post = await self._posts.create(
             title=data.title,
-            image=str(data.image) if data.image else "",
-            image_data=data.image_data,
+            image=image or "",
+            image_ref=image_ref,
             body=data.body,
             tags=data.tags,
             author_id=author.id,  # type: ignore[attr-defined]
         )
-        return _to_response(post)
+        return _to_response(
+            post,
+            tags=sorted(data.tags),
+            author_name=author.displayName,  # type: ignore[attr-defined]
+        )
 
     async def update_post(
         self,
@@ -87,38 +250,71 @@ class PostService:
         *,
         current_user: object,
     ) -> PostResponse:
-        post = await self._posts.get_by_id(post_id)
-        if not post:
-            raise PostNotFoundError()
-        if post.authorId != current_user.id:  # type: ignore[attr-defined]
-            raise ForbiddenError()
-
+        if data.image_data and await self._posts.owner_of(post_id) != current_user.id:  # type: ignore[attr-defined]
+            # don't ingest an upload for a request that is going to be refused
+            await self._raise_not_owned(post_id)
+        image, image_ref = await self._images.resolve(
+            image=str(data.image) if data.image else None,
+            image_data=data.image_data,
+        )
         updated = await self._posts.update(
             post_id,
+            author_id=current_user.id,  # type: ignore[attr-defined]
             title=data.title,
-            image=str(data.image) if data.image else None,
-            image_data=data.image_data,
+            image=image,
+            image_ref=image_ref,
             body=data.body,
-            tags=data.tags,
+            tags=data.tags,  # an unchanged tag set costs no writes
+        )
+        if updated is None:
+            await self._raise_not_owned(post_id)
+        post, tags = updated
+        # only the author gets this far, so the author's name is at hand
+        return _to_response(
+            post,
+            tags=tags,
+            author_name=current_user.displayName,  # type: ignore[attr-defined]
         )
-        return _to_response(updated)
 
     async def delete_post(self, post_id: str, *, current_user: object) -> None:
-        post = await self._posts.get_by_id(post_id)
-        if not post:
+        deleted = await self._posts.delete(
+            post_id,
+            author_id=current_user.id,  # type: ignore[attr-defined]
+        )
+        if not deleted:
+            await self._raise_not_owned(post_id)
+
+    async def _raise_not_owned(self, post_id: str) -> NoReturn:
+        """Explain a guarded write that matched no row: missing post or foreign owner."""
+        if await self._posts.owner_of(post_id) is None:
             raise PostNotFoundError()
-        if post.authorId != current_user.id:  # type: ignore[attr-defined]
-            raise ForbiddenError()
-        await self._posts.delete(post_id)
+        raise ForbiddenError()
+
+    async def like_post(self, post_id: str, *, user_id: str) -> LikeStatusResponse:
+        return await self._set_like(post_id, user_id, liked=True)
 
-    async def like_post(self, post_id: str, *, user_id: str) -> None:
-        post = await self._posts.get_by_id(post_id)
-        if not post:
+    async def unlike_post(self, post_id: str, *, user_id: str) -> LikeStatusResponse:
+        return await self._set_like(post_id, user_id, liked=False)
+
+    async def _set_like(self, post_id: str, user_id: str, *, liked: bool) -> LikeStatusResponse:
+        state = await self._posts.like_state(post_id, user_id)
+        if state is None:
             raise PostNotFoundError()
-        await self._posts.add_like(post_id, user_id)
 
-    async def unlike_post(self, post_id: str, *, user_id: str) -> None:
-        post = await self._posts.get_by_id(post_id)
-        if not post:
+        buffer = get_like_buffer()
+        if buffer is not None:
+            # Write-behind: answer from the committed count plus unflushed intents
+            like_count, stored = state
+            buffer.record(post_id, user_id, liked=liked, stored=stored)
+            return LikeStatusResponse(
+                likeCount=like_count + buffer.pending_delta(post_id), likedByMe=liked
+            )
+
+        if liked:
+            await self._posts.add_like(post_id, user_id)
+        else:
+            await self._posts.remove_like(post_id, user_id)
+        state = await self._posts.like_state(post_id, user_id)
+        if state is None:  # deleted concurrently
             raise PostNotFoundError()
-        await self._posts.remove_like(post_id, user_id)
+        return LikeStatusResponse(likeCount=state[0], likedByMe=state[1])
@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+
+from app.core.cache import CacheBackend, LRUCache
+from app.core.config import get_settings
+from app.core.metrics import register_metrics
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated caller, detached from any session.
+
+    Carries what authorization and the write paths need (``id``,
+    ``displayName``, ``isAdmin``) so that a cache hit costs no query.
+    """
+
+    id: str
+    email: str
+    displayName: str
+    isAdmin: bool
+    isActive: bool
+    tokenVersion: int
+
+    @classmethod
+    def from_user(cls, user: object) -> "Principal":
+        return cls(
+            id=user.id,  # type: ignore[attr-defined]
+            email=user.email,  # type: ignore[attr-defined]
+            displayName=user.displayName,  # type: ignore[attr-defined]
+            isAdmin=user.isAdmin,  # type: ignore[attr-defined]
+            isActive=user.isActive,  # type: ignore[attr-defined]
+            tokenVersion=user.tokenVersion,  # type: ignore[attr-defined]
+        )
+
+
+_settings = get_settings()
+_backend: CacheBackend[Principal] = LRUCache(
+    maxsize=_settings.PRINCIPAL_CACHE_SIZE, ttl=_settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+
+def get_principal_cache() -> CacheBackend[Principal]:
+    return _backend
+
+
+def set_principal_cache(backend: CacheBackend[Principal]) -> None:
+    """Swap the cache backend (e.g. for a shared cache across workers)."""
+    global _backend
+    _backend = backend
+
+
+def invalidate_principal(user_id: str) -> None:
+    """Forget *user_id* after a committed change to its status, role or token version."""
+    _backend.delete(user_id)
+
+
+register_metrics("principalCache", lambda: {**_backend.stats.as_dict(), "size": len(_backend)})
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from datetime import datetime
+
+from app.core.config import get_settings
+from app.core.http_cache import make_etag
 from app.db.models import Project
 from app.repositories.project_repository import ProjectRepository
-from app.schemas.common import PaginatedResponse
+from app.schemas.common import CountStrategy, PaginatedResponse
 from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
+from app.services.image_service import ImageService, image_url, image_variants
 
 
 def _to_response(project: Project) -> ProjectResponse:
@@ -16,8 +21,10 @@ def _to_response(project: Project) -> ProjectResponse:
         category=project.category,
         url=project.url,
         githubUrl=project.githubUrl,
-        image=project.image,
-        image_data=project.image_data,
+        image=image_url(project.imageRef) if project.imageRef else project.image,
+        imageRef=project.imageRef,
+        imageVariants=image_variants(project.imageAsset),
+        imagePlaceholder=project.imageAsset.placeholder if project.imageAsset else None,
         tags=project.tags or [],
         techStack=project.techStack or [],
         stats=project.stats or [],
@@ -30,8 +37,9 @@ def _to_response(project: Project) -> ProjectResponse:
 
 
 class ProjectService:
-    def __init__(self, project_repo: ProjectRepository) -> None:
+    def __init__(self, project_repo: ProjectRepository, image_service: ImageService) -> None:
         self._projects = project_repo
+        self._images = image_service
 
     async def get_projects(
         self,
@@ -39,15 +47,40 @@ class ProjectService:
         featured_only: bool = False,
         page: int = 1,
         size: int = 50,
+        with_total: bool = True,
     ) -> PaginatedResponse[ProjectResponse]:
+        count = get_settings().PROJECTS_COUNT_STRATEGY if with_total else CountStrategy.NONE
         projects, total = await self._projects.find_many(
             featured_only=featured_only,
             skip=(page - 1) * size,
             take=size,
+            count=count,
         )
         items = [_to_response(p) for p in projects]
         return PaginatedResponse.build(items=items, total=total, page=page, size=size)
 
+    async def get_projects_validators(
+        self,
+        *,
+        featured_only: bool = False,
+        page: int = 1,
+        size: int = 50,
+        with_total: bool = True,
+    ) -> tuple[str, datetime | None]:
+        """ETag and Last-Modified for a ``get_projects`` page, from the collection marker."""
+        version, updated_at = await self._projects.collection_version()
+        etag = make_etag("projects", version, featured_only, page, size, with_total)
+        return etag, updated_at
+
+    async def get_project_validators(self, slug: str) -> tuple[str, datetime]:
+        from app.core.exceptions import ProjectNotFoundError
+
+        version = await self._projects.get_version(slug)
+        if version is None:
+            raise ProjectNotFoundError()
+        project_id, updated_at = version
+        return make_etag("project", project_id, updated_at), updated_at
+
     async def get_project(self, slug: str) -> ProjectResponse:
         from app.core.exceptions import ProjectNotFoundError
         project = await self._projects.get_by_slug(slug)
@@ -59,7 +92,12 @@ class ProjectService:
         from app.core.exceptions import ProjectSlugTakenError
         if await self._projects.slug_exists(data.slug):
             raise ProjectSlugTakenError()
-        payload = data.model_dump()
+        payload = data.model_dump(exclude={"image", "image_data"})
+        image, image_ref = await self._images.resolve(
+            image=data.image or None, image_data=data.image_data
+        )
+        payload["image"] = image or ""
+        payload["imageRef"] = image_ref
         payload["techStack"] = [item.model_dump() for item in (data.techStack or [])]
         payload["stats"] = [item.model_dump() for item in (data.stats or [])]
         project = await self._projects.create(data=payload)
@@ -75,7 +113,18 @@ class ProjectService:
         if data.slug and await self._projects.slug_exists(data.slug, exclude_id=project_id):
             raise ProjectSlugTakenError()
         update_dict: dict = {}
+        image, image_ref = await self._images.resolve(
+            image=data.image or None, image_data=data.image_data
+        )
+        if image is not None:
+            # A new image source replaces any stored image
+            update_dict["image"] = image
+            update_dict["imageRef"] = image_ref
+        elif image_ref is not None:
+            update_dict["imageRef"] = image_ref
         for field, value in data.model_dump(exclude_unset=True).items():
+            if field in ("image", "image_data"):
+                continue
             if field == "techStack" and value is not None:
                 update_dict["techStack"] = [item.model_dump() for item in (data.techStack or [])]
             elif field == "stats" and value is not None:
@@ -0,0 +1,265 @@
+import asyncio
+import hashlib
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.metrics import register_metrics
+from app.db.engine import get_engine
+from app.db.unit_of_work import unit_of_work
+from app.repositories.image_repository import ImageRepository
+from app.repositories.job_runs import claim_job_run
+from app.repositories.post_counter_repository import PostCounterRepository
+from app.repositories.token_repository import TokenRepository
+from app.services.image_store import get_image_store
+
+logger = get_logger(__name__)
+
+# A job gets its own session and returns the number of rows it touched (or None)
+JobFunc = Callable[[AsyncSession], Awaitable[int | None]]
+
+# Stored blobs looked up per query by the orphan collector
+_GC_CHUNK = 500
+
+
+@dataclass
+class JobStats:
+    runs: int = 0
+    failures: int = 0
+    skipped: int = 0  # another worker held the job's lock or already ran this period
+    last_duration_ms: float | None = None
+    total_duration_ms: float = 0.0
+    last_result: int | None = None
+    last_run_at: float | None = None  # unix time
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "lastDurationMs": self.last_duration_ms,
+            "totalDurationMs": round(self.total_duration_ms, 1),
+            "lastResult": self.last_result,
+            "lastRunAt": self.last_run_at,
+        }
+
+
+@dataclass
+class Job:
+    name: str
+    interval: float  # seconds between runs
+    func: JobFunc
+    jitter: float = 0.1  # ± fraction of *interval*, so workers don't fire in lockstep
+    stats: JobStats = field(default_factory=JobStats)
+
+    @property
+    def lock_key(self) -> int:
+        """Stable signed 64-bit advisory lock key derived from the job name."""
+        digest = hashlib.blake2b(f"miniblog:job:{self.name}".encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big", signed=True)
+
+    @property
+    def min_gap(self) -> float:
+        """Shortest spacing between two runs: the earliest a jittered timer fires."""
+        return self.interval * (1 - self.jitter)
+
+    def next_delay(self) -> float:
+        return self.interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+Leadership = Callable[[Job], AbstractAsyncContextManager[bool]]
+
+
+@asynccontextmanager
+async def advisory_leadership(job: Job) -> AsyncIterator[bool]:
+    """Yield whether this worker won the job's session-level advisory lock.
+
+    The lock lives on a dedicated connection (the job's own session may
+    commit and switch connections) and is released when the job ends. If the
+    unlock cannot be sent, the connection is discarded, which drops the lock
+    instead of returning it to the pool still held.
+    """
+    async with get_engine().connect() as conn:
+        acquired = (
+            await conn.execute(select(func.pg_try_advisory_lock(job.lock_key)))
+        ).scalar_one()
+        await conn.commit()  # session-level lock: survives the commit
+        if not acquired:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            try:
+                await conn.execute(select(func.pg_advisory_unlock(job.lock_key)))
+                await conn.commit()
+            except BaseException:
+                await conn.invalidate()
+                raise
+
+
+class Scheduler:
+    """Tiny in-process periodic job runner started from the app lifespan.
+
+    Every worker runs the same loops. The advisory lock keeps two runs of a
+    job from overlapping, and under it the worker claims the current period
+    in ``job_runs``; workers whose timers fire later in the same period find
+    it claimed and skip, so each job runs once per interval, not once per
+    worker. Jobs are cancelled on shutdown.
+    """
+
+    def __init__(self, *, leadership: Leadership = advisory_leadership) -> None:
+        self._leadership = leadership
+        self._jobs: dict[str, Job] = {}
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def jobs(self) -> list[Job]:
+        return list(self._jobs.values())
+
+    def add(self, name: str, func: JobFunc, *, interval: float, jitter: float = 0.1) -> Job:
+        job = Job(name=name, interval=interval, func=func, jitter=jitter)
+        self._jobs[name] = job
+        return job
+
+    def start(self) -> None:
+        for job in self._jobs.values():
+            self._tasks.append(asyncio.create_task(self._loop(job), name=f"job:{job.name}"))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def _loop(self, job: Job) -> None:
+        while True:
+            await asyncio.sleep(job.next_delay())
+            await self.run_once(job)
+
+    @staticmethod
+    async def _claim_period(job: Job) -> bool:
+        # Committed before the job starts, so a failed run is not retried by
+        # the next worker within the same period
+        async with unit_of_work() as session:
+            return await claim_job_run(session, job.name, min_gap=job.min_gap)
+
+    async def run_once(self, job: Job) -> None:
+        """Run *job* now if this worker can take its lock and the period is unclaimed.
+
+        Errors are logged, not raised.
+        """
+        try:
+            async with self._leadership(job) as leader:
+                if not leader or not await self._claim_period(job):
+                    job.stats.skipped += 1
+                    return
+                started = time.perf_counter()
+                job.stats.last_run_at = time.time()
+                try:
+                    async with unit_of_work() as session:
+                        job.stats.last_result = await job.func(session)
+                except Exception:
+                    job.stats.failures += 1
+                    logger.exception("Job %s failed", job.name)
+                else:
+                    job.stats.runs += 1
+                finally:
+                    elapsed = (time.perf_counter() - started) * 1000
+                    job.stats.last_duration_ms = round(elapsed, 1)
+                    job.stats.total_duration_ms += elapsed
+        except Exception:
+            # could not even reach the database for the lock; try next period
+            job.stats.failures += 1
+            logger.exception("Job %s could not acquire its lock or claim its run", job.name)
+
+    def stats(self) -> dict[str, Any]:
+        return {job.name: job.stats.as_dict() for job in self._jobs.values()}
+
+
+# ─── Housekeeping jobs ────────────────────────────────────────────────────────
+
+
+async def purge_expired_tokens(session: AsyncSession) -> int:
+    batch_size = get_settings().TOKEN_PURGE_BATCH_SIZE
+    tokens = TokenRepository(session)
+    total = 0
+    while True:
+        removed = await tokens.purge_expired(batch_size=batch_size)
+        await session.commit()  # one short transaction per batch
+        total += removed
+        if removed < batch_size:
+            return total
+
+
+async def fold_counter_shards(session: AsyncSession) -> int:
+    return await PostCounterRepository(session).fold()
+
+
+async def collect_orphan_images(session: AsyncSession) -> int:
+    """Delete stored blobs that no ``images`` / ``image_variants`` row refers to.
+
+    Only blobs older than IMAGE_GC_GRACE_SECONDS are considered, so files
+    of requests that have not committed yet are left alone.
+    """
+    store = get_image_store()
+    cutoff = time.time() - get_settings().IMAGE_GC_GRACE_SECONDS
+    stale = await asyncio.to_thread(store.stale_hashes, cutoff)
+    images = ImageRepository(session)
+    removed = 0
+    for start in range(0, len(stale), _GC_CHUNK):
+        chunk = stale[start : start + _GC_CHUNK]
+        for image_hash in set(chunk) - await images.known_hashes(chunk):
+            removed += await asyncio.to_thread(store.delete_if_stale, image_hash, cutoff)
+    return removed
+
+
+def build_scheduler() -> Scheduler:
+    settings = get_settings()
+    scheduler = Scheduler()
+    scheduler.add(
+        "purge-expired-tokens",
+        purge_expired_tokens,
+        interval=settings.TOKEN_PURGE_INTERVAL_SECONDS,
+    )
+    scheduler.add(
+        "collect-orphan-images",
+        collect_orphan_images,
+        interval=settings.IMAGE_GC_INTERVAL_SECONDS,
+    )
+    if settings.POST_COUNTER_MODE == "sharded":
+        scheduler.add(
+            "fold-counter-shards",
+            fold_counter_shards,
+            interval=settings.COUNTER_FOLD_INTERVAL_SECONDS,
+        )
+    return scheduler
+
+
+_scheduler: Scheduler | None = None
+
+
+def start_scheduler() -> None:
+    global _scheduler
+    if not get_settings().SCHEDULER_ENABLED or _scheduler is not None:
+        return
+    _scheduler = build_scheduler()
+    _scheduler.start()
+
+
+async def stop_scheduler() -> None:
+    global _scheduler
+    if _scheduler is not None:
+        await _scheduler.stop()
+        _scheduler = None
+
+
+register_metrics("jobs", lambda: _scheduler.stats() if _scheduler is not None else {})
@@ -0,0 +1,58 @@
+import html
+
+from app.repositories.search_repository import (
+    HIGHLIGHT_START,
+    HIGHLIGHT_STOP,
+    SearchRepository,
+)
+from app.schemas.common import page_count
+from app.schemas.search import SearchHit, SearchResponse, TagFacet
+from app.services.post_service import _to_summary
+from app.services.viewer_context import ViewerContext
+
+
+def highlight_html(fragment: str) -> str:
+    """Escape a ts_headline fragment and turn the match markers into ``<mark>`` tags."""
+    return (
+        html.escape(fragment).replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_STOP, "</mark>")
+    )
+
+
+class SearchService:
+    def __init__(self, search_repo: SearchRepository) -> None:
+        self._search = search_repo
+
+    async def search(
+        self,
+        *,
+        q: str,
+        tags: list[str] | None,
+        page: int,
+        size: int,
+        viewer: ViewerContext,
+    ) -> SearchResponse:
+        rows, total = await self._search.search(q, tags=tags, skip=(page - 1) * size, take=size)
+        facets = await self._search.tag_facets(q, tags=tags)
+
+        liked = await viewer.load_post_likes([row.post.id for row in rows])
+        items = [
+            SearchHit(
+                **_to_summary(row.post).model_dump(),
+                rank=row.rank,
+                titleHighlight=highlight_html(row.title),
+                snippet=highlight_html(row.snippet),
+            )
+            for row in rows
+        ]
+        for item in items:
+            item.likedByMe = item.id in liked
+
+        return SearchResponse(
+            items=items,
+            total=total,
+            page=page,
+            size=size,
+            pages=page_count(total, size),
+            query=q,
+            facets=[TagFacet(name=name, count=count) for name, count in facets],
+        )
@@ -0,0 +1,49 @@
+from app.repositories.post_repository import PostRepository
+from app.services.like_buffer import get_like_buffer
+
+
+class ViewerContext:
+    """Request-scoped, viewer-specific state (e.g. ``likedByMe``).
+
+    Callers hand over every post ID they are about to render and the context
+    resolves them with a single ``IN (...)`` query, memoising the answers for
+    the rest of the request. Anonymous viewers never touch the database.
+    """
+
+    def __init__(self, post_repo: PostRepository, user_id: str | None) -> None:
+        self._posts = post_repo
+        self._user_id = user_id
+        self._liked: set[str] = set()
+        self._loaded: set[str] = set()
+
+    @property
+    def user_id(self) -> str | None:
+        return self._user_id
+
+    @property
+    def is_authenticated(self) -> bool:
+        return self._user_id is not None
+
+    async def load_post_likes(self, post_ids: list[str]) -> set[str]:
+        """Return which of *post_ids* the viewer liked, fetching unknown IDs in one query."""
+        if self._user_id is None:
+            return set()
+        missing = [pid for pid in dict.fromkeys(post_ids) if pid not in self._loaded]
+        if missing:
+            self._liked |= await self._posts.liked_post_ids(self._user_id, missing)
+            self._loaded.update(missing)
+        liked = {pid for pid in post_ids if pid in self._liked}
+
+        buffer = get_like_buffer()
+        if buffer is not None:
+            # the viewer's own not-yet-flushed likes win over the stored rows
+            for pid in post_ids:
+                state = buffer.pending_state(pid, self._user_id)
+                if state is True:
+                    liked.add(pid)
+                elif state is False:
+                    liked.discard(pid)
+        return liked
+
+    async def has_liked(self, post_id: str) -> bool:
+        return post_id in await self.load_post_likes([post_id])
@@ -0,0 +1,57 @@
+"""Pick BCRYPT_ROUNDS for this host.
+
+Times bcrypt at increasing cost factors and recommends the highest one whose
+median hash time stays within the target. Run it on the production host
+type — the right cost depends on the CPU. Existing hashes are moved to the
+new cost transparently on the user's next login.
+
+Usage:
+    python scripts/calibrate_bcrypt.py                 # target 250 ms
+    python scripts/calibrate_bcrypt.py --target-ms 100
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+import bcrypt
+
+MIN_ROUNDS = 10  # below this bcrypt offers too little protection
+MAX_ROUNDS = 16
+SAMPLES = 5
+
+
+def time_rounds(rounds: int) -> float:
+    """Median milliseconds for one hash at *rounds*."""
+    timings = []
+    for _ in range(SAMPLES):
+        salt = bcrypt.gensalt(rounds=rounds)
+        start = time.perf_counter()
+        bcrypt.hashpw(b"calibration-password", salt)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    args = parser.parse_args()
+
+    chosen = None
+    for rounds in range(MIN_ROUNDS, MAX_ROUNDS + 1):
+        elapsed = time_rounds(rounds)
+        print(f"rounds={rounds:2d}  {elapsed:8.1f} ms")
+        if elapsed > args.target_ms:
+            break
+        chosen = rounds  # each extra round doubles the cost: stop at the first miss
+
+    if chosen is None:
+        print(f"\nEven {MIN_ROUNDS} rounds exceed {args.target_ms:.0f} ms on this host.")
+        chosen = MIN_ROUNDS
+    print(f"\nRecommended: BCRYPT_ROUNDS={chosen}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
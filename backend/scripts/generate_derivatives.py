@@ -0,0 +1,51 @@
+"""Render thumbnails, WebP/AVIF variants and placeholders for stored images
+that do not have them yet (e.g. images moved out of image_data by migration).
+
+Usage:
+    python scripts/generate_derivatives.py
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select
+
+from app.core.exceptions import AppException
+from app.db.engine import close_engine, get_session_factory
+from app.db.models import Image
+from app.repositories.image_repository import ImageRepository
+from app.services.image_derivatives import shutdown_derivative_pool
+from app.services.image_service import ImageService
+from app.services.image_store import get_image_store
+
+
+async def main() -> None:
+    store = get_image_store()
+    async with get_session_factory()() as session:
+        result = await session.execute(select(Image.hash).where(Image.placeholder.is_(None)))
+        hashes = list(result.scalars().all())
+        print(f"Found {len(hashes)} image(s) without derivatives")
+
+        service = ImageService(ImageRepository(session), store)
+        for i, image_hash in enumerate(hashes, 1):
+            raw = await store.get(image_hash)
+            if raw is None:
+                print(f"  [{i}/{len(hashes)}] {image_hash[:12]} ✗ missing from store")
+                continue
+            try:
+                await service.render_derivatives(image_hash, raw)
+                await session.commit()
+                print(f"  [{i}/{len(hashes)}] {image_hash[:12]} ✓")
+            except AppException as exc:
+                await session.rollback()
+                print(f"  [{i}/{len(hashes)}] {image_hash[:12]} ✗ {exc.detail}", file=sys.stderr)
+
+    shutdown_derivative_pool()
+    await close_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
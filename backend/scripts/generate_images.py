@@ -2,8 +2,8 @@
 """Admin script: generate AI images for all existing posts and projects.
 
 Calls Gemini to build a prompt from each item's fields, then calls Gemini
-image generation to produce a cover image and stores the base64 result in
-the `image_data` column.  Errors on individual items are logged but do not
+image generation to produce a cover image and stores it in the image store,
+keeping the reference in the `image_ref` column.  Errors on individual items are logged but do not
 abort the run.
 
 Usage (from the backend directory):
@@ -25,7 +25,10 @@ from sqlalchemy.orm import joinedload, selectinload
 from app.core.config import get_settings
 from app.db.engine import get_session_factory
 from app.db.models import Post, PostTag, Project
+from app.repositories.collection_versions import bump_versions
+from app.repositories.image_repository import ImageRepository
 from app.services.image_ai_service import generate_image, generate_prompt
+from app.services.image_service import ImageService
 
 _settings = get_settings()
 
@@ -79,13 +82,15 @@ async def _process_posts(session) -> None:
             )
             print(f"    prompt: {prompt[:90]}…")
             image_data = await generate_image(prompt)
+            image_ref = await ImageService(ImageRepository(session)).ingest_base64(image_data)
 
             # Re-fetch by PK to avoid working with expired instances
             row = await session.execute(select(Post).where(Post.id == item.id))
             post = row.scalar_one()
-            post.image_data = image_data
+            post.imageRef = image_ref
+            await bump_versions(session, "posts")
             await session.commit()
-            print(f"    ✓ saved ({len(image_data)} base64 chars)")
+            print(f"    ✓ saved ({image_ref[:12]})")
         except Exception as exc:
             await session.rollback()
             print(f"    ✗ ERROR: {exc}", file=sys.stderr)
@@ -119,12 +124,14 @@ async def _process_projects(session) -> None:
             )
             print(f"    prompt: {prompt[:90]}…")
             image_data = await generate_image(prompt)
+            image_ref = await ImageService(ImageRepository(session)).ingest_base64(image_data)
 
             row = await session.execute(select(Project).where(Project.id == item.id))
             project = row.scalar_one()
-            project.image_data = image_data
+            project.imageRef = image_ref
+            await bump_versions(session, "projects")
             await session.commit()
-            print(f"    ✓ saved ({len(image_data)} base64 chars)")
+            print(f"    ✓ saved ({image_ref[:12]})")
         except Exception as exc:
             await session.rollback()
             print(f"    ✗ ERROR: {exc}", file=sys.stderr)
@@ -0,0 +1,40 @@
+"""Recompute denormalized counters from their source tables.
+
+Sets ``posts.like_count`` / ``posts.comment_count`` from ``post_likes`` and
+``comments``, clears any pending shard deltas, and sets ``tags.post_count``
+from ``post_tags``. Safe to run at any time.
+
+Usage:
+    python scripts/reconcile_counters.py          # full recount
+    python scripts/reconcile_counters.py --fold   # only fold pending shard deltas
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.engine import close_engine, get_session_factory
+from app.repositories.post_counter_repository import PostCounterRepository
+from app.repositories.tag_repository import TagRepository
+
+
+async def reconcile(fold_only: bool) -> None:
+    async with get_session_factory()() as session:
+        counters = PostCounterRepository(session)
+        if fold_only:
+            touched = await counters.fold()
+            print(f"Folded pending deltas into {touched} post(s).")
+        else:
+            corrected = await counters.reconcile()
+            print(f"Corrected counters on {corrected} post(s).")
+            corrected = await TagRepository(session).reconcile_counts()
+            print(f"Corrected post counts on {corrected} tag(s).")
+        await session.commit()
+
+    await close_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(reconcile(fold_only="--fold" in sys.argv[1:]))
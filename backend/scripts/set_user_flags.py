@@ -0,0 +1,67 @@
+"""Activate/deactivate a user or grant/revoke admin.
+
+The principal cache lives in each API worker's memory, which this
+process cannot reach: running workers keep serving the old flags until
+their cached entry expires, so PRINCIPAL_CACHE_TTL_SECONDS is the only
+bound on how long a deactivated user or revoked admin stays effective.
+``--logout`` additionally revokes every refresh token and invalidates the
+access tokens already issued (within the same bound).
+
+Usage:
+    python scripts/set_user_flags.py user@example.com --admin
+    python scripts/set_user_flags.py user@example.com --no-admin
+    python scripts/set_user_flags.py user@example.com --deactivate --logout
+    python scripts/set_user_flags.py user@example.com --activate
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.engine import close_engine
+from app.db.unit_of_work import unit_of_work
+from app.repositories.token_repository import TokenRepository
+from app.repositories.user_repository import UserRepository
+
+
+async def set_flags(args: argparse.Namespace) -> int:
+    try:
+        async with unit_of_work() as session:
+            users = UserRepository(session)
+            user = await users.get_by_email(args.email)
+            if user is None:
+                print(f"No user with email {args.email}.")
+                return 1
+            updated = await users.set_flags(user.id, is_active=args.active, is_admin=args.admin)
+            if updated is None:
+                print(f"User {args.email} was deleted meanwhile.")
+                return 1
+            if args.logout:
+                await TokenRepository(session).revoke_all_for_user(updated.id)
+            print(
+                f"{args.email}: active={updated.isActive} admin={updated.isAdmin}"
+                + (" (all sessions revoked)" if args.logout else "")
+            )
+    finally:
+        await close_engine()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("email")
+    active = parser.add_mutually_exclusive_group()
+    active.add_argument("--activate", dest="active", action="store_const", const=True)
+    active.add_argument("--deactivate", dest="active", action="store_const", const=False)
+    admin = parser.add_mutually_exclusive_group()
+    admin.add_argument("--admin", dest="admin", action="store_const", const=True)
+    admin.add_argument("--no-admin", dest="admin", action="store_const", const=False)
+    parser.add_argument("--logout", action="store_true", help="revoke all sessions")
+    return asyncio.run(set_flags(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+"""Unit tests for the in-process LRU cache."""
+
+import time
+
+from app.core.cache import LRUCache
+
+
+class TestLRUCache:
+    def test_get_after_set(self) -> None:
+        cache: LRUCache[int] = LRUCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.stats.hits == 1
+
+    def test_miss_is_counted(self) -> None:
+        cache: LRUCache[int] = LRUCache(maxsize=2, ttl=60)
+        assert cache.get("missing") is None
+        assert cache.stats.misses == 1
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        cache: LRUCache[int] = LRUCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats.evictions == 1
+
+    def test_expired_entries_are_misses(self, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+        cache: LRUCache[int] = LRUCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_delete_where(self) -> None:
+        cache: LRUCache[int] = LRUCache(maxsize=10, ttl=60)
+        cache.set(("posts", None), 1)
+        cache.set(("posts", "u1"), 2)
+        cache.set(("projects", False), 3)
+        cache.delete_where(lambda key: key[0] == "posts")  # type: ignore[index]
+        assert len(cache) == 1
+        assert cache.get(("projects", False)) == 3
@@ -0,0 +1,46 @@
+"""Unit tests for assembling threaded comment responses."""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+from app.services.comment_service import _build_thread
+
+
+def _comment(comment_id: str, parent_id: str | None, reply_count: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=comment_id,
+        body=f"body {comment_id}",
+        postId="p1",
+        authorId="u1",
+        author=SimpleNamespace(displayName="Ana"),
+        parentId=parent_id,
+        createdAt=datetime(2024, 1, 1, tzinfo=UTC),
+        reply_count=reply_count,
+    )
+
+
+class TestBuildThread:
+    def test_rows_are_nested_under_their_parents_in_order(self) -> None:
+        rows = [
+            _comment("a", None, 2),
+            _comment("b", None, 1),
+            _comment("a1", "a", 1),
+            _comment("b1", "b"),
+            _comment("a2", "a"),
+            _comment("a1x", "a1"),
+        ]
+        roots = _build_thread(rows)
+        assert [r.id for r in roots] == ["a", "b"]
+        assert [r.id for r in roots[0].replies] == ["a1", "a2"]
+        assert [r.id for r in roots[0].replies[0].replies] == ["a1x"]
+        assert [r.id for r in roots[1].replies] == ["b1"]
+
+    def test_cut_off_replies_keep_their_count(self) -> None:
+        (root,) = _build_thread([_comment("a", None, 3)])
+        assert root.replies == [] and root.replyCount == 3
+
+    def test_reply_page_items_are_roots(self) -> None:
+        rows = [_comment("r1", "a", 1), _comment("r1x", "r1"), _comment("r2", "a")]
+        roots = _build_thread(rows, root_parent_id="a")
+        assert [r.id for r in roots] == ["r1", "r2"]
+        assert [r.id for r in roots[0].replies] == ["r1x"]
@@ -0,0 +1,42 @@
+"""Unit tests for the instrumented connection pool."""
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from app.db.pool import InstrumentedPool
+
+
+class _FakeConnection:
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def _pool(**kwargs: object) -> InstrumentedPool:
+    return InstrumentedPool(_FakeConnection, **kwargs)  # type: ignore[arg-type]
+
+
+class TestInstrumentedPool:
+    async def test_gauges_follow_checkouts(self) -> None:
+        pool = _pool(pool_size=1, max_overflow=1)
+        first = await greenlet_spawn(pool.connect)
+        second = await greenlet_spawn(pool.connect)
+        stats = pool.stats()
+        assert (stats["checkedOut"], stats["overflow"], stats["checkouts"]) == (2, 1, 2)
+        first.close()
+        second.close()
+        stats = pool.stats()
+        assert (stats["checkedOut"], stats["idle"], stats["overflow"]) == (0, 1, 0)
+
+    async def test_exhausted_pool_counts_timeouts(self) -> None:
+        pool = _pool(pool_size=1, max_overflow=0, timeout=0.01)
+        held = await greenlet_spawn(pool.connect)
+        with pytest.raises(exc.TimeoutError):
+            await greenlet_spawn(pool.connect)
+        stats = pool.stats()
+        assert (stats["timeouts"], stats["checkouts"]) == (1, 2)
+        assert stats["waitMsMax"] >= 10
+        held.close()
@@ -0,0 +1,82 @@
+"""Unit tests for conditional GET validators."""
+
+from datetime import UTC, datetime
+
+from fastapi import Request, Response
+
+from app.core.http_cache import check_not_modified, etag_matches, make_etag
+
+_MODIFIED = datetime(2024, 5, 1, 12, 0, 0, 500000, tzinfo=UTC)
+
+
+def _request(**headers: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()],
+        }
+    )
+
+
+class TestMakeEtag:
+    def test_is_weak_and_stable(self) -> None:
+        assert make_etag("posts", 1) == make_etag("posts", 1)
+        assert make_etag("posts", 1).startswith('W/"')
+
+    def test_changes_with_inputs(self) -> None:
+        assert make_etag("posts", 1) != make_etag("posts", 2)
+
+
+class TestEtagMatches:
+    def test_compares_whole_tags_from_the_list(self) -> None:
+        assert etag_matches('"a", W/"abc"', '"abc"')
+        assert not etag_matches('"abcd"', '"abc"')
+        assert not etag_matches('"xabc"', '"abc"')
+
+    def test_star_matches_anything(self) -> None:
+        assert etag_matches("*", '"abc"')
+
+
+class TestCheckNotModified:
+    def test_without_validators_headers_are_attached(self) -> None:
+        response = Response()
+        etag = make_etag("x")
+        assert check_not_modified(_request(), response, etag=etag, last_modified=_MODIFIED) is None
+        assert response.headers["etag"] == etag
+        assert response.headers["last-modified"] == "Wed, 01 May 2024 12:00:00 GMT"
+
+    def test_matching_etag_is_304(self) -> None:
+        etag = make_etag("x")
+        result = check_not_modified(_request(if_none_match=f'"a", {etag}'), Response(), etag=etag)
+        assert result is not None and result.status_code == 304
+
+    def test_strong_form_of_weak_etag_matches(self) -> None:
+        etag = make_etag("x")
+        request = _request(if_none_match=etag.removeprefix("W/"))
+        assert check_not_modified(request, Response(), etag=etag) is not None
+
+    def test_stale_etag_wins_over_if_modified_since(self) -> None:
+        request = _request(
+            if_none_match='W/"old"', if_modified_since="Wed, 01 May 2024 12:00:00 GMT"
+        )
+        result = check_not_modified(
+            request, Response(), etag=make_etag("x"), last_modified=_MODIFIED
+        )
+        assert result is None
+
+    def test_if_modified_since_uses_second_resolution(self) -> None:
+        fresh = _request(if_modified_since="Wed, 01 May 2024 12:00:00 GMT")
+        stale = _request(if_modified_since="Wed, 01 May 2024 11:59:59 GMT")
+        etag = make_etag("x")
+        assert check_not_modified(fresh, Response(), etag=etag, last_modified=_MODIFIED)
+        assert not check_not_modified(stale, Response(), etag=etag, last_modified=_MODIFIED)
+
+    def test_viewer_dependent_responses_vary_on_authorization(self) -> None:
+        response = Response()
+        check_not_modified(
+            _request(), response, etag=make_etag("x"), private=True, vary="Authorization"
+        )
+        assert response.headers["vary"] == "Authorization"
+        assert response.headers["cache-control"].startswith("private")
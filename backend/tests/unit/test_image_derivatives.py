@@ -0,0 +1,64 @@
+"""Unit tests for the image derivative renderer."""
+
+import io
+
+import pytest
+from PIL import Image
+
+from app.core.exceptions import InvalidImageError
+from app.services import image_service as image_service_module
+from app.services.image_derivatives import (
+    VARIANT_WIDTHS,
+    render_derivatives,
+    variant_formats,
+)
+
+
+def _png(width: int, height: int) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 80, 40)).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class TestRenderDerivatives:
+    def test_renders_every_smaller_width_in_every_format(self) -> None:
+        result = render_derivatives(_png(1600, 900))
+        assert (result.width, result.height) == (1600, 900)
+        expected = {(w, f) for w in VARIANT_WIDTHS for f in variant_formats()}
+        assert {(v.width, v.format) for v in result.variants} == expected
+
+    def test_never_upscales(self) -> None:
+        result = render_derivatives(_png(200, 100))
+        assert {v.width for v in result.variants} == {200}
+
+    def test_placeholder_is_small_inline_webp(self) -> None:
+        result = render_derivatives(_png(1600, 900))
+        assert result.placeholder.startswith("data:image/webp;base64,")
+        assert len(result.placeholder) < 1024
+
+
+class TestDecompressionBombs:
+    def test_pixel_flood_raises_instead_of_warning(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Just over the limit: Pillow itself would only warn here
+        monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 1600 * 900 - 1)
+        with pytest.raises(Image.DecompressionBombWarning):
+            render_derivatives(_png(1600, 900))
+
+    def test_far_over_the_limit_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 1000)
+        with pytest.raises(Image.DecompressionBombError):
+            render_derivatives(_png(1600, 900))
+
+    async def test_service_maps_bombs_to_invalid_image(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def bomb(raw: bytes) -> None:
+            raise Image.DecompressionBombError("too many pixels")
+
+        monkeypatch.setattr(image_service_module, "generate_derivatives", bomb)
+        service = image_service_module.ImageService(
+            image_repo=None,  # type: ignore[arg-type]
+            store=object(),  # type: ignore[arg-type]
+        )
+        with pytest.raises(InvalidImageError):
+            await service.render_derivatives("0" * 64, b"raw")
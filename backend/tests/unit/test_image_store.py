@@ -0,0 +1,68 @@
+"""Unit tests for the content-addressed image store."""
+
+import base64
+import hashlib
+import os
+
+import pytest
+
+from app.core.exceptions import InvalidImageError
+from app.services.image_service import decode_image_data, image_url, parse_image_url
+from app.services.image_store import LocalImageStore, sniff_content_type
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+
+
+class TestLocalImageStore:
+    async def test_put_is_content_addressed(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        store = LocalImageStore(tmp_path)
+        image_hash = await store.put(PNG)
+        assert image_hash == hashlib.sha256(PNG).hexdigest()
+        assert await store.get(image_hash) == PNG
+
+    async def test_duplicate_put_is_deduplicated(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        store = LocalImageStore(tmp_path)
+        assert await store.put(PNG) == await store.put(PNG)
+        assert len(list(tmp_path.rglob("*"))) == 2  # one shard dir + one blob
+
+    async def test_stale_blobs_are_collectable_until_rewritten(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        store = LocalImageStore(tmp_path)
+        image_hash = await store.put(PNG)
+        path = store.local_path(image_hash)
+        assert path is not None
+        os.utime(path, (0, 0))
+        assert store.stale_hashes(older_than=1) == [image_hash]
+
+        await store.put(PNG)  # a new reference refreshes the blob
+        assert store.stale_hashes(older_than=1) == []
+        assert store.delete_if_stale(image_hash, older_than=1) is False
+
+        os.utime(path, (0, 0))
+        assert store.delete_if_stale(image_hash, older_than=1) is True
+        assert store.local_path(image_hash) is None
+
+    def test_unknown_or_malformed_hash_has_no_path(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        store = LocalImageStore(tmp_path)
+        assert store.local_path("0" * 64) is None
+        assert store.local_path("../etc/passwd") is None
+
+
+class TestImageHelpers:
+    def test_sniff_content_type(self) -> None:
+        assert sniff_content_type(PNG) == "image/png"
+        assert sniff_content_type(b"\xff\xd8\xff\xe0") == "image/jpeg"
+        assert sniff_content_type(b"RIFF\x00\x00\x00\x00WEBPVP8 ") == "image/webp"
+        assert sniff_content_type(b"<svg></svg>") is None
+
+    def test_decode_accepts_data_uri(self) -> None:
+        encoded = base64.b64encode(PNG).decode()
+        assert decode_image_data(f"data:image/png;base64,{encoded}") == PNG
+
+    def test_decode_rejects_garbage(self) -> None:
+        with pytest.raises(InvalidImageError):
+            decode_image_data("not base64!")
+
+    def test_own_image_url_round_trips(self) -> None:
+        image_hash = hashlib.sha256(PNG).hexdigest()
+        assert parse_image_url(image_url(image_hash)) == image_hash
+        assert parse_image_url("https://example.com/cover.png") is None
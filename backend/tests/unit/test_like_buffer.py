@@ -0,0 +1,102 @@
+"""Unit tests for the write-behind LikeBuffer."""
+
+import pytest
+
+from app.services import like_buffer as like_buffer_module
+from app.services.like_buffer import LikeBuffer
+
+
+class _FakeRepo:
+    """Stands in for PostRepository; one instance serves every flush."""
+
+    def __init__(self) -> None:
+        self.batches: list[tuple[list, list]] = []
+        self.fail = False
+
+    def __call__(self, session: object) -> "_FakeRepo":
+        return self
+
+    async def apply_like_batch(self, *, likes: list, unlikes: list) -> set[str]:
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.batches.append((sorted(likes), sorted(unlikes)))
+        return set()
+
+
+class _FakeSession:
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+
+@pytest.fixture
+def repo(monkeypatch: pytest.MonkeyPatch) -> _FakeRepo:
+    fake = _FakeRepo()
+    monkeypatch.setattr(like_buffer_module, "PostRepository", fake)
+    monkeypatch.setattr(like_buffer_module, "unit_of_work", _FakeSession)
+    return fake
+
+
+@pytest.fixture
+def buffer(repo: _FakeRepo) -> LikeBuffer:
+    return LikeBuffer(interval=60, max_pending=100)
+
+
+class TestLikeBuffer:
+    def test_latest_intent_per_viewer_wins(self, buffer: LikeBuffer) -> None:
+        buffer.record("p1", "u1", liked=True, stored=False)
+        buffer.record("p1", "u1", liked=False, stored=False)
+        buffer.record("p1", "u1", liked=True, stored=False)
+        assert len(buffer) == 1
+        assert buffer.pending_state("p1", "u1") is True
+        assert buffer.pending_delta("p1") == 1
+
+    def test_repeated_like_of_stored_row_is_a_no_op_delta(self, buffer: LikeBuffer) -> None:
+        buffer.record("p1", "u1", liked=True, stored=True)
+        buffer.record("p1", "u2", liked=False, stored=True)
+        assert buffer.pending_delta("p1") == -1
+        assert buffer.pending_delta("p2") == 0
+
+    async def test_flush_writes_one_batch_and_clears(
+        self, buffer: LikeBuffer, repo: _FakeRepo
+    ) -> None:
+        buffer.record("p1", "u1", liked=True, stored=False)
+        buffer.record("p2", "u1", liked=False, stored=True)
+        await buffer.flush()
+        assert repo.batches == [([("p1", "u1")], [("p2", "u1")])]
+        assert len(buffer) == 0
+        assert buffer.pending_state("p1", "u1") is None
+        await buffer.flush()
+        assert len(repo.batches) == 1  # nothing left to write
+
+    async def test_failed_flush_requeues_intents(self, buffer: LikeBuffer, repo: _FakeRepo) -> None:
+        buffer.record("p1", "u1", liked=True, stored=False)
+        repo.fail = True
+        await buffer.flush()
+        assert buffer.failed_flushes == 1
+        assert buffer.pending_state("p1", "u1") is True
+        assert buffer.pending_delta("p1") == 1
+
+    async def test_delta_survives_a_failed_flush_and_newer_intents(
+        self, buffer: LikeBuffer, repo: _FakeRepo
+    ) -> None:
+        buffer.record("p1", "u1", liked=True, stored=False)
+        buffer.record("p1", "u2", liked=True, stored=False)
+        repo.fail = True
+        await buffer.flush()
+        assert buffer.pending_delta("p1") == 2
+        buffer.record("p1", "u1", liked=False, stored=False)
+        assert buffer.pending_delta("p1") == 1
+        repo.fail = False
+        await buffer.flush()
+        assert buffer.pending_delta("p1") == 0
+
+    async def test_close_flushes_remaining_intents(
+        self, buffer: LikeBuffer, repo: _FakeRepo
+    ) -> None:
+        buffer.start()
+        buffer.record("p1", "u1", liked=True, stored=False)
+        await buffer.close()
+        assert repo.batches == [([("p1", "u1")], [])]
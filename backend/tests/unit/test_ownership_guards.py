@@ -0,0 +1,63 @@
+"""Unit tests for ownership folded into write statements."""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.exceptions import ForbiddenError, PostNotFoundError
+from app.repositories.comment_repository import CommentRepository
+from app.services.post_service import PostService
+
+
+class _Result:
+    def __init__(self, value: object) -> None:
+        self._value = value
+
+    def scalar_one_or_none(self) -> object:
+        return self._value
+
+
+class _FakeSession:
+    def __init__(self, value: object) -> None:
+        self._value = value
+        self.statements: list[str] = []
+        self.rolled_back = False
+        self.committed = False
+
+    async def execute(self, statement):  # type: ignore[no-untyped-def]
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        return _Result(self._value)
+
+    async def rollback(self) -> None:
+        self.rolled_back = True
+
+    async def commit(self) -> None:
+        self.committed = True
+
+
+class _FakePosts:
+    def __init__(self, owner: str | None) -> None:
+        self._owner = owner
+
+    async def owner_of(self, post_id: str) -> str | None:
+        return self._owner
+
+
+class TestGuardedCommentDelete:
+    async def test_foreign_comment_is_left_alone(self) -> None:
+        session = _FakeSession(None)
+        repo = CommentRepository(session)  # type: ignore[arg-type]
+        assert await repo.delete("c1", author_id="u1") is False
+        assert "comments.author_id = " in session.statements[0]
+        # ending the transaction is left to the request's unit of work
+        assert not session.rolled_back and not session.committed
+
+
+class TestRaiseNotOwned:
+    @pytest.mark.parametrize(
+        ("owner", "error"), [(None, PostNotFoundError), ("someone-else", ForbiddenError)]
+    )
+    async def test_missing_vs_foreign(self, owner: str | None, error: type) -> None:
+        service = PostService.__new__(PostService)
+        service._posts = _FakePosts(owner)  # type: ignore[assignment]
+        with pytest.raises(error):
+            await service._raise_not_owned("p1")
@@ -0,0 +1,39 @@
+"""Unit tests for keyset pagination cursors."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from app.core.exceptions import InvalidCursorError
+from app.core.pagination import (
+    decode_cursor,
+    decode_tag_cursor,
+    encode_cursor,
+    encode_tag_cursor,
+)
+
+
+class TestCursor:
+    def test_round_trip(self) -> None:
+        created_at = datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=UTC)
+        token = encode_cursor(created_at, "post-1")
+        assert decode_cursor(token) == (created_at, "post-1")
+
+    def test_token_is_url_safe(self) -> None:
+        token = encode_cursor(datetime.now(UTC), "a/b+c")
+        assert all(ch.isalnum() or ch in "-_" for ch in token)
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "e30", "WyJ4Il0"])
+    def test_garbage_is_rejected(self, token: str) -> None:
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(token)
+
+
+class TestTagCursor:
+    def test_round_trip(self) -> None:
+        assert decode_tag_cursor(encode_tag_cursor(42, "python")) == (42, "python")
+
+    def test_post_cursor_is_rejected(self) -> None:
+        token = encode_cursor(datetime.now(UTC), "post-1")
+        with pytest.raises(InvalidCursorError):
+            decode_tag_cursor(token)
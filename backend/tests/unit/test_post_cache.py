@@ -0,0 +1,137 @@
+"""Unit tests for the read-through post cache in PostService.get_post."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.cache import LRUCache
+from app.core.exceptions import PostNotFoundError
+from app.repositories.post_repository import post_version
+from app.services import post_cache
+from app.services.post_cache import PostVersion
+from app.services.post_service import PostService
+from app.services.viewer_context import ViewerContext
+
+
+def _post(post_id: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=post_id,
+        title="Title",
+        image="https://example.com/a.png",
+        imageRef=None,
+        imageAsset=None,
+        body="Body",
+        tags=[],
+        authorId="u1",
+        author=SimpleNamespace(displayName="Ana"),
+        createdAt=datetime(2024, 1, 1),
+        updatedAt=datetime(2024, 1, 2),
+        likeCount=3,
+        commentCount=1,
+    )
+
+
+class _FakePostRepo:
+    """A post row that tests may change behind the cache, as another worker would."""
+
+    def __init__(self) -> None:
+        self.loads = 0
+        self.row: SimpleNamespace | None = _post("p1")
+
+    async def get_version(self, post_id: str) -> PostVersion | None:
+        if self.row is None:
+            return None
+        return post_version(self.row)  # type: ignore[arg-type]
+
+    async def get_by_id(self, post_id: str) -> SimpleNamespace | None:
+        self.loads += 1
+        return self.row
+
+    async def liked_post_ids(self, user_id: str, post_ids: list[str]) -> set[str]:
+        return set(post_ids) if user_id == "fan" else set()
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():  # type: ignore[no-untyped-def]
+    original = post_cache.get_post_cache()
+    post_cache.set_post_cache(LRUCache(maxsize=10, ttl=60))
+    yield
+    post_cache.set_post_cache(original)
+
+
+class TestPostCache:
+    async def test_second_read_is_served_from_cache(self) -> None:
+        repo = _FakePostRepo()
+        service = PostService(repo, None)  # type: ignore[arg-type]
+        viewer = ViewerContext(repo, None)  # type: ignore[arg-type]
+        await service.get_post("p1", viewer=viewer)
+        await service.get_post("p1", viewer=viewer)
+        assert repo.loads == 1
+        assert post_cache.get_post_cache().stats.hits == 1
+
+    async def test_viewer_state_is_layered_on_after_lookup(self) -> None:
+        repo = _FakePostRepo()
+        service = PostService(repo, None)  # type: ignore[arg-type]
+        liked, liked_etag = await service.get_post("p1", viewer=ViewerContext(repo, "fan"))  # type: ignore[arg-type]
+        other, other_etag = await service.get_post("p1", viewer=ViewerContext(repo, "u2"))  # type: ignore[arg-type]
+        assert liked.likedByMe is True
+        assert other.likedByMe is False
+        assert liked_etag != other_etag
+        assert post_cache.get_post_cache().get("p1").response.likedByMe is False  # type: ignore[union-attr]
+
+    async def test_invalidation_forces_reload(self) -> None:
+        repo = _FakePostRepo()
+        service = PostService(repo, None)  # type: ignore[arg-type]
+        viewer = ViewerContext(repo, None)  # type: ignore[arg-type]
+        await service.get_post("p1", viewer=viewer)
+        post_cache.invalidate_post("p1")
+        await service.get_post("p1", viewer=viewer)
+        assert repo.loads == 2
+
+    async def test_etag_matches_the_probed_version(self) -> None:
+        repo = _FakePostRepo()
+        service = PostService(repo, None)  # type: ignore[arg-type]
+        viewer = ViewerContext(repo, None)  # type: ignore[arg-type]
+        _, etag = await service.get_post("p1", viewer=viewer)
+        probed = await service.get_post_etag(
+            "p1", (datetime(2024, 1, 2), 3, 1, "Ana"), viewer=viewer
+        )
+        assert etag == probed
+
+    async def test_newer_version_probe_refreshes_entry(self) -> None:
+        repo = _FakePostRepo()
+        service = PostService(repo, None)  # type: ignore[arg-type]
+        viewer = ViewerContext(repo, None)  # type: ignore[arg-type]
+        await service.get_post("p1", viewer=viewer)
+        await service.get_post("p1", viewer=viewer, version=(datetime(2024, 1, 2), 3, 1, "Ana"))
+        assert repo.loads == 1
+        await service.get_post("p1", viewer=viewer, version=(datetime(2024, 1, 2), 4, 1, "Ana"))
+        assert repo.loads == 2
+        await service.get_post("p1", viewer=viewer, version=(datetime(2024, 1, 2), 3, 1, "Bia"))
+        assert repo.loads == 3  # a renamed author is a new version too
+
+    async def test_write_on_another_worker_is_not_served_stale(self) -> None:
+        repo = _FakePostRepo()
+        service = PostService(repo, None)  # type: ignore[arg-type]
+        viewer = ViewerContext(repo, None)  # type: ignore[arg-type]
+        await service.get_post("p1", viewer=viewer)
+        # Edited and liked elsewhere: this worker's entry was never invalidated
+        repo.row = _post("p1")
+        repo.row.body = "Edited"
+        repo.row.likeCount = 4
+        repo.row.updatedAt = datetime(2024, 1, 3)
+        post, _ = await service.get_post("p1", viewer=viewer)
+        assert post.body == "Edited"
+        assert post.likeCount == 4
+        assert repo.loads == 2
+
+    async def test_post_deleted_on_another_worker_is_not_found(self) -> None:
+        repo = _FakePostRepo()
+        service = PostService(repo, None)  # type: ignore[arg-type]
+        viewer = ViewerContext(repo, None)  # type: ignore[arg-type]
+        await service.get_post("p1", viewer=viewer)
+        repo.row = None
+        with pytest.raises(PostNotFoundError):
+            await service.get_post("p1", viewer=viewer)
+        assert post_cache.get_post_cache().get("p1") is None
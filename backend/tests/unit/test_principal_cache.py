@@ -0,0 +1,73 @@
+"""Unit tests for resolving access tokens through the principal cache."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.api.deps import _resolve_principal
+from app.core.cache import LRUCache
+from app.services import principal_cache
+
+
+class _Result:
+    def __init__(self, user: object) -> None:
+        self._user = user
+
+    def scalar_one_or_none(self) -> object:
+        return self._user
+
+
+class _FakeSession:
+    def __init__(self, **fields: object) -> None:
+        self.user = SimpleNamespace(
+            id="u1",
+            email="ana@example.com",
+            displayName="Ana",
+            isAdmin=False,
+            isActive=True,
+            tokenVersion=0,
+        )
+        self.user.__dict__.update(fields)
+        self.queries = 0
+
+    async def execute(self, statement):  # type: ignore[no-untyped-def]
+        self.queries += 1
+        return _Result(self.user)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(principal_cache, "_backend", LRUCache(maxsize=10, ttl=60))
+
+
+class TestResolvePrincipal:
+    async def test_second_request_is_served_from_cache(self) -> None:
+        session = _FakeSession()
+        for _ in range(3):
+            principal = await _resolve_principal({"sub": "u1", "ver": 0}, session)  # type: ignore[arg-type]
+            assert principal is not None and principal.displayName == "Ana"
+        assert session.queries == 1
+
+    async def test_inactive_user_is_rejected(self) -> None:
+        session = _FakeSession(isActive=False)
+        assert await _resolve_principal({"sub": "u1"}, session) is None  # type: ignore[arg-type]
+
+    async def test_token_older_than_version_is_rejected(self) -> None:
+        session = _FakeSession(tokenVersion=2)
+        assert await _resolve_principal({"sub": "u1", "ver": 1}, session) is None  # type: ignore[arg-type]
+
+    async def test_newer_token_refreshes_a_stale_entry(self) -> None:
+        session = _FakeSession()
+        await _resolve_principal({"sub": "u1", "ver": 0}, session)  # type: ignore[arg-type]
+        session.user.tokenVersion = 1  # bumped by another worker
+        principal = await _resolve_principal({"sub": "u1", "ver": 1}, session)  # type: ignore[arg-type]
+        assert principal is not None and principal.tokenVersion == 1
+        assert session.queries == 2
+
+    async def test_invalidation_forces_a_reload(self) -> None:
+        session = _FakeSession()
+        await _resolve_principal({"sub": "u1"}, session)  # type: ignore[arg-type]
+        session.user.isAdmin = True
+        principal_cache.invalidate_principal("u1")
+        principal = await _resolve_principal({"sub": "u1"}, session)  # type: ignore[arg-type]
+        assert principal is not None and principal.isAdmin
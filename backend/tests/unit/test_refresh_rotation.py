@@ -0,0 +1,79 @@
+"""Unit tests for explaining failed refresh-token rotations."""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.exceptions import InvalidTokenError, TokenRevokedError
+from app.services import auth_service as auth_service_module
+from app.services.auth_service import AuthService
+
+
+class _FakeTokens:
+    def __init__(self, stored: object) -> None:
+        self._stored = stored
+
+    async def get_by_hash(self, token_hash: str) -> object:
+        return self._stored
+
+
+@pytest.fixture(autouse=True)
+def revoked_families(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    revoked: list[str] = []
+
+    async def revoke_family(family_id: str) -> int:
+        revoked.append(family_id)
+        return 2
+
+    monkeypatch.setattr(auth_service_module, "_revoke_family", revoke_family)
+    return revoked
+
+
+def _token(*, rotated_ago: float | None = None, revoked: bool = False, expired: bool = False):
+    now = datetime.now(UTC)
+    return SimpleNamespace(
+        userId="u1",
+        familyId="f1",
+        expiresAt=now - timedelta(days=1) if expired else now + timedelta(days=1),
+        rotatedAt=None if rotated_ago is None else now - timedelta(seconds=rotated_ago),
+        revokedAt=now if revoked or rotated_ago is not None else None,
+    )
+
+
+def _service(stored: object) -> AuthService:
+    service = AuthService.__new__(AuthService)
+    service._tokens = _FakeTokens(stored)  # type: ignore[assignment]
+    return service
+
+
+class TestRejectRefresh:
+    async def test_reused_rotated_token_revokes_its_family(
+        self, revoked_families: list[str]
+    ) -> None:
+        service = _service(_token(rotated_ago=3600))
+        with pytest.raises(TokenRevokedError):
+            await service._reject_refresh("h")
+        assert revoked_families == ["f1"]
+
+    async def test_concurrent_refresh_within_grace_keeps_family(
+        self, revoked_families: list[str]
+    ) -> None:
+        service = _service(_token(rotated_ago=1))
+        with pytest.raises(TokenRevokedError):
+            await service._reject_refresh("h")
+        assert revoked_families == []
+
+    @pytest.mark.parametrize("stored", [None, _token(expired=True), _token(revoked=True)])
+    async def test_unknown_expired_or_logged_out(
+        self, stored: object, revoked_families: list[str]
+    ) -> None:
+        service = _service(stored)
+        with pytest.raises(TokenRevokedError):
+            await service._reject_refresh("h")
+        assert revoked_families == []
+
+    async def test_active_token_of_inactive_user(self) -> None:
+        service = _service(_token())
+        with pytest.raises(InvalidTokenError):
+            await service._reject_refresh("h")
@@ -0,0 +1,123 @@
+"""Unit tests for the background job scheduler."""
+
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.services import scheduler as scheduler_module
+from app.services.scheduler import Job, Scheduler
+
+
+class _FakeSession:
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+
+class _FakeJobRuns:
+    """In-memory ``job_runs`` shared by every scheduler ("worker") in a test."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.last_run: dict[str, float] = {}
+
+    async def claim(self, session: object, name: str, *, min_gap: float) -> bool:
+        last = self.last_run.get(name)
+        if last is not None and self.now - last < min_gap:
+            return False
+        self.last_run[name] = self.now
+        return True
+
+
+def _leadership(leader: bool):  # type: ignore[no-untyped-def]
+    @asynccontextmanager
+    async def acquire(job: Job):  # type: ignore[no-untyped-def]
+        yield leader
+
+    return acquire
+
+
+@pytest.fixture(autouse=True)
+def fake_sessions(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(scheduler_module, "unit_of_work", _FakeSession)
+
+
+@pytest.fixture(autouse=True)
+def job_runs(monkeypatch: pytest.MonkeyPatch) -> _FakeJobRuns:
+    runs = _FakeJobRuns()
+    monkeypatch.setattr(scheduler_module, "claim_job_run", runs.claim)
+    return runs
+
+
+class TestScheduler:
+    async def test_leader_runs_and_records_timing(self) -> None:
+        async def job(session: object) -> int:
+            return 7
+
+        scheduler = Scheduler(leadership=_leadership(True))
+        entry = scheduler.add("demo", job, interval=60)
+        await scheduler.run_once(entry)
+        stats = scheduler.stats()["demo"]
+        assert (stats["runs"], stats["lastResult"], stats["failures"]) == (1, 7, 0)
+        assert stats["lastDurationMs"] is not None
+
+    async def test_follower_skips(self) -> None:
+        async def job(session: object) -> int:
+            raise AssertionError("must not run without the lock")
+
+        scheduler = Scheduler(leadership=_leadership(False))
+        entry = scheduler.add("demo", job, interval=60)
+        await scheduler.run_once(entry)
+        assert entry.stats.skipped == 1 and entry.stats.runs == 0
+
+    async def test_second_worker_skips_a_period_already_run(self, job_runs: _FakeJobRuns) -> None:
+        calls = 0
+
+        async def job(session: object) -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        # Each worker takes the (free) lock in turn, as their timers fire
+        first = Scheduler(leadership=_leadership(True))
+        second = Scheduler(leadership=_leadership(True))
+        first_entry = first.add("demo", job, interval=60)
+        second_entry = second.add("demo", job, interval=60)
+
+        await first.run_once(first_entry)
+        job_runs.now = 50  # still within the period, even with jitter
+        await second.run_once(second_entry)
+        assert calls == 1
+        assert (second_entry.stats.runs, second_entry.stats.skipped) == (0, 1)
+
+        job_runs.now = 110
+        await second.run_once(second_entry)
+        assert calls == 2
+
+    async def test_failures_are_counted_not_raised(self) -> None:
+        async def job(session: object) -> int:
+            raise RuntimeError("boom")
+
+        scheduler = Scheduler(leadership=_leadership(True))
+        entry = scheduler.add("demo", job, interval=60)
+        await scheduler.run_once(entry)
+        assert entry.stats.failures == 1
+
+    def test_lock_keys_are_stable_and_distinct(self) -> None:
+        async def job(session: object) -> None:
+            return None
+
+        a, b = Job("a", 1, job), Job("b", 1, job)
+        assert a.lock_key == Job("a", 2, job).lock_key
+        assert a.lock_key != b.lock_key
+        assert -(2**63) <= a.lock_key < 2**63
+
+    def test_jitter_stays_within_bounds(self) -> None:
+        async def job(session: object) -> None:
+            return None
+
+        entry = Job("a", 100, job, jitter=0.1)
+        assert all(90 <= entry.next_delay() <= 110 for _ in range(100))
+        assert entry.min_gap == pytest.approx(90)
@@ -0,0 +1,14 @@
+"""Unit tests for search highlighting."""
+
+from app.repositories.search_repository import HIGHLIGHT_START, HIGHLIGHT_STOP
+from app.services.search_service import highlight_html
+
+
+class TestHighlightHtml:
+    def test_markers_become_mark_tags(self) -> None:
+        fragment = f"learn {HIGHLIGHT_START}python{HIGHLIGHT_STOP} today"
+        assert highlight_html(fragment) == "learn <mark>python</mark> today"
+
+    def test_post_markup_is_escaped(self) -> None:
+        fragment = f"<script>{HIGHLIGHT_START}x{HIGHLIGHT_STOP}</script>"
+        assert highlight_html(fragment) == "&lt;script&gt;<mark>x</mark>&lt;/script&gt;"
@@ -3,14 +3,17 @@
 import pytest
 from jose import JWTError
 
+from app.core.exceptions import ServiceBusyError
 from app.core.security import (
     create_access_token,
     decode_access_token,
     generate_refresh_token,
     hash_password,
     hash_refresh_token,
+    needs_rehash,
     verify_password,
 )
+from app.services.password_hasher import PasswordHasher
 
 
 class TestPasswordHashing:
@@ -32,6 +35,31 @@ class TestPasswordHashing:
         assert h1 != h2  # bcrypt uses random salt
 
 
+class TestRehash:
+    def test_hash_at_configured_cost_is_current(self) -> None:
+        assert needs_rehash(hash_password("pw")) is False
+
+    def test_hash_at_other_cost_needs_rehash(self) -> None:
+        assert needs_rehash(hash_password("pw", rounds=4)) is True
+
+
+class TestPasswordHasher:
+    async def test_hash_and_verify_off_loop(self) -> None:
+        hasher = PasswordHasher(workers=1, queue_limit=1)
+        hashed = await hasher.hash("pw")
+        assert await hasher.verify("pw", hashed) is True
+        assert hasher.stats()["admitted"] == 0
+        hasher.shutdown()
+
+    async def test_overload_is_refused(self) -> None:
+        hasher = PasswordHasher(workers=1, queue_limit=0)
+        hasher._admitted = 1  # the only slot is busy
+        with pytest.raises(ServiceBusyError):
+            await hasher.verify("pw", "$2b$04$invalid")
+        assert hasher.rejected == 1
+        hasher.shutdown()
+
+
 class TestJWT:
     def test_create_and_decode_token(self) -> None:
         token = create_access_token("user-1", "a@b.com", "Alice")
@@ -0,0 +1,47 @@
+"""Unit tests for tag-name parsing and the cached tag-name → ID lookup."""
+
+from types import SimpleNamespace
+
+from app.repositories import tag_repository
+from app.repositories.tag_repository import TagRepository
+from app.schemas.post import parse_tag_names
+
+
+class _FakeSession:
+    def __init__(self, tags: dict[str, str]) -> None:
+        self._tags = tags
+        self.queries = 0
+
+    async def execute(self, query):  # type: ignore[no-untyped-def]
+        self.queries += 1
+        names = query.whereclause.right.value
+        return [SimpleNamespace(name=n, id=self._tags[n]) for n in names if n in self._tags]
+
+
+class TestParseTagNames:
+    def test_splits_normalizes_and_dedupes(self) -> None:
+        assert parse_tag_names(" Python,rust ,,python", None, "Go") == ["python", "rust", "go"]
+
+    def test_empty_values(self) -> None:
+        assert parse_tag_names(None, "", " , ") == []
+
+
+class TestTagRepository:
+    async def test_known_names_are_served_from_cache(self, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+        monkeypatch.setattr(tag_repository, "_tag_ids", tag_repository.LRUCache(maxsize=10, ttl=60))
+        session = _FakeSession({"python": "t1", "rust": "t2"})
+        repo = TagRepository(session)  # type: ignore[arg-type]
+
+        found = await repo.ids_for_names(["python", "rust", "nope"])
+        assert found == {"python": "t1", "rust": "t2"}
+        assert await repo.ids_for_names(["rust", "python"]) == {"rust": "t2", "python": "t1"}
+        assert session.queries == 1
+
+    async def test_unknown_names_are_not_cached(self, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+        monkeypatch.setattr(tag_repository, "_tag_ids", tag_repository.LRUCache(maxsize=10, ttl=60))
+        session = _FakeSession({})
+        repo = TagRepository(session)  # type: ignore[arg-type]
+
+        await repo.ids_for_names(["new"])
+        await repo.ids_for_names(["new"])
+        assert session.queries == 2
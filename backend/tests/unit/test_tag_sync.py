@@ -0,0 +1,69 @@
+"""Unit tests for set-based tag synchronization in PostRepository."""
+
+from sqlalchemy.sql import Delete, Insert, Select
+
+from app.repositories.post_repository import PostRepository
+
+
+class _FakeTags:
+    def __init__(self, ids: dict[str, str]) -> None:
+        self._ids = ids
+        self.added: set[str] = set()
+        self.removed: set[str] = set()
+
+    async def ensure(self, names: list[str]) -> dict[str, str]:
+        return {name: self._ids[name] for name in names}
+
+    async def adjust_counts(self, *, added: set[str], removed: set[str]) -> None:
+        self.added |= added
+        self.removed |= removed
+
+
+class _Result:
+    def __init__(self, values: list[str]) -> None:
+        self._values = values
+
+    def scalars(self) -> "_Result":
+        return self
+
+    def all(self) -> list[str]:
+        return self._values
+
+
+class _FakeSession:
+    def __init__(self, linked: list[str]) -> None:
+        self._linked = linked
+        self.statements: list[object] = []
+
+    async def execute(self, statement):  # type: ignore[no-untyped-def]
+        self.statements.append(statement)
+        return _Result(self._linked)
+
+
+def _repo(linked: list[str]) -> tuple[PostRepository, _FakeSession, _FakeTags]:
+    session = _FakeSession(linked)
+    tags = _FakeTags({"a": "t1", "b": "t2", "c": "t3"})
+    repo = PostRepository(session)  # type: ignore[arg-type]
+    repo._tags = tags  # type: ignore[assignment]
+    return repo, session, tags
+
+
+class TestSyncTags:
+    async def test_unchanged_set_issues_no_writes(self) -> None:
+        repo, session, tags = _repo(["t1", "t2"])
+        assert await repo._sync_tags("p1", ["b", "a"]) is False
+        assert all(isinstance(s, Select) for s in session.statements)
+        assert not tags.added and not tags.removed
+
+    async def test_only_the_difference_is_written(self) -> None:
+        repo, session, tags = _repo(["t1", "t2"])
+        assert await repo._sync_tags("p1", ["a", "c"]) is True
+        assert (tags.added, tags.removed) == ({"t3"}, {"t2"})
+        delete_stmt, insert_stmt = session.statements[1:]
+        assert isinstance(delete_stmt, Delete)
+        assert isinstance(insert_stmt, Insert)
+
+    async def test_known_links_skip_the_lookup(self) -> None:
+        repo, session, _ = _repo([])
+        assert await repo._sync_tags("p1", ["a"], current=set()) is True
+        assert len(session.statements) == 1
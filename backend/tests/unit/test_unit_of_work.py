@@ -0,0 +1,66 @@
+"""Unit tests for the unit of work and its after-commit hooks."""
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.db.engine import close_engine, get_engine
+from app.db.unit_of_work import after_commit, unit_of_work
+
+
+def _session() -> Session:
+    session = Session(create_engine("sqlite://"))
+    session.execute(text("SELECT 1"))  # begin the outer transaction
+    return session
+
+
+class TestAfterCommit:
+    def test_runs_once_on_commit(self) -> None:
+        ran: list[str] = []
+        session = _session()
+        after_commit(session, lambda: ran.append("a"))  # type: ignore[arg-type]
+        assert ran == []
+        session.commit()
+        session.commit()
+        assert ran == ["a"]
+
+    def test_waits_for_the_outer_commit_past_a_savepoint(self) -> None:
+        ran: list[str] = []
+        session = _session()
+        with session.begin_nested():
+            after_commit(session, lambda: ran.append("a"))  # type: ignore[arg-type]
+        assert ran == []
+        session.commit()
+        assert ran == ["a"]
+
+    def test_dropped_on_rollback(self) -> None:
+        ran: list[str] = []
+        session = _session()
+        after_commit(session, lambda: ran.append("a"))  # type: ignore[arg-type]
+        session.rollback()
+        session.execute(text("SELECT 1"))
+        session.commit()
+        assert ran == []
+
+
+class TestUnitOfWork:
+    async def test_no_connection_until_first_statement(self) -> None:
+        # DATABASE_URL points nowhere: any checkout would fail
+        try:
+            async with unit_of_work() as session:
+                after_commit(session, lambda: None)
+            async with unit_of_work(read_only=True):
+                pass
+            assert get_engine().pool.checkedout() == 0  # type: ignore[attr-defined]
+        finally:
+            await close_engine()
+
+    async def test_read_only_unit_begins_read_only(self) -> None:
+        try:
+            async with unit_of_work(read_only=True) as session:
+                options = session.bind.get_execution_options()  # type: ignore[union-attr]
+                assert options.get("postgresql_readonly") is True
+            async with unit_of_work() as session:
+                options = session.bind.get_execution_options()  # type: ignore[union-attr]
+                assert "postgresql_readonly" not in options
+        finally:
+            await close_engine()
@@ -0,0 +1,36 @@
+"""Unit tests for the request-scoped viewer context."""
+
+from app.services.viewer_context import ViewerContext
+
+
+class _FakePostRepo:
+    def __init__(self, liked: set[str]) -> None:
+        self._liked = liked
+        self.calls: list[list[str]] = []
+
+    async def liked_post_ids(self, user_id: str, post_ids: list[str]) -> set[str]:
+        self.calls.append(post_ids)
+        return {pid for pid in post_ids if pid in self._liked}
+
+
+class TestViewerContext:
+    async def test_anonymous_viewer_never_queries(self) -> None:
+        repo = _FakePostRepo({"p1"})
+        viewer = ViewerContext(repo, None)  # type: ignore[arg-type]
+        assert await viewer.load_post_likes(["p1", "p2"]) == set()
+        assert repo.calls == []
+
+    async def test_batch_is_loaded_in_one_query(self) -> None:
+        repo = _FakePostRepo({"p1", "p3"})
+        viewer = ViewerContext(repo, "u1")  # type: ignore[arg-type]
+        assert await viewer.load_post_likes(["p1", "p2", "p3"]) == {"p1", "p3"}
+        assert repo.calls == [["p1", "p2", "p3"]]
+
+    async def test_known_ids_are_memoised(self) -> None:
+        repo = _FakePostRepo({"p1"})
+        viewer = ViewerContext(repo, "u1")  # type: ignore[arg-type]
+        await viewer.load_post_likes(["p1", "p2"])
+        assert await viewer.has_liked("p1") is True
+        assert await viewer.has_liked("p2") is False
+        await viewer.load_post_likes(["p2", "p4"])
+        assert repo.calls == [["p1", "p2"], ["p4"]]
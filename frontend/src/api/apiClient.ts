@@ -4,10 +4,13 @@ import type {
   ApiProject,
   ApiTag,
   CommentCreatePayload,
+  CommentPage,
   GenerateImagePayload,
   GenerateImageResponse,
   GeneratePromptPayload,
   GeneratePromptResponse,
+  LikedPostsResponse,
+  LikeStatusResponse,
   LoginPayload,
   PaginatedPosts,
   PaginatedProjects,
@@ -16,6 +19,7 @@ import type {
   ProjectCreatePayload,
   ProjectUpdatePayload,
   RegisterPayload,
+  SearchResponse,
   TagListResponse,
   TokenResponse,
 } from './types'
@@ -140,12 +144,24 @@ export const authApi = {
 // ─── Posts endpoints ──────────────────────────────────────────────────────────
 
 export const postsApi = {
-  getAll: (params?: { q?: string; uid?: string; page?: number; size?: number }) => {
+  getAll: (params?: {
+    q?: string
+    /** posts carrying `all` (default) or `any` of these tags */
+    tags?: string[]
+    match?: 'all' | 'any'
+    uid?: string
+    page?: number
+    size?: number
+    cursor?: string
+  }) => {
     const qs = new URLSearchParams()
     if (params?.q) qs.set('q', params.q)
+    if (params?.tags?.length) qs.set('tags', params.tags.join(','))
+    if (params?.match) qs.set('match', params.match)
     if (params?.uid) qs.set('uid', params.uid)
     if (params?.page) qs.set('page', String(params.page))
     if (params?.size) qs.set('size', String(params.size))
+    if (params?.cursor) qs.set('cursor', params.cursor)
     const query = qs.toString() ? `?${qs.toString()}` : ''
     return request<PaginatedPosts>(`/posts${query}`)
   },
@@ -167,17 +183,49 @@ export const postsApi = {
   delete: (id: string): Promise<void> =>
     request<void>(`/posts/${id}`, { method: 'DELETE' }),
 
-  like: (id: string): Promise<void> =>
-    request<void>(`/posts/${id}/like`, { method: 'POST' }),
+  like: (id: string): Promise<LikeStatusResponse> =>
+    request<LikeStatusResponse>(`/posts/${id}/like`, { method: 'POST' }),
 
-  unlike: (id: string): Promise<void> =>
-    request<void>(`/posts/${id}/like`, { method: 'DELETE' }),
+  unlike: (id: string): Promise<LikeStatusResponse> =>
+    request<LikeStatusResponse>(`/posts/${id}/like`, { method: 'DELETE' }),
+
+  likedByMe: (ids: string[]): Promise<string[]> =>
+    request<LikedPostsResponse>(
+      `/me/likes?${new URLSearchParams(ids.map((id) => ['postIds', id]))}`
+    ).then((r) => r.likedPostIds),
+}
+
+// ─── Search endpoints ─────────────────────────────────────────────────────────
+
+export const searchApi = {
+  search: (params: { q: string; tags?: string[]; page?: number; size?: number }) => {
+    const qs = new URLSearchParams({ q: params.q })
+    if (params.tags?.length) qs.set('tags', params.tags.join(','))
+    if (params.page) qs.set('page', String(params.page))
+    if (params.size) qs.set('size', String(params.size))
+    return request<SearchResponse>(`/search?${qs.toString()}`)
+  },
 }
 
 // ─── Comments endpoints ───────────────────────────────────────────────────────
 
 export const commentsApi = {
-  getByPost: (postId: string) => request<ApiComment[]>(`/posts/${postId}/comments`),
+  /**
+   * A page of top-level comments — or, with `parentId`, of that comment's
+   * replies ("load more replies"). Each item previews its first replies.
+   */
+  getByPost: (
+    postId: string,
+    params?: { parentId?: string; cursor?: string; limit?: number; depth?: number }
+  ) => {
+    const qs = new URLSearchParams()
+    if (params?.parentId) qs.set('parentId', params.parentId)
+    if (params?.cursor) qs.set('cursor', params.cursor)
+    if (params?.limit) qs.set('limit', String(params.limit))
+    if (params?.depth) qs.set('depth', String(params.depth))
+    const query = qs.toString() ? `?${qs.toString()}` : ''
+    return request<CommentPage>(`/posts/${postId}/comments${query}`)
+  },
 
   create: (postId: string, payload: CommentCreatePayload) =>
     request<ApiComment>(`/posts/${postId}/comments`, {
@@ -192,8 +240,26 @@ export const commentsApi = {
 // ─── Tags endpoints ───────────────────────────────────────────────────────────
 
 export const tagsApi = {
-  getAll: (): Promise<ApiTag[]> =>
-    request<TagListResponse>('/tags').then((r) => r.tags),
+  getAll: (params?: {
+    limit?: number
+    sort?: 'count' | 'name'
+    minCount?: number
+  }): Promise<ApiTag[]> => tagsApi.getPage(params).then((r) => r.tags),
+
+  getPage: (params?: {
+    limit?: number
+    sort?: 'count' | 'name'
+    minCount?: number
+    cursor?: string
+  }) => {
+    const qs = new URLSearchParams()
+    if (params?.limit) qs.set('limit', String(params.limit))
+    if (params?.sort) qs.set('sort', params.sort)
+    if (params?.minCount !== undefined) qs.set('minCount', String(params.minCount))
+    if (params?.cursor) qs.set('cursor', params.cursor)
+    const query = qs.toString() ? `?${qs.toString()}` : ''
+    return request<TagListResponse>(`/tags${query}`)
+  },
 }
 
 // ─── Projects endpoints ───────────────────────────────────────────────────────
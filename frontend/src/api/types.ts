@@ -28,13 +28,26 @@ export interface TokenResponse {
   user: ApiUser
 }
 
+// ─── Images ───────────────────────────────────────────────────────────────────
+
+/** one srcset entry: `<source type="image/{format}" srcset="{url} {width}w">` */
+export interface ApiImageVariant {
+  url: string
+  width: number
+  format: 'avif' | 'webp'
+}
+
 // ─── Posts ────────────────────────────────────────────────────────────────────
 
 export interface ApiPost {
   id: string
   title: string
+  /** absolute URL — stored uploads resolve to `/images/{imageRef}` */
   image: string
-  image_data?: string
+  imageRef?: string | null
+  imageVariants?: ApiImageVariant[]
+  /** tiny blurred `data:` URI to show while the image loads */
+  imagePlaceholder?: string | null
   body: string
   tags: string[]
   /** author's user ID — mapped to `uid` for backwards compatibility */
@@ -47,6 +60,51 @@ export interface ApiPost {
   likedByMe: boolean
 }
 
+/** Card-view shape returned by `GET /posts?view=summary` */
+export interface ApiPostSummary {
+  id: string
+  title: string
+  image: string
+  imageRef?: string | null
+  imageVariants?: ApiImageVariant[]
+  imagePlaceholder?: string | null
+  excerpt: string
+  tags: string[]
+  uid: string
+  createdBy: string
+  createdAt: string
+  likeCount: number
+  commentCount: number
+  likedByMe: boolean
+}
+
+// ─── Search ───────────────────────────────────────────────────────────────────
+
+/** A `GET /search` match: card-view post plus relevance and highlights */
+export interface ApiSearchHit extends ApiPostSummary {
+  rank: number
+  /** HTML-escaped title with matched terms wrapped in `<mark>` */
+  titleHighlight: string
+  /** HTML-escaped best-matching body fragments with `<mark>` highlights */
+  snippet: string
+}
+
+export interface ApiTagFacet {
+  name: string
+  /** number of matching posts carrying this tag */
+  count: number
+}
+
+export interface SearchResponse {
+  items: ApiSearchHit[]
+  total: number | null
+  page: number
+  size: number
+  pages: number | null
+  query: string
+  facets: ApiTagFacet[]
+}
+
 export interface PostCreatePayload {
   title: string
   image: string
@@ -63,12 +121,25 @@ export interface PostUpdatePayload {
   tags?: string[]
 }
 
+/** like state right after `POST`/`DELETE /posts/{id}/like` */
+export interface LikeStatusResponse {
+  likeCount: number
+  likedByMe: boolean
+}
+
+export interface LikedPostsResponse {
+  likedPostIds: string[]
+}
+
 export interface PaginatedPosts {
   items: ApiPost[]
-  total: number
+  /** null when requested with `withTotal=false` */
+  total: number | null
   page: number
   size: number
-  pages: number
+  pages: number | null
+  /** opaque token for the next page — pass back as `cursor` */
+  nextCursor?: string | null
 }
 
 // ─── Comments ─────────────────────────────────────────────────────────────────
@@ -82,6 +153,14 @@ export interface ApiComment {
   parentId: string | null
   createdAt: string
   replyCount: number
+  /** preview of the first replies, nested down to the requested `depth` */
+  replies?: ApiComment[]
+}
+
+export interface CommentPage {
+  items: ApiComment[]
+  /** opaque token for the next page — pass back as `cursor` */
+  nextCursor: string | null
 }
 
 export interface CommentCreatePayload {
@@ -98,6 +177,8 @@ export interface ApiTag {
 
 export interface TagListResponse {
   tags: ApiTag[]
+  /** opaque token for the next page — pass back as `cursor` */
+  nextCursor?: string | null
 }
 
 // ─── Projects ─────────────────────────────────────────────────────────────────
@@ -120,8 +201,12 @@ export interface ApiProject {
   category: string
   url: string
   githubUrl: string | null
+  /** absolute URL — stored uploads resolve to `/images/{imageRef}` */
   image: string
-  image_data?: string
+  imageRef?: string | null
+  imageVariants?: ApiImageVariant[]
+  /** tiny blurred `data:` URI to show while the image loads */
+  imagePlaceholder?: string | null
   tags: string[]
   techStack: TechStackItem[]
   stats: StatItem[]
@@ -2,11 +2,15 @@ import React from 'react'
 import { Link } from 'react-router-dom'
 import { BiRightArrowAlt } from 'react-icons/bi'
 
+import type { ApiImageVariant } from '@/api/types'
+import StoredImage from '@/components/StoredImage'
+
 interface Post {
   id: string
   title: string
   image: string
-  image_data?: string
+  imageVariants?: ApiImageVariant[]
+  imagePlaceholder?: string | null
   createdBy: string
   tags: string[]
   body: string
@@ -22,8 +26,11 @@ const PostDetail: React.FC<Props> = ({ post }) => {
       <article className="card-ed card-gold-top h-full flex flex-col overflow-hidden">
         {/* Image */}
         <div className="overflow-hidden aspect-video bg-ed-elevated">
-          <img
-            src={post.image_data ? `data:image/png;base64,${post.image_data}` : post.image}
+          <StoredImage
+            src={post.image}
+            variants={post.imageVariants}
+            placeholder={post.imagePlaceholder}
+            sizes="(min-width: 1024px) 33vw, (min-width: 768px) 50vw, 100vw"
             alt={post.title}
             className="w-full h-full object-cover transition-transform duration-500 group-hover:scale-105"
             onError={(e) => {
@@ -0,0 +1,56 @@
+import React from 'react'
+
+import type { ApiImageVariant } from '@/api/types'
+
+interface Props extends React.ImgHTMLAttributes<HTMLImageElement> {
+  src: string
+  variants?: ApiImageVariant[]
+  /** tiny blurred `data:` URI shown until the image itself has loaded */
+  placeholder?: string | null
+  /** the `sizes` hint for the variants' srcset */
+  sizes?: string
+}
+
+const FORMATS: ApiImageVariant['format'][] = ['avif', 'webp']
+
+/**
+ * An image served by the API's image store: the AVIF/WebP derivatives are
+ * offered as `<source>`s (browser picks the best format and width) and the
+ * original `src` is the fallback.
+ */
+const StoredImage: React.FC<Props> = ({
+  src,
+  variants = [],
+  placeholder,
+  sizes = '100vw',
+  style,
+  ...imgProps
+}) => (
+  <picture>
+    {FORMATS.map((format) => {
+      const matching = variants.filter((v) => v.format === format)
+      if (matching.length === 0) return null
+      return (
+        <source
+          key={format}
+          type={`image/${format}`}
+          srcSet={matching.map((v) => `${v.url} ${v.width}w`).join(', ')}
+          sizes={sizes}
+        />
+      )
+    })}
+    <img
+      src={src}
+      loading="lazy"
+      decoding="async"
+      style={
+        placeholder
+          ? { backgroundImage: `url(${placeholder})`, backgroundSize: 'cover', ...style }
+          : style
+      }
+      {...imgProps}
+    />
+  </picture>
+)
+
+export default StoredImage
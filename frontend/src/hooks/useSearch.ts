@@ -1,8 +1,53 @@
-import { useMemo } from 'react'
+import { useEffect, useMemo, useState } from 'react'
 import { useLocation } from 'react-router-dom'
 
+import { searchApi } from '@/api/apiClient'
+import type { SearchResponse } from '@/api/types'
+
 export function useQuery() {
   const { search } = useLocation()
 
   return useMemo(() => new URLSearchParams(search), [search])
 }
+
+/**
+ * Runs a full-text search against `GET /search`.
+ *
+ * Results are ranked by relevance and carry highlighted snippets and the tag
+ * facets of the whole result set. `tags` is a comma-separated list every
+ * result must carry.
+ */
+export const useSearchPosts = (q: string | null, tags: string | null = null) => {
+  const [result, setResult] = useState<SearchResponse>()
+  const [error, setError] = useState<string>()
+  const [loading, setLoading] = useState<boolean>(true)
+
+  useEffect(() => {
+    setError(undefined)
+    if (!q) {
+      setResult(undefined)
+      setLoading(false)
+      return
+    }
+    let cancelled = false
+
+    const load = async () => {
+      setLoading(true)
+      try {
+        const data = await searchApi.search({ q, tags: tags?.split(',') })
+        if (!cancelled) setResult(data)
+      } catch (err: any) {
+        if (!cancelled) setError(err.message ?? 'Failed to search posts')
+      } finally {
+        if (!cancelled) setLoading(false)
+      }
+    }
+
+    load()
+    return () => {
+      cancelled = true
+    }
+  }, [q, tags])
+
+  return { result, loading, error }
+}
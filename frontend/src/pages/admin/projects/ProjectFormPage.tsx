@@ -66,7 +66,6 @@ const ProjectFormPage: React.FC = () => {
         setUrl(project.url)
         setGithubUrl(project.githubUrl ?? '')
         setImage(project.image ?? '')
-        setImageData(project.image_data ?? '')
         setTags(project.tags)
         setTechStack(project.techStack as TechStackItem[])
         setStats(project.stats as StatItem[])
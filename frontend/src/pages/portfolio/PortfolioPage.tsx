@@ -4,6 +4,7 @@ import { BiLinkExternal, BiLogoGithub } from 'react-icons/bi'
 
 import { projectsApi } from '@/api/apiClient'
 import type { ApiProject } from '@/api/types'
+import StoredImage from '@/components/StoredImage'
 import { useAuthValue } from '@/context/AuthContext'
 
 const CATEGORIES = ['Todos', 'web-app', 'corporate', 'saas', 'analytics', 'other']
@@ -31,8 +32,11 @@ const ProjectCard: React.FC<{ project: ApiProject }> = ({ project }) => (
   <Link to={`/portfolio/${project.slug}`} className="group block h-full">
     <article className="card-ed overflow-hidden h-full flex flex-col">
       <div className="overflow-hidden aspect-video bg-ed-elevated relative">
-        <img
-          src={project.image_data ? `data:image/png;base64,${project.image_data}` : project.image}
+        <StoredImage
+          src={project.image}
+          variants={project.imageVariants}
+          placeholder={project.imagePlaceholder}
+          sizes="(min-width: 1024px) 33vw, (min-width: 768px) 50vw, 100vw"
           alt={project.title}
           className="w-full h-full object-cover transition-transform duration-500 group-hover:scale-105"
           onError={(e) => {
@@ -5,6 +5,7 @@ import ReactMarkdown from 'react-markdown'
 import remarkGfm from 'remark-gfm'
 
 import { postsApi } from '@/api/apiClient'
+import StoredImage from '@/components/StoredImage'
 import { useAuthValue } from '@/context/AuthContext'
 import { useFetchDocument } from '../../hooks/useFetchDocument'
 
@@ -124,11 +125,14 @@ const Post: React.FC = () => {
       </div>
 
       {/* Featured image */}
-      {(post.image_data || post.image) && (
+      {post.image && (
         <div className="border-b border-ed-border">
           <div className="page-wrapper py-6 max-w-3xl">
-            <img
-              src={post.image_data ? `data:image/png;base64,${post.image_data}` : post.image}
+            <StoredImage
+              src={post.image}
+              variants={post.imageVariants}
+              placeholder={post.imagePlaceholder}
+              sizes="(min-width: 768px) 768px, 100vw"
               alt={post.title}
               className="w-full rounded-sm border border-ed-border"
               onError={(e) => { (e.target as HTMLImageElement).style.display = 'none' }}
@@ -30,7 +30,6 @@ const FormEditPost: React.FC = () => {
     if (post) {
       setTitle(post.title ?? '')
       setImage(post.image ?? '')
-      setImageData(post.image_data ?? '')
       setBody(post.body ?? '')
       setTags(Array.isArray(post.tags) ? post.tags : [])
     }
@@ -3,14 +3,15 @@ import { Link } from 'react-router-dom'
 import { BiArrowBack, BiSearchAlt2 } from 'react-icons/bi'
 
 import PostDetail from '@/components/PostDetail'
-import { useFetchDocuments } from '@/hooks/useFetchDocuments'
-import { useQuery } from '@/hooks/useSearch'
+import { useQuery, useSearchPosts } from '@/hooks/useSearch'
 
 const Search: React.FC = () => {
   const query = useQuery()
   const search = query.get('q')
 
-  const { documents: posts, loading } = useFetchDocuments('posts', search)
+  const { result, loading } = useSearchPosts(search)
+  const posts = result?.items
+  const total = result?.total ?? posts?.length ?? 0
 
   return (
     <div className="bg-ed-bg">
@@ -73,7 +74,7 @@ const Search: React.FC = () => {
         {!loading && posts && posts.length > 0 && (
           <>
             <p className="section-label mb-6">
-              {posts.length} {posts.length === 1 ? 'resultado' : 'resultados'}
+              {total} {total === 1 ? 'resultado' : 'resultados'}
             </p>
             <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-5">
               {posts.map((post, i) => (
@@ -82,7 +83,7 @@ const Search: React.FC = () => {
                   className="animate-fade-up"
                   style={{ animationDelay: `${i * 80}ms` }}
                 >
-                  <PostDetail post={post} />
+                  <PostDetail post={{ ...post, body: post.excerpt }} />
                 </div>
               ))}
             </div>